@@ -0,0 +1,57 @@
+"""
+Encoding a room broadcast to 500 members into one batch request.
+
+before: one payload built and serialized per recipient (`build_payload` +
+        `encode_batch_entry`).
+after:  shared payload serialized once, recipient fields spliced in
+        (`encode_fanout_entries`, used by `MessageService.broadcast`).
+
+Run: python benchmarks/bench_fanout.py
+"""
+
+import time
+import timeit
+
+import _bootstrap  # noqa: F401
+from _bootstrap import report
+
+from synccast.api.message import MessageService
+from synccast.core.batching import encode_batch, encode_batch_entry, encode_fanout_entries
+from synccast.core.registry import scope_registry, _ScopeEntry
+from synccast.core.topic import SyncCastTopicTemplate
+
+
+class _Scope:
+    name = "chat"
+
+
+scope_registry._ttl = float("inf")
+scope_registry._entries = {"chat": _ScopeEntry(_Scope(), frozenset({"message"}))}
+scope_registry._loaded_at = time.monotonic()
+
+ROUNDS = 50
+MEMBERS = [str(i) for i in range(500)]
+DATA = {"text": "hello " * 20, "room": 7, "mentions": [1, 2, 3], "attachments": []}
+service = MessageService(dispatcher=None, app_id="app")
+
+
+def before():
+    template = SyncCastTopicTemplate("app", "chat", "message", ["room", 7])
+    return encode_batch(
+        encode_batch_entry(
+            service.endpoint,
+            service.build_payload(user_id=user_id, data=DATA, topic=template.render(user_id)),
+        )
+        for user_id in MEMBERS
+    )
+
+
+def after():
+    shared, recipients = service._fanout(room=7, data=DATA, recipients=MEMBERS)
+    return encode_batch(encode_fanout_entries(service.endpoint, shared, recipients))
+
+
+if __name__ == "__main__":
+    count = len(MEMBERS) * ROUNDS
+    report("before: build + serialize per recipient", timeit.timeit(before, number=ROUNDS), count)
+    report("after:  serialize once, splice recipients", timeit.timeit(after, number=ROUNDS), count)
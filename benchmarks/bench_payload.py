@@ -0,0 +1,89 @@
+"""
+Per-event cost of building a typing payload.
+
+before: `SyncCastPayloadBuilder(...).set_scope().set_topic().set_data().build()`.
+after:  `get_payload_skeleton(...).make(topic, data, user_id)` (the
+        `publish_fast` path).
+
+Allocations are counted in memory blocks per event, from a tracemalloc
+snapshot taken while a batch of built events is kept alive. The builder is
+kept alive with its payload, so its own allocations (the builder object and
+its instance dict) are counted rather than freed before the snapshot.
+
+Run: python benchmarks/bench_payload.py
+"""
+
+import timeit
+import tracemalloc
+
+import _bootstrap  # noqa: F401
+from _bootstrap import report
+
+from synccast.core.payload import SyncCastPayloadBuilder, get_payload_skeleton
+from synccast.core.enums import SyncCastEventType, SyncCastPriorityLevel, SyncCastQosLevel
+
+N = 200_000
+TOPIC = "app/chat/typing/room/7/user/42"
+DATA = {"typing": True}
+
+
+def builder():
+    return (
+        SyncCastPayloadBuilder(
+            user="42",
+            type=SyncCastEventType.USER_TYPING,
+            priority=SyncCastPriorityLevel.LOW,
+            qos=SyncCastQosLevel.FIRE_AND_FORGET,
+        )
+        .set_scope("chat")
+        .set_topic(TOPIC)
+        .set_data(DATA)
+    )
+
+
+def before():
+    return builder().build()
+
+
+def before_kept():
+    kept = builder()
+    return kept, kept.build()
+
+
+skeleton = get_payload_skeleton(
+    SyncCastEventType.USER_TYPING, SyncCastPriorityLevel.LOW, SyncCastQosLevel.FIRE_AND_FORGET, "chat"
+)
+
+
+def after():
+    return skeleton.make(TOPIC, DATA, "42")
+
+
+def after_kept():
+    return None, after()
+
+
+def allocations(build, count: int = 10_000) -> str:
+    kept = [None] * count
+    build()  # warm caches
+    tracemalloc.start()
+    for i in range(count):
+        kept[i] = build()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return f"{blocks / count:6.1f} blocks/event"
+
+
+def without_event_id(payload):
+    return {key: value for key, value in payload.items() if key != "event_id"}  # Random per event
+
+
+if __name__ == "__main__":
+    assert without_event_id(before()) == without_event_id(after())
+    for label, build, kept in (
+        ("before: payload builder", before, before_kept),
+        ("after:  payload skeleton", after, after_kept),
+    ):
+        report(label, timeit.timeit(build, number=N), N)
+        print(f"{'':<48} {allocations(kept)}")
@@ -0,0 +1,56 @@
+"""
+Serialization cost per event on the dispatcher's POST path.
+
+before: `requests` re-encodes the `json=` dict with the stdlib encoder and
+        `_log_request` formats the whole kwargs dict into an f-string.
+after:  the dispatcher's serializer encodes the payload once to bytes and
+        debug logging is only formatted when enabled.
+
+Run: python benchmarks/bench_serialization.py
+"""
+
+import timeit
+
+import _bootstrap  # noqa: F401
+from _bootstrap import report
+
+from requests.compat import json as complexjson
+
+from synccast.core.dispatcher import SyncCastDispatcher
+from synccast.core.payload import SyncCastPayloadBuilder
+from synccast.core.enums import SyncCastEventType
+from synccast.core.serializers import orjson
+
+N = 50_000
+URL = "https://synccast.example.com/api/chat/messages/"
+
+payload = (
+    SyncCastPayloadBuilder(user="42", type=SyncCastEventType.CHAT_MESSAGE)
+    .set_scope("chat")
+    .set_topic("app/chat/message/room/7/user/42")
+    .set_data({"text": "hello " * 20, "room": 7, "mentions": [1, 2, 3], "attachments": []})
+    .set_sender_info("42", "Ada", "member")
+    .set_metadata("web", "desktop", "eu")
+    .build()
+)
+
+
+def before():
+    kwargs = {"json": payload}
+    f"[SyncCastDispatcher] POST {URL} | kwargs={kwargs}"
+    body = complexjson.dumps(kwargs["json"], allow_nan=False)
+    body.encode("utf-8")
+
+
+def after(dispatcher):
+    def run():
+        kwargs = dispatcher._prepare_body("/api/chat/messages/", {"json": payload})
+        dispatcher._log_request("post", URL, **kwargs)
+    return run
+
+
+if __name__ == "__main__":
+    report("before: requests json= + eager log f-string", timeit.timeit(before, number=N), N)
+    report("after:  stdlib serializer, lazy log", timeit.timeit(after(SyncCastDispatcher(serializer="json")), number=N), N)
+    if orjson is not None:
+        report("after:  orjson serializer, lazy log", timeit.timeit(after(SyncCastDispatcher(serializer="orjson")), number=N), N)
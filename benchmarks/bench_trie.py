@@ -0,0 +1,60 @@
+"""
+Matching one published topic against N subscription/ACL filters.
+
+before: linear scan, splitting every filter and comparing level by level.
+after:  `SyncCastTopicTrie.match()`.
+
+Run: python benchmarks/bench_trie.py
+"""
+
+import timeit
+
+import _bootstrap  # noqa: F401
+
+from synccast.core.trie import SyncCastTopicTrie
+
+LOOKUPS = 200
+
+
+def naive_match(topic_filter: str, topic: str) -> bool:
+    filter_levels, topic_levels = topic_filter.split("/"), topic.split("/")
+    for index, level in enumerate(filter_levels):
+        if level == "#":
+            return True
+        if index >= len(topic_levels) or (level != "+" and level != topic_levels[index]):
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+def make_filters(count: int):
+    filters = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            filters.append(f"app/chat/message/room/{i}/user/+")
+        elif kind == 1:
+            filters.append(f"app/chat/typing/room/{i}/#")
+        elif kind == 2:
+            filters.append(f"app/ui/sync/board/{i}")
+        else:
+            filters.append(f"app/+/presence/user/{i}")
+    return filters
+
+
+def run(count: int) -> None:
+    filters = make_filters(count)
+    topics = [f"app/chat/message/room/{i * 4}/user/{i}" for i in range(LOOKUPS)]
+    trie = SyncCastTopicTrie(filters)
+
+    for topic in topics[:5]:
+        assert sorted(trie.match(topic)) == sorted(f for f in filters if naive_match(f, topic))
+
+    scan = timeit.timeit(lambda: [[f for f in filters if naive_match(f, t)] for t in topics], number=1)
+    indexed = timeit.timeit(lambda: [trie.match(t) for t in topics], number=1)
+    print(f"{count:>7} filters  naive scan {scan / LOOKUPS * 1e6:12.2f} us/topic"
+          f"   trie {indexed / LOOKUPS * 1e6:8.2f} us/topic")
+
+
+if __name__ == "__main__":
+    for size in (10_000, 100_000):
+        run(size)
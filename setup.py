@@ -23,6 +23,10 @@ setup(
         "pytest",
         "pytest-django"
     ],
+    extras_require={
+        "async": ["httpx>=0.23"],
+        "mqtt": ["paho-mqtt>=1.6"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Framework :: Django",
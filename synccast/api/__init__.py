@@ -23,11 +23,23 @@ from .notification import NotificationService # Notifications: in-app, system, M
 from .presence import PresenceService # Presence: user online/offline/away tracking
 from .stream import StreamService # Stream: real-time UI sync between active clients
 from .typing import TypingService # Typing: real-time typing indicator events
+from .aio import ( # Awaitable variants for asyncio / ASGI callers
+    AsyncMessageService,
+    AsyncNotificationService,
+    AsyncPresenceService,
+    AsyncStreamService,
+    AsyncTypingService,
+)
 
 __all__ = [
     "MessageService",
     "NotificationService",
     "PresenceService",
     "StreamService",
-    "TypingService"
+    "TypingService",
+    "AsyncMessageService",
+    "AsyncNotificationService",
+    "AsyncPresenceService",
+    "AsyncStreamService",
+    "AsyncTypingService",
 ]
\ No newline at end of file
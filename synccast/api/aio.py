@@ -0,0 +1,373 @@
+# synccast/api/aio.py
+
+"""
+Awaitable variants of the SyncCast services.
+
+Each class reuses the payload assembly of its synchronous counterpart and
+awaits an `AsyncSyncCastDispatcher`, so async views can `asyncio.gather`
+many publishes on a single event loop.
+"""
+
+# Default package imports
+import time
+import asyncio
+from typing import Optional, Dict, Any, Union, Iterable, List
+
+# SyncCast abstract model
+from synccast.models import AbstractSyncCastScope
+
+# SyncCast enums
+from synccast.core.enums import SyncCastPriorityLevel, SyncCastQosLevel
+
+# SyncCast topic templates
+from synccast.core.topic import SyncCastTopicTemplate
+
+# SyncCast bulk sending helpers
+from synccast.core.bulk import SyncCastBulkResult, SyncCastRatePacer, iter_chunks
+
+# SyncCast services
+from synccast.api.message import MessageService
+from synccast.api.notification import NotificationService
+from synccast.api.presence import PresenceService
+from synccast.api.stream import StreamService
+from synccast.api.typing import TypingService
+
+
+class AsyncMessageService(MessageService):
+    """
+    Awaitable MessageService: `send_message` and `broadcast` must be awaited.
+    """
+
+    async def send_message(
+        self,
+        *,
+        user_id: str,
+        data: Dict[str, Any],
+        scope: Union[str, AbstractSyncCastScope] = "chat",
+        topic: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        platform: Optional[str] = None,
+        device: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
+    ) -> dict:
+
+        return await self._apublish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
+
+    async def broadcast(
+        self,
+        room: Any,
+        data: Dict[str, Any],
+        *,
+        recipients: Iterable[Union[int, str]],
+        channel: str = "message",
+        scope: Union[str, AbstractSyncCastScope] = "chat",
+        sender_id: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+    ) -> Any:
+
+        return await self._abroadcast(
+            room=room,
+            data=data,
+            recipients=recipients,
+            channel=channel,
+            scope=scope,
+            sender_id=sender_id,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            priority=priority,
+            qos=qos,
+        )
+
+
+class AsyncNotificationService(NotificationService):
+    """
+    Awaitable NotificationService: `send_notification`, `broadcast` and
+    `send_bulk` must be awaited.
+    """
+
+    async def send_notification(
+        self,
+        *,
+        user_id: Optional[str],
+        data: Dict[str, Any],
+        scope: Union[str, AbstractSyncCastScope] = "system",
+        topic: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        platform: Optional[str] = None,
+        device: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
+    ) -> dict:
+
+        return await self._apublish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
+
+    async def broadcast(
+        self,
+        room: Any,
+        data: Dict[str, Any],
+        *,
+        recipients: Iterable[Union[int, str]],
+        channel: str = "notification",
+        scope: Union[str, AbstractSyncCastScope] = "system",
+        sender_id: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+    ) -> Any:
+
+        return await self._abroadcast(
+            room=room,
+            data=data,
+            recipients=recipients,
+            channel=channel,
+            scope=scope,
+            sender_id=sender_id,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            priority=priority,
+            qos=qos,
+        )
+
+
+    async def send_bulk(
+        self,
+        user_ids: Iterable[Union[int, str]],
+        data: Dict[str, Any],
+        *,
+        channel: str = "notification",
+        scope: Union[str, AbstractSyncCastScope] = "system",
+        template: Optional[SyncCastTopicTemplate] = None,
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+        sender_id: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+    ) -> SyncCastBulkResult:
+        """
+        Awaitable `NotificationService.send_bulk`: chunks are awaited on the
+        event loop, at most `concurrency` at a time, instead of on threads.
+        """
+        shared, template = self._bulk_payload(
+            data,
+            channel=channel,
+            scope=scope,
+            template=template,
+            sender_id=sender_id,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            priority=priority,
+            qos=qos,
+        )
+
+        pacer = SyncCastRatePacer(rate_limit) if rate_limit else None
+        result = SyncCastBulkResult()
+        started = time.monotonic()
+
+        slots = asyncio.Semaphore(concurrency)
+        in_flight = set()
+
+        async def send(index: int, chunk: List[Union[int, str]]) -> None:
+            try:
+                await self._asend_chunk(index, chunk, shared, template, pacer, result)
+            finally:
+                slots.release()
+
+        for index, chunk in enumerate(iter_chunks(user_ids, chunk_size)):
+            await slots.acquire()  # Bounded read-ahead keeps memory constant
+            task = asyncio.ensure_future(send(index, chunk))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+        result.elapsed = time.monotonic() - started
+        return result
+
+    async def _asend_chunk(
+        self,
+        index: int,
+        chunk: List[Union[int, str]],
+        shared: Dict[str, Any],
+        template: SyncCastTopicTemplate,
+        pacer: Optional[SyncCastRatePacer],
+        result: SyncCastBulkResult,
+    ) -> None:
+        user_ids = [str(user_id) for user_id in chunk]
+        if pacer is not None:
+            wait = pacer.reserve(len(user_ids))
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        started = time.perf_counter()
+        try:
+            recipients = list(zip(user_ids, template.render_many(user_ids)))
+            response = await self._apost_fanout(shared, recipients, return_exceptions=True)
+            failed, spooled = self._recipient_outcomes(user_ids, response)
+        except Exception as e:
+            result.record(index, len(user_ids), user_ids, time.perf_counter() - started, str(e))
+            return
+        result.record(index, len(user_ids), failed, time.perf_counter() - started, spooled=len(spooled))
+
+
+class AsyncPresenceService(PresenceService):
+    """
+    Awaitable PresenceService: `send_presence` must be awaited.
+    """
+
+    async def send_presence(
+        self,
+        *,
+        user_id: str,
+        data: Dict[str, Any],
+        scope: Union[str, AbstractSyncCastScope] = "chat",
+        topic: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        platform: Optional[str] = None,
+        device: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
+    ) -> dict:
+
+        return await self._apublish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
+
+
+class AsyncStreamService(StreamService):
+    """
+    Awaitable StreamService: `send_update` must be awaited.
+    """
+
+    async def send_update(
+        self,
+        *,
+        user_id: str,
+        data: Dict[str, Any],
+        scope: Union[str, AbstractSyncCastScope] = "ui",
+        topic: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        platform: Optional[str] = None,
+        device: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
+    ) -> dict:
+
+        return await self._apublish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
+
+
+class AsyncTypingService(TypingService):
+    """
+    Awaitable TypingService: `send_typing` must be awaited.
+    """
+
+    async def send_typing(
+        self,
+        *,
+        user_id: str,
+        data: Dict[str, Any],
+        scope: Union[str, AbstractSyncCastScope] = "chat",
+        topic: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        platform: Optional[str] = None,
+        device: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
+    ) -> dict:
+
+        return await self._apublish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
@@ -0,0 +1,331 @@
+# Default package imports
+import asyncio
+from typing import Optional, Dict, Any, Union, Iterable, List, Tuple
+
+# SyncCast abstract model
+from synccast.models import AbstractSyncCastScope
+
+# SyncCast builder
+from synccast.core.payload import SyncCastPayloadBuilder, SyncCastPayloadSkeleton, get_payload_skeleton
+
+# SyncCast topic templates
+from synccast.core.topic import SyncCastTopicTemplate
+
+# SyncCast batch encoding
+from synccast.core.batching import encode_fanout_entries
+
+# SyncCast deadline budgets
+from synccast.core.deadline import SyncCastDeadline
+
+# SyncCast enums
+from synccast.core.enums import (
+    SyncCastEventType,
+    SyncCastPriorityLevel,
+    SyncCastQosLevel
+)
+
+# SyncCast service endpoints
+from synccast.core.endpoints import PushEndpoints
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import (
+    SyncCastPayloadError,
+    SyncCastDispatchError,
+    SyncCastTopicError,
+    SyncCastAPIError,
+)
+
+
+class SyncCastBaseService:
+    """
+    Shared plumbing for SyncCast services.
+
+    Subclasses declare the event type, push endpoint and default scope they
+    publish to; this base assembles the payload and hands it to the dispatcher,
+    translating failures into SyncCast exceptions. The dispatcher can be any
+    object exposing `post(endpoint, json=...)`, sync or async.
+    """
+
+    event_type: SyncCastEventType = SyncCastEventType.PUSH_ALERT
+    endpoint: str = PushEndpoints.NOTIFICATION
+    default_scope: str = "chat"
+    default_channel: str = "notification"
+    default_priority: SyncCastPriorityLevel = SyncCastPriorityLevel.MEDIUM
+    default_qos: SyncCastQosLevel = SyncCastQosLevel.DELIVER_AT_LEAST_ONCE
+    # Whether `sender_name` is only attached along with a sender id
+    sender_requires_id: bool = False
+
+    # Error messages surfaced to callers
+    payload_error_message: str = "Invalid payload"
+    unexpected_error_message: str = "Unexpected error while sending event"
+
+    def __init__(self, dispatcher: Any, app_id: str):
+        self.dispatcher = dispatcher
+        self.app_id = app_id
+
+    def build_payload(
+        self,
+        *,
+        user_id: Optional[str],
+        data: Dict[str, Any],
+        scope: Union[str, AbstractSyncCastScope, None] = None,
+        topic: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        platform: Optional[str] = None,
+        device: Optional[str] = None,
+        location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        event_id: Optional[Union[int, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the publish payload for this service's event type. `event_id`
+        (a fresh one when omitted) identifies the event across retries.
+
+        Raises:
+            SyncCastPayloadError: If the payload is incomplete (e.g. missing topic).
+        """
+        payload_builder = (
+            SyncCastPayloadBuilder(
+                user=user_id,
+                type=self.event_type,
+                priority=priority or self.default_priority,
+                qos=self.default_qos if qos is None else qos,
+            )
+            .set_scope(scope or self.default_scope)
+            .set_topic(topic)
+            .set_data(data)
+        )
+
+        if sender_name and (user_id or not self.sender_requires_id):
+            payload_builder.set_sender_info(
+                sender_id=user_id, sender_name=sender_name, sender_role=sender_role
+            )
+
+        if platform or device or location:
+            payload_builder.set_metadata(
+                platform or "unknown", device or "unknown", location or "unknown"
+            )
+
+        if event_id is not None:
+            payload_builder.set_event_id(event_id)
+
+        return payload_builder.build()
+
+    def skeleton(
+        self,
+        event_type: Optional[SyncCastEventType] = None,
+        scope: Optional[str] = None,
+    ) -> SyncCastPayloadSkeleton:
+        """
+        Shared payload skeleton for this service's defaults.
+        """
+        return get_payload_skeleton(
+            event_type or self.event_type,
+            self.default_priority,
+            self.default_qos,
+            scope or self.default_scope,
+        )
+
+    def _raise_for(self, exc: Exception, fields: Dict[str, Any]):
+        """
+        Re-raise `exc` as the SyncCast exception callers expect.
+        """
+        user_id, topic = fields.get("user_id"), fields.get("topic")
+
+        if isinstance(exc, SyncCastPayloadError):
+            raise SyncCastPayloadError(
+                message=self.payload_error_message,
+                extra={"user_id": user_id, "topic": topic}
+            ) from exc
+
+        if isinstance(exc, (SyncCastDispatchError, SyncCastTopicError)):
+            raise exc  # Already carries context from dispatcher / topic builder
+
+        raise SyncCastAPIError(
+            message=self.unexpected_error_message,
+            extra={"user_id": user_id, "topic": topic, "error": str(exc)}
+        ) from exc
+
+    def _post_options(self, deadline_ms: Optional[float]) -> Dict[str, Any]:
+        """
+        Extra `post()` arguments. A deadline starts running here, at the
+        service call, so time spent building or queueing the event counts.
+        """
+        if deadline_ms is None:
+            return {}
+        return {"deadline_ms": SyncCastDeadline.coerce(deadline_ms)}
+
+    def _publish(self, deadline_ms: Optional[float] = None, **fields) -> Any:
+        """
+        Build the payload from `fields` and post it through the dispatcher,
+        within `deadline_ms` in total when given.
+        """
+        try:
+            options = self._post_options(deadline_ms)
+            payload = self.build_payload(**fields)
+            return self.dispatcher.post(self.endpoint, json=payload, **options)
+        except Exception as e:
+            self._raise_for(e, fields)
+
+    def publish_fast(
+        self,
+        topic: str,
+        data: Optional[Dict[str, Any]] = None,
+        user_id: Optional[str] = None,
+        *,
+        event_type: Optional[SyncCastEventType] = None,
+        scope: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
+    ) -> Any:
+        """
+        Allocation-light publish for high-frequency events: the payload is made
+        from a cached skeleton using the service's default priority and QoS,
+        with no sender, metadata or action.
+        """
+        try:
+            payload = self.skeleton(event_type, scope).make(topic, data, user_id, event_id)
+            if deadline_ms is not None:
+                return self.dispatcher.post(self.endpoint, json=payload, **self._post_options(deadline_ms))
+            return self.dispatcher.post(self.endpoint, json=payload)
+        except Exception as e:
+            self._raise_for(e, {"user_id": user_id, "topic": topic, "scope": scope})
+
+    async def apublish_fast(
+        self,
+        topic: str,
+        data: Optional[Dict[str, Any]] = None,
+        user_id: Optional[str] = None,
+        *,
+        event_type: Optional[SyncCastEventType] = None,
+        scope: Optional[str] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
+    ) -> Any:
+        """
+        Awaitable counterpart of `publish_fast` for async dispatchers.
+        """
+        try:
+            payload = self.skeleton(event_type, scope).make(topic, data, user_id, event_id)
+            if deadline_ms is not None:
+                return await self.dispatcher.post(self.endpoint, json=payload, **self._post_options(deadline_ms))
+            return await self.dispatcher.post(self.endpoint, json=payload)
+        except Exception as e:
+            self._raise_for(e, {"user_id": user_id, "topic": topic, "scope": scope})
+
+    def _fanout(
+        self,
+        *,
+        room: Any,
+        data: Dict[str, Any],
+        recipients: Iterable[Union[int, str]],
+        channel: Optional[str] = None,
+        scope: Union[str, AbstractSyncCastScope, None] = None,
+        sender_id: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+    ) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+        """
+        The payload shared by every recipient of a room broadcast (without
+        `user_id` / `topic`) and the `(user_id, topic)` pair of each recipient.
+        """
+        template = SyncCastTopicTemplate(
+            self.app_id,
+            scope or self.default_scope,
+            channel or self.default_channel,
+            ["room", getattr(room, "pk", room)],
+        )
+        user_ids = [str(user_id) for user_id in recipients]
+
+        shared = self.build_payload(
+            user_id=sender_id,
+            data=data,
+            scope=template.scope,
+            topic=template.render(),
+            sender_name=sender_name,
+            sender_role=sender_role,
+            priority=priority,
+            qos=qos,
+        )
+        del shared["user_id"], shared["topic"]
+
+        return shared, list(zip(user_ids, template.render_many(user_ids)))
+
+    def _broadcast(self, **fields) -> Any:
+        """
+        Publish one payload to every recipient of a room. Dispatchers that
+        accept pre-encoded batches (`post_encoded`) receive a single batch in
+        which the shared body was serialized once; other stages get one
+        `post()` per recipient.
+        """
+        try:
+            shared, recipients = self._fanout(**fields)
+            return self._post_fanout(shared, recipients)
+        except Exception as e:
+            self._raise_for(e, fields)
+
+    def _post_fanout(self, shared: Dict[str, Any], recipients: List[Tuple[str, str]]) -> Any:
+        """
+        Hand a fanout to the dispatcher: as one pre-encoded batch if it supports
+        `post_encoded`, otherwise as one `post()` per recipient.
+        """
+        if not recipients:
+            return []
+
+        post_encoded = getattr(self.dispatcher, "post_encoded", None)
+        if post_encoded is not None:
+            serializer = getattr(self.dispatcher, "serializer", None)
+            return post_encoded(encode_fanout_entries(self.endpoint, shared, recipients, serializer))
+
+        return [
+            self.dispatcher.post(self.endpoint, json={"user_id": user_id, "topic": topic, **shared})
+            for user_id, topic in recipients
+        ]
+
+    async def _abroadcast(self, **fields) -> Any:
+        """
+        Awaitable counterpart of `_broadcast` for async dispatchers.
+        """
+        try:
+            shared, recipients = self._fanout(**fields)
+            return await self._apost_fanout(shared, recipients)
+        except Exception as e:
+            self._raise_for(e, fields)
+
+    async def _apost_fanout(
+        self,
+        shared: Dict[str, Any],
+        recipients: List[Tuple[str, str]],
+        return_exceptions: bool = False,
+    ) -> Any:
+        """
+        Awaitable counterpart of `_post_fanout`. With `return_exceptions`, a
+        failed per-recipient post is returned in place of its result.
+        """
+        if not recipients:
+            return []
+
+        post_encoded = getattr(self.dispatcher, "post_encoded", None)
+        if post_encoded is not None:
+            serializer = getattr(self.dispatcher, "serializer", None)
+            return await post_encoded(encode_fanout_entries(self.endpoint, shared, recipients, serializer))
+
+        return await asyncio.gather(*(
+            self.dispatcher.post(self.endpoint, json={"user_id": user_id, "topic": topic, **shared})
+            for user_id, topic in recipients
+        ), return_exceptions=return_exceptions)
+
+    async def _apublish(self, deadline_ms: Optional[float] = None, **fields) -> Any:
+        """
+        Awaitable counterpart of `_publish` for async dispatchers.
+        """
+        try:
+            options = self._post_options(deadline_ms)
+            payload = self.build_payload(**fields)
+            return await self.dispatcher.post(self.endpoint, json=payload, **options)
+        except Exception as e:
+            self._raise_for(e, fields)
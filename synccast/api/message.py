@@ -1,37 +1,35 @@
 # Default package imports
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Iterable
 
 # SyncCast abstract model
 from synccast.models import AbstractSyncCastScope
 
-# SyncCast builder
-from synccast.core.topic import SyncCastTopicBuilder
-from synccast.core.payload import SyncCastPayloadBuilder
-
-# SyncCast service dispatcher
-from synccast.core.dispatcher import SyncCastDispatcher
+# SyncCast base service
+from synccast.api.base import SyncCastBaseService
 
 # SyncCast enums
-from synccast.core.enums import SyncCastEventType
+from synccast.core.enums import (
+    SyncCastEventType,
+    SyncCastPriorityLevel,
+    SyncCastQosLevel
+)
 
 # SyncCast service endpoints
 from synccast.core.endpoints import PushEndpoints
 
-# SyncCast custom exceptions
-from synccast.exceptions.types import (
-    SyncCastTopicError,
-    SyncCastPayloadError,
-    SyncCastDispatchError,
-    SyncCastAPIError,
-)
-class MessageService:
+
+class MessageService(SyncCastBaseService):
     """
     Service for dispatching chat messages over SyncCast.
     """
 
-    def __init__(self, dispatcher: SyncCastDispatcher, app_id: str):
-        self.dispatcher = dispatcher
-        self.app_id = app_id
+    event_type = SyncCastEventType.CHAT_MESSAGE
+    endpoint = PushEndpoints.MESSAGE
+    default_scope = "chat"
+    default_channel = "message"
+
+    payload_error_message = "Invalid chat message payload"
+    unexpected_error_message = "Unexpected error while sending chat message"
 
     def send_message(
         self,
@@ -45,41 +43,56 @@ class MessageService:
         platform: Optional[str] = None,
         device: Optional[str] = None,
         location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
     ) -> dict:
-        
-        try:
-            payload_builder = (
-                SyncCastPayloadBuilder(user=user_id, type=SyncCastEventType.CHAT_MESSAGE)
-                .set_scope(scope)
-                .set_topic(topic)
-                .set_data(data)
-            )
-
-            if sender_name:
-                payload_builder.set_sender_info(
-                    sender_id=user_id, sender_name=sender_name, sender_role=sender_role
-                )
-
-            if platform or device or location:
-                payload_builder.set_metadata(
-                    platform or "unknown", device or "unknown", location or "unknown"
-                )
-
-            payload = payload_builder.build()
 
-            return self.dispatcher.post(PushEndpoints.MESSAGE, json=payload)
-        
-        except SyncCastPayloadError as e:
-            raise SyncCastPayloadError(
-                message="Invalid chat message payload",
-                extra={"user_id": user_id, "topic": topic}
-            ) from e
+        return self._publish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
 
-        except SyncCastDispatchError:
-            raise  # already includes context from dispatcher
-
-        except Exception as e:
-            raise SyncCastAPIError(
-                message="Unexpected error while sending chat message",
-                extra={"user_id": user_id, "topic": topic, "error": str(e)}
-            ) from e
+    def broadcast(
+        self,
+        room: Any,
+        data: Dict[str, Any],
+        *,
+        recipients: Iterable[Union[int, str]],
+        channel: str = "message",
+        scope: Union[str, AbstractSyncCastScope] = "chat",
+        sender_id: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+    ) -> Any:
+        """
+        Publish `data` to every user in `recipients` on the room's
+        per-user topics (`<app>/<scope>/<channel>/room/<room>/user/<id>`),
+        serializing the shared payload once.
+        """
+        return self._broadcast(
+            room=room,
+            data=data,
+            recipients=recipients,
+            channel=channel,
+            scope=scope,
+            sender_id=sender_id,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            priority=priority,
+            qos=qos,
+        )
@@ -1,37 +1,48 @@
 # Default package imports
-from typing import Optional, Dict, Any, Union
+import time
+import inspect
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Any, Union, Iterable, List, Tuple
 
 # SyncCast abstract model
 from synccast.models import AbstractSyncCastScope
 
-# SyncCast builder
-from synccast.core.topic import SyncCastTopicBuilder
-from synccast.core.payload import SyncCastPayloadBuilder
-
-# SyncCast service dispatcher
-from synccast.core.dispatcher import SyncCastDispatcher
+# SyncCast base service
+from synccast.api.base import SyncCastBaseService
 
 # SyncCast enums
-from synccast.core.enums import SyncCastEventType
+from synccast.core.enums import (
+    SyncCastEventType,
+    SyncCastPriorityLevel,
+    SyncCastQosLevel
+)
 
 # SyncCast service endpoints
 from synccast.core.endpoints import PushEndpoints
- 
+
+# SyncCast topic templates
+from synccast.core.topic import SyncCastTopicTemplate
+
+# SyncCast bulk sending helpers
+from synccast.core.bulk import SyncCastBulkResult, SyncCastRatePacer, iter_chunks
+
 # SyncCast custom exceptions
-from synccast.exceptions.types import (
-    SyncCastTopicError,
-    SyncCastPayloadError,
-    SyncCastDispatchError,
-    SyncCastAPIError,
-)
-class NotificationService:
+from synccast.exceptions.types import SyncCastDispatchError
+
+
+class NotificationService(SyncCastBaseService):
     """
     Service for dispatching system notifications over SyncCast.
     """
 
-    def __init__(self, dispatcher: SyncCastDispatcher, app_id: str):
-        self.dispatcher = dispatcher
-        self.app_id = app_id
+    event_type = SyncCastEventType.SYSTEM_EVENT
+    endpoint = PushEndpoints.SYSTEM
+    default_scope = "system"
+    default_channel = "notification"
+    sender_requires_id = True
+
+    payload_error_message = "Invalid system notification payload"
+    unexpected_error_message = "Unexpected error while sending system notification"
 
     def send_notification(
         self,
@@ -45,42 +56,226 @@ class NotificationService:
         platform: Optional[str] = None,
         device: Optional[str] = None,
         location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
     ) -> dict:
-         
-        try:
 
-            payload_builder = (
-                SyncCastPayloadBuilder(user=user_id, type=SyncCastEventType.SYSTEM_EVENT)
-                .set_scope(scope)
-                .set_topic(topic)
-                .set_data(data)
-            )
+        return self._publish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
+
+    def broadcast(
+        self,
+        room: Any,
+        data: Dict[str, Any],
+        *,
+        recipients: Iterable[Union[int, str]],
+        channel: str = "notification",
+        scope: Union[str, AbstractSyncCastScope] = "system",
+        sender_id: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+    ) -> Any:
+        """
+        Publish `data` to every user in `recipients` on the room's
+        per-user topics (`<app>/<scope>/<channel>/room/<room>/user/<id>`),
+        serializing the shared payload once.
+        """
+        return self._broadcast(
+            room=room,
+            data=data,
+            recipients=recipients,
+            channel=channel,
+            scope=scope,
+            sender_id=sender_id,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            priority=priority,
+            qos=qos,
+        )
+
+    def send_bulk(
+        self,
+        user_ids: Iterable[Union[int, str]],
+        data: Dict[str, Any],
+        *,
+        channel: str = "notification",
+        scope: Union[str, AbstractSyncCastScope] = "system",
+        template: Optional[SyncCastTopicTemplate] = None,
+        chunk_size: int = 500,
+        concurrency: int = 4,
+        rate_limit: Optional[float] = None,
+        sender_id: Optional[str] = None,
+        sender_name: Optional[str] = None,
+        sender_role: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+    ) -> SyncCastBulkResult:
+        """
+        Notify every user in `user_ids` (any iterable, e.g. a queryset
+        `.iterator()`) on their own topic (`<app>/<scope>/<channel>/user/<id>`,
+        or `template`).
 
-            if sender_name and user_id:
-                payload_builder.set_sender_info(
-                    sender_id=user_id, sender_name=sender_name, sender_role=sender_role
-                )
+        Recipients are consumed lazily in chunks of `chunk_size`; each chunk
+        is one batch request, with up to `concurrency` chunks in flight and at
+        most `rate_limit` events per second overall. Memory use does not
+        depend on the number of recipients.
 
-            if platform or device or location:
-                payload_builder.set_metadata(
-                    platform or "unknown", device or "unknown", location or "unknown"
-                )
+        Returns:
+            SyncCastBulkResult: Sent and spooled counts, failed ids and per-chunk latency.
+        """
+        shared, template = self._bulk_payload(
+            data,
+            channel=channel,
+            scope=scope,
+            template=template,
+            sender_id=sender_id,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            priority=priority,
+            qos=qos,
+        )
 
-            payload = payload_builder.build()
+        pacer = SyncCastRatePacer(rate_limit) if rate_limit else None
+        result = SyncCastBulkResult()
+        started = time.monotonic()
 
-            return self.dispatcher.post(PushEndpoints.SYSTEM, json=payload)
-        
-        except SyncCastPayloadError as e:
-            raise SyncCastPayloadError(
-                message="Invalid system notification payload",
-                extra={"user_id": user_id, "topic": topic}
-            ) from e
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="synccast-bulk") as executor:
+            in_flight = set()
+            for index, chunk in enumerate(iter_chunks(user_ids, chunk_size)):
+                if len(in_flight) >= concurrency * 2:  # Bounded read-ahead keeps memory constant
+                    _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                in_flight.add(executor.submit(self._send_chunk, index, chunk, shared, template, pacer, result))
+            wait(in_flight)
+
+        result.elapsed = time.monotonic() - started
+        return result
+
+    def _bulk_payload(
+        self,
+        data: Dict[str, Any],
+        *,
+        channel: str,
+        scope: Union[str, AbstractSyncCastScope],
+        template: Optional[SyncCastTopicTemplate],
+        sender_id: Optional[str],
+        sender_name: Optional[str],
+        sender_role: Optional[str],
+        priority: Optional[SyncCastPriorityLevel],
+        qos: Optional[SyncCastQosLevel],
+    ) -> Tuple[Dict[str, Any], SyncCastTopicTemplate]:
+        """
+        The payload shared by every recipient of a bulk send (without
+        `user_id` / `topic`) and the template of their topics.
+        """
+        fields = {"user_id": sender_id, "topic": None}
+        try:
+            template = template or SyncCastTopicTemplate(self.app_id, scope, channel)
+            shared = self.build_payload(
+                user_id=sender_id,
+                data=data,
+                scope=template.scope,
+                topic=template.render(),
+                sender_name=sender_name,
+                sender_role=sender_role,
+                priority=priority,
+                qos=qos,
+            )
+            del shared["user_id"], shared["topic"]
+        except Exception as e:
+            self._raise_for(e, fields)
+        return shared, template
 
-        except SyncCastDispatchError:
-            raise  # Already wrapped in dispatcher
+    def _send_chunk(
+        self,
+        index: int,
+        chunk: List[Union[int, str]],
+        shared: Dict[str, Any],
+        template: SyncCastTopicTemplate,
+        pacer: Optional[SyncCastRatePacer],
+        result: SyncCastBulkResult,
+    ) -> None:
+        user_ids = [str(user_id) for user_id in chunk]
+        if pacer is not None:
+            pacer.acquire(len(user_ids))
 
+        started = time.perf_counter()
+        try:
+            response = self._post_fanout(shared, list(zip(user_ids, template.render_many(user_ids))))
+            failed, spooled = self._recipient_outcomes(user_ids, response)
         except Exception as e:
-            raise SyncCastAPIError(
-                message="Unexpected error while sending system notification",
-                extra={"user_id": user_id, "topic": topic, "error": str(e)}
-            ) from e
+            result.record(index, len(user_ids), user_ids, time.perf_counter() - started, str(e))
+            return
+        result.record(index, len(user_ids), failed, time.perf_counter() - started, spooled=len(spooled))
+
+    @staticmethod
+    def _recipient_outcomes(user_ids: List[str], response: Any) -> Tuple[List[str], List[str]]:
+        """
+        Recipients reported as failed and as spooled, in that order.
+
+        Failed: per-recipient futures that raised, or results carrying
+        `"ok": false` / an `"error"`, or that are not a result at all.
+        Spooled: results carrying `"spooled"` (diverted to the local spool or
+        the outbox, to be replayed later), so not delivered yet. A response
+        of unknown shape raises, so its whole chunk is recorded as failed
+        rather than as sent.
+        """
+        def outcome(entry: Any) -> Optional[str]:
+            if isinstance(entry, dict):
+                if entry.get("ok") is False or "error" in entry:
+                    return "failed"
+                return "spooled" if "spooled" in entry else None
+            if inspect.iscoroutine(entry):
+                entry.close()  # Never awaited: nothing was sent
+            return None if isinstance(entry, str) else "failed"
+
+        if isinstance(response, Future):
+            response = response.result()
+
+        if isinstance(response, list):  # One result (or future) per recipient
+            outcomes = []
+            for item in response:
+                try:
+                    entry = item.result() if isinstance(item, Future) else item
+                except Exception:
+                    outcomes.append("failed")
+                    continue
+                outcomes.append(outcome(entry))
+
+        elif isinstance(response, dict):  # One batch result
+            results = response.get("results")
+            if isinstance(results, list) and len(results) == len(user_ids):
+                outcomes = [outcome(entry) for entry in results]
+            else:
+                outcomes = [outcome(response)] * len(user_ids)
+
+        elif isinstance(response, str):  # Accepted, with a non-JSON body
+            return [], []
+
+        else:
+            if inspect.iscoroutine(response):
+                response.close()
+            raise SyncCastDispatchError(
+                message="Unrecognized bulk response",
+                extra={"type": type(response).__name__, "recipients": len(user_ids)}
+            )
+
+        failed = [user_id for user_id, kind in zip(user_ids, outcomes) if kind == "failed"]
+        spooled = [user_id for user_id, kind in zip(user_ids, outcomes) if kind == "spooled"]
+        return failed, spooled
@@ -4,36 +4,32 @@ from typing import Optional, Dict, Any, Union
 # SyncCast abstract model
 from synccast.models import AbstractSyncCastScope
 
-# SyncCast builder
-from synccast.core.topic import SyncCastTopicBuilder
-from synccast.core.payload import SyncCastPayloadBuilder
-
-# SyncCast service dispatcher
-from synccast.core.dispatcher import SyncCastDispatcher
+# SyncCast base service
+from synccast.api.base import SyncCastBaseService
 
 # SyncCast enums
-from synccast.core.enums import SyncCastEventType
+from synccast.core.enums import (
+    SyncCastEventType,
+    SyncCastPriorityLevel,
+    SyncCastQosLevel
+)
 
 # SyncCast service endpoints
 from synccast.core.endpoints import PushEndpoints
- 
-# SyncCast custom exceptions
-from synccast.exceptions.types import (
-    SyncCastTopicError,
-    SyncCastPayloadError,
-    SyncCastDispatchError,
-    SyncCastAPIError
-)
 
 
-class PresenceService:
+class PresenceService(SyncCastBaseService):
     """
     Service for dispatching presence status updates over SyncCast.
     """
 
-    def __init__(self, dispatcher: SyncCastDispatcher, app_id: str):
-        self.dispatcher = dispatcher
-        self.app_id = app_id
+    event_type = SyncCastEventType.USER_PRESENCE
+    endpoint = PushEndpoints.PRESENCE
+    default_scope = "chat"
+    default_priority = SyncCastPriorityLevel.LOW
+
+    payload_error_message = "Invalid presence payload"
+    unexpected_error_message = "Unexpected error while sending presence update"
 
     def send_presence(
         self,
@@ -47,42 +43,25 @@ class PresenceService:
         platform: Optional[str] = None,
         device: Optional[str] = None,
         location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
     ) -> dict:
-         
-        try:
-
-            # Build payload
-            payload_builder = (
-                SyncCastPayloadBuilder(user=user_id, type=SyncCastEventType.USER_PRESENCE)
-                .set_scope(scope)
-                .set_topic(topic)
-                .set_data(data)
-            )
-
-            if sender_name:
-                payload_builder.set_sender_info(sender_id=user_id, sender_name=sender_name, sender_role=sender_role)
-
-            if platform or device or location:
-                payload_builder.set_metadata(
-                    platform or "unknown", device or "unknown", location or "unknown"
-                )
-
-            payload = payload_builder.build()
-
-            # Dispatch to broker
-            return self.dispatcher.post(PushEndpoints.PRESENCE, json=payload)
-
-        except SyncCastPayloadError as e:
-            raise SyncCastPayloadError(
-                message="Invalid presence payload",
-                extra={"user_id": user_id, "topic": topic}
-            ) from e
-
-        except SyncCastDispatchError:
-            raise  # Already carries context from dispatcher
 
-        except Exception as e:
-            raise SyncCastAPIError(
-                message="Unexpected error while sending presence update",
-                extra={"user_id": user_id, "topic": topic, "error": str(e)}
-            ) from e
+        # Build payload and dispatch to broker
+        return self._publish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
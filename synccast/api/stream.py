@@ -4,34 +4,31 @@ from typing import Optional, Dict, Any, Union
 # SyncCast abstract model
 from synccast.models import AbstractSyncCastScope
 
-# SyncCast builder
-from synccast.core.topic import SyncCastTopicBuilder
-from synccast.core.payload import SyncCastPayloadBuilder
+# SyncCast base service
+from synccast.api.base import SyncCastBaseService
 
-# SyncCast service dispatcher
-from synccast.core.dispatcher import SyncCastDispatcher
- 
 # SyncCast enums
-from synccast.core.enums import SyncCastEventType
+from synccast.core.enums import (
+    SyncCastEventType,
+    SyncCastPriorityLevel,
+    SyncCastQosLevel
+)
 
 # SyncCast service endpoints
 from synccast.core.endpoints import PushEndpoints
- 
-# SyncCast custom exceptions
-from synccast.exceptions.types import (
-    SyncCastTopicError,
-    SyncCastPayloadError,
-    SyncCastDispatchError,
-    SyncCastAPIError
-)
-class StreamService:
+
+
+class StreamService(SyncCastBaseService):
     """
     Service for pushing UI update events (e.g., real-time data refreshes) via SyncCast.
     """
 
-    def __init__(self, dispatcher: SyncCastDispatcher, app_id: str):
-        self.dispatcher = dispatcher
-        self.app_id = app_id
+    event_type = SyncCastEventType.DATA_SYNC
+    endpoint = PushEndpoints.SYNC
+    default_scope = "ui"
+
+    payload_error_message = "Invalid UI sync payload"
+    unexpected_error_message = "Unexpected error while sending UI update"
 
     def send_update(
         self,
@@ -45,42 +42,25 @@ class StreamService:
         platform: Optional[str] = None,
         device: Optional[str] = None,
         location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
     ) -> dict:
-         
-        try:
-
-            # Build payload
-            payload_builder = (
-                SyncCastPayloadBuilder(user=user_id, type=SyncCastEventType.USER_PRESENCE)
-                .set_scope(scope)
-                .set_topic(topic)
-                .set_data(data)
-            )
-
-            if sender_name:
-                payload_builder.set_sender_info(sender_id=user_id, sender_name=sender_name, sender_role=sender_role)
-
-            if platform or device or location:
-                payload_builder.set_metadata(
-                    platform or "unknown", device or "unknown", location or "unknown"
-                )
-
-            payload = payload_builder.build()
-
-            # Send to SyncCast
-            return self.dispatcher.post(PushEndpoints.SYNC, json=payload)
-
-        except SyncCastPayloadError as e:
-            raise SyncCastPayloadError(
-                message="Invalid UI sync payload",
-                extra={"user_id": user_id, "topic": topic}
-            ) from e
-
-        except SyncCastDispatchError as e:
-            raise  # Already wrapped with dispatch metadata
 
-        except Exception as e:
-            raise SyncCastAPIError(
-                message="Unexpected error while sending UI update",
-                extra={"user_id": user_id, "topic": topic, "error": str(e)}
-            ) from e
+        # Build payload and send to SyncCast
+        return self._publish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
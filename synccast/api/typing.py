@@ -4,34 +4,43 @@ from typing import Optional, Dict, Any, Union
 # SyncCast abstract model
 from synccast.models import AbstractSyncCastScope
 
-# SyncCast builder
-from synccast.core.topic import SyncCastTopicBuilder
-from synccast.core.payload import SyncCastPayloadBuilder
-
-# SyncCast service dispatcher
-from synccast.core.dispatcher import SyncCastDispatcher
+# SyncCast base service
+from synccast.api.base import SyncCastBaseService
 
 # SyncCast enums
-from synccast.core.enums import SyncCastEventType
+from synccast.core.enums import (
+    SyncCastEventType,
+    SyncCastPriorityLevel,
+    SyncCastQosLevel
+)
 
 # SyncCast service endpoints
 from synccast.core.endpoints import PushEndpoints
 
 # SyncCast custom exceptions
-from synccast.exceptions.types import (
-    SyncCastTopicError,
-    SyncCastPayloadError,
-    SyncCastDispatchError,
-    SyncCastAPIError,
-)
-class TypingService:
+from synccast.exceptions.types import SyncCastTopicError
+
+
+class TypingService(SyncCastBaseService):
     """
     Service for dispatching typing status updates over SyncCast.
     """
 
-    def __init__(self, dispatcher: SyncCastDispatcher, app_id: str):
-        self.dispatcher = dispatcher
-        self.app_id = app_id
+    event_type = SyncCastEventType.USER_TYPING
+    endpoint = PushEndpoints.TYPING
+    default_scope = "chat"
+    default_priority = SyncCastPriorityLevel.LOW
+    default_qos = SyncCastQosLevel.FIRE_AND_FORGET
+
+    payload_error_message = "Invalid typing payload"
+    unexpected_error_message = "Unexpected error while sending typing event"
+
+    def _raise_for(self, exc: Exception, fields: Dict[str, Any]):
+        if isinstance(exc, (ValueError, SyncCastTopicError)):
+            raise SyncCastTopicError(
+                "Failed to generate topic", extra={"scope": str(fields.get("scope"))}
+            ) from exc
+        super()._raise_for(exc, fields)
 
     def send_typing(
         self,
@@ -45,42 +54,25 @@ class TypingService:
         platform: Optional[str] = None,
         device: Optional[str] = None,
         location: Optional[str] = None,
+        priority: Optional[SyncCastPriorityLevel] = None,
+        qos: Optional[SyncCastQosLevel] = None,
+        deadline_ms: Optional[float] = None,
+        event_id: Optional[str] = None,
     ) -> dict:
-         
-        try:
-            
-            # Payload creation
-            payload_builder = (
-                SyncCastPayloadBuilder(user=user_id, type=SyncCastEventType.USER_TYPING)
-                .set_scope(scope)
-                .set_topic(topic)
-                .set_data(data)
-            )
-
-            if sender_name:
-                payload_builder.set_sender_info(sender_id=user_id, sender_name=sender_name, sender_role=sender_role)
-
-            if platform or device or location:
-                payload_builder.set_metadata(
-                    platform or "unknown", device or "unknown", location or "unknown"
-                )
-
-            payload = payload_builder.build()
-
-            # Send via dispatcher
-            return self.dispatcher.post(PushEndpoints.TYPING, json=payload)
-
-        except (ValueError, SyncCastTopicError) as e:
-            raise SyncCastTopicError("Failed to generate topic", extra={"scope": str(scope)}) from e
-
-        except SyncCastPayloadError as e:
-            raise SyncCastPayloadError("Invalid typing payload", extra={"user_id": user_id, "topic": topic}) from e
-
-        except SyncCastDispatchError as e:
-            raise  # already a dispatch-level error with context
 
-        except Exception as e:
-            raise SyncCastAPIError(
-                "Unexpected error while sending typing event",
-                extra={"error": str(e), "user_id": user_id, "topic": topic}
-            ) from e
+        # Payload creation and send via dispatcher
+        return self._publish(
+            user_id=user_id,
+            data=data,
+            scope=scope,
+            topic=topic,
+            sender_name=sender_name,
+            sender_role=sender_role,
+            platform=platform,
+            device=device,
+            location=location,
+            priority=priority,
+            qos=qos,
+            deadline_ms=deadline_ms,
+            event_id=event_id,
+        )
@@ -2,3 +2,10 @@ from django.apps import AppConfig
 class SynccastConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'synccast'
+
+    def ready(self):
+        # Keep the scope/channel registry in sync with local writes. It is
+        # loaded lazily on first use: querying the database here would run
+        # before migrations and during every management command.
+        from synccast.core.registry import scope_registry
+        scope_registry.connect_signals()
@@ -13,16 +13,68 @@ Typical usage:
 
 # ── Topic & Payload Builders ───────────────────────────────────────────────────
 from .topic import SyncCastTopicBuilder            # Dynamically builds MQTT topic strings
+from .topic import SyncCastTopicTemplate           # Pre-validated topic for bulk per-user rendering
+from .trie import SyncCastTopicTrie                # Topic-filter index with MQTT wildcard matching
 from .payload import SyncCastPayloadBuilder        # Constructs structured payloads for publishing
 
 # ── Dispatching & API Endpoint Utilities ───────────────────────────────────────
 from .dispatcher import SyncCastDispatcher         # HTTP client for sending data to SyncCast APIs
+from .async_dispatcher import AsyncSyncCastDispatcher  # Asyncio HTTP client (requires httpx)
+from .batching import SyncCastBatcher              # Coalesces many events into one batch request
+from .pool import SyncCastDispatchPool             # Bounded queue + worker threads with overflow policies
+from .transport import (                           # Pluggable wire transports (HTTP push API, direct MQTT)
+    SyncCastTransport,
+    SyncCastHTTPTransport,
+    SyncCastMQTTTransport,
+)
+from .outbox import SyncCastOutboxDispatcher       # Transactional outbox: publish after commit
+from .lanes import SyncCastLaneRouter              # Routes events to QoS/priority delivery lanes
+from .coalescing import SyncCastCoalescer          # Last-write-wins coalescing of UI sync updates
+from .delta import SyncCastDeltaEncoder            # JSON-patch delta encoding of UI sync updates
+from .throttle import SyncCastTypingThrottle       # Per-(user, topic) typing dedup with auto-stop
+from .presence import SyncCastPresenceManager      # Transition-only presence with write-behind
+from .dedup import SyncCastDeduplicator            # Suppresses repeated publishes of one event
+from .bulk import SyncCastBulkResult               # Outcome of a chunked bulk send
+from .ratelimit import SyncCastRateLimiter         # Adaptive (AIMD) per-endpoint token buckets
+from .breaker import SyncCastCircuitBreaker        # Per-endpoint closed / open / half-open circuits
+from .spool import SyncCastSpool                   # Append-only on-disk spool with ordered replay
+from .deadline import SyncCastDeadline             # Total time budget of one publish
+from .routing import SyncCastEndpointRouter        # Latency / error-aware choice between base URLs
+from .metrics import SyncCastMetrics               # In-process counters, gauges and timers
+from .serializers import SyncCastSerializer, get_serializer    # Payload encoders (stdlib json / orjson)
+from .compression import SyncCastCompressor, get_compressor    # Request body codecs (gzip / zstd / br)
 from .endpoints import PushEndpoints               # Predefined API endpoint constants
 
 # ── Public API Exposure ────────────────────────────────────────────────────────
 __all__ = [
     "SyncCastTopicBuilder",
+    "SyncCastTopicTemplate",
+    "SyncCastTopicTrie",
     "SyncCastPayloadBuilder",
     "SyncCastDispatcher",
+    "AsyncSyncCastDispatcher",
+    "SyncCastBatcher",
+    "SyncCastDispatchPool",
+    "SyncCastTransport",
+    "SyncCastHTTPTransport",
+    "SyncCastMQTTTransport",
+    "SyncCastOutboxDispatcher",
+    "SyncCastLaneRouter",
+    "SyncCastCoalescer",
+    "SyncCastDeltaEncoder",
+    "SyncCastTypingThrottle",
+    "SyncCastPresenceManager",
+    "SyncCastDeduplicator",
+    "SyncCastBulkResult",
+    "SyncCastRateLimiter",
+    "SyncCastCircuitBreaker",
+    "SyncCastSpool",
+    "SyncCastDeadline",
+    "SyncCastEndpointRouter",
+    "SyncCastMetrics",
+    "SyncCastSerializer",
+    "get_serializer",
+    "SyncCastCompressor",
+    "get_compressor",
     "PushEndpoints",
 ]
@@ -0,0 +1,415 @@
+# Default package imports
+import time
+import asyncio
+import logging
+import functools
+from typing import Optional, Dict, Any, Union, Iterable, List
+
+# Optional async HTTP client
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+# syncCast sdk singelton instance
+from synccast import synccast
+
+# SyncCast dispatcher configuration
+from synccast.core.dispatcher import SyncCastDispatcherBase
+
+# SyncCast payload serializers
+from synccast.core.serializers import SyncCastSerializer, get_serializer
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# SyncCast client-side rate limiting
+from synccast.core.ratelimit import parse_retry_after
+
+# SyncCast deadline budgets
+from synccast.core.deadline import SyncCastDeadline
+
+# SyncCast service endpoints and batch encoding
+from synccast.core.endpoints import PushEndpoints
+from synccast.core.batching import encode_batch
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import (
+    SyncCastDispatchError,
+    SyncCastBackpressureError,
+    SyncCastDeadlineError,
+    SyncCastAPIError
+)
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+class AsyncSyncCastDispatcher(SyncCastDispatcherBase):
+    """
+    Asyncio HTTP client for communicating with SyncCast APIs.
+
+    Mirrors `SyncCastDispatcher` (same `post/get/put/delete` surface, secret
+    injection, retries and error reporting) but every request method is a
+    coroutine, so many publishes can be awaited concurrently on one event loop.
+    Multi-URL routing, failover and hedging (`with_base_urls()`) run as tasks
+    on the same loop. Requires the optional `httpx` dependency (`pip install syncast[async]`).
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 5,
+        retries: Optional[int] = 3,
+        backoff_factor: float = 0.3,
+        max_connections: int = 100,
+        serializer: Union[SyncCastSerializer, str, None] = None,
+        metrics: Optional[SyncCastMetrics] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        if httpx is None:
+            raise SyncCastDispatchError(
+                message="AsyncSyncCastDispatcher requires the 'httpx' package",
+                extra={"install": "pip install syncast[async]"}
+            )
+
+        self.base_url = (base_url or synccast._api_base).rstrip("/")
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.retries = retries or 0
+        self.backoff_factor = backoff_factor
+        self.max_connections = max_connections
+        self.logger = logger_instance or logger
+        self.with_serializer(serializer or get_serializer())
+        self.metrics = metrics or SyncCastMetrics()
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """
+        Lazily created `httpx.AsyncClient`, bound to the running event loop.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying connection pool.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> 'AsyncSyncCastDispatcher':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        return self.backoff_factor * (2 ** attempt)
+
+    async def _safe_request(
+        self,
+        method: str,
+        url: str,
+        endpoint: Optional[str] = None,
+        priority: Any = None,
+        deadline: Optional[SyncCastDeadline] = None,
+        retries: Optional[int] = None,
+        **kwargs
+    ) -> "httpx.Response":
+        headers_to_use = {**self.headers, **(kwargs.pop('headers', None) or {})}
+        client = self.client  # Created (SSL context included) before any attempt timeout is computed
+        limiter = self.rate_limiter if endpoint is not None else None
+        key = self._limit_key(endpoint) if limiter is not None else None
+        last: Dict[str, Any] = {}
+        retries = self.retries if retries is None else retries
+
+        for attempt in range(retries + 1):
+            if limiter is not None:
+                wait = limiter.reserve(key, priority)
+                if deadline is not None and wait >= deadline.remaining():
+                    raise deadline.error(endpoint, url=url, waiting_for="rate_limit", **last)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    if deadline is not None:
+                        deadline.record("rate_limit", wait)
+
+            if deadline is not None:
+                remaining = deadline.remaining()
+                if remaining <= 0:
+                    raise deadline.error(endpoint or url, url=url, **last)
+                kwargs["timeout"] = min(self.timeout, remaining)
+
+            started = time.monotonic()
+            try:
+                response = await client.request(
+                    method.upper(), url, headers=headers_to_use, **kwargs
+                )
+            except httpx.HTTPError as e:
+                if deadline is not None:
+                    deadline.record("attempt", time.monotonic() - started, error=type(e).__name__)
+                    last = {"last_error": str(e)}
+                if attempt >= retries:
+                    self.logger.exception(f"[AsyncSyncCastDispatcher] {method.upper()} request failed")
+                    if deadline is not None and deadline.expired:
+                        raise deadline.error(endpoint or url, url=url, **last) from e
+                    raise SyncCastDispatchError(
+                        message=f"{method.upper()} request failed",
+                        extra={"exception": str(e), "url": url, "attempts": attempt + 1}
+                    ) from e
+            else:
+                if deadline is not None:
+                    deadline.record("attempt", time.monotonic() - started, status=response.status_code)
+                    last = {"last_status": response.status_code}
+                if limiter is not None:
+                    if response.status_code == 429:
+                        limiter.on_throttled(key, parse_retry_after(response.headers.get("Retry-After")))
+                        if attempt < retries:
+                            continue  # The limiter paces the retry
+                    else:
+                        limiter.on_success(key)
+                if response.status_code not in self.RETRY_STATUSES or attempt >= retries:
+                    return response
+
+            backoff = self._backoff(attempt)
+            if deadline is not None:
+                if backoff >= deadline.remaining():
+                    raise deadline.error(endpoint or url, url=url, **last)
+                deadline.record("backoff", backoff)
+            await asyncio.sleep(backoff)
+
+    async def _route_attempt(
+        self,
+        method: str,
+        endpoint: str,
+        base_url: str,
+        priority: Any,
+        deadline: Optional[SyncCastDeadline],
+        failover: bool,
+        **kwargs
+    ) -> "httpx.Response":
+        """
+        `_safe_request` to `base_url`, recorded by the router. With
+        `failover`, it makes a single attempt, leaving retries to the next URL.
+        """
+        started = time.monotonic()
+        try:
+            response = await self._safe_request(
+                method, self._build_url(endpoint, base_url), endpoint, priority, deadline,
+                retries=0 if failover else None, **kwargs
+            )
+        except SyncCastBackpressureError:
+            raise
+        except SyncCastDispatchError:
+            self.router.record(base_url, time.monotonic() - started, failed=True)
+            raise
+        self.router.record(base_url, time.monotonic() - started, failed=response.status_code >= 500)
+        return response
+
+    async def _routed_request(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        priority: Any = None,
+        deadline: Optional[SyncCastDeadline] = None,
+        **kwargs
+    ) -> "httpx.Response":
+        """
+        `_safe_request` to the router's best base URL, failing over to the
+        next ones (hedged for `hedge_priorities`). Without a router, to `url`.
+        """
+        if self.router is None:
+            return await self._safe_request(method, url, endpoint, priority, deadline, **kwargs)
+
+        self.client  # Created before any attempt is timed for the router
+        candidates = self.router.ranked()
+        delay = self._hedge_delay(candidates, priority)
+        if delay is not None and (deadline is None or delay < deadline.remaining()):
+            return await self._hedged_request(method, endpoint, candidates, delay, priority, deadline, **kwargs)
+
+        for index, base_url in enumerate(candidates):
+            last = index == len(candidates) - 1
+            try:
+                response = await self._route_attempt(method, endpoint, base_url, priority, deadline, not last, **kwargs)
+            except (SyncCastBackpressureError, SyncCastDeadlineError):
+                raise
+            except SyncCastDispatchError as e:
+                if last:
+                    raise
+                self._failed_over(base_url, endpoint, (e.extra or {}).get("exception"))
+                continue
+            if last or response.status_code < 500:
+                return response
+            self._failed_over(base_url, endpoint, response.status_code)
+
+    async def _hedged_request(
+        self,
+        method: str,
+        endpoint: str,
+        candidates: List[str],
+        delay: float,
+        priority: Any,
+        deadline: Optional[SyncCastDeadline],
+        **kwargs
+    ) -> "httpx.Response":
+        """
+        Awaitable counterpart of `SyncCastDispatcher._hedged_request`; the
+        slower request is cancelled once one succeeds.
+        """
+        primary = asyncio.ensure_future(self._route_attempt(method, endpoint, candidates[0], priority, deadline, False, **kwargs))
+        pending = {primary}
+        hedged = False
+        response, error = None, None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=None if hedged else delay, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        response = task.result()
+                    except SyncCastDispatchError as e:
+                        error = e
+                        continue
+                    if response.status_code < 500:
+                        if task is not primary:
+                            self.metrics.incr("routing.hedge_won")
+                        return response
+
+                if not hedged and (not done or not pending):
+                    # Slower than its p95, or already failed: try the second URL too
+                    hedged = True
+                    self.metrics.incr("routing.hedged")
+                    pending.add(asyncio.ensure_future(
+                        self._route_attempt(method, endpoint, candidates[1], priority, deadline, False, **kwargs)
+                    ))
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if response is not None:
+            return response
+        raise error
+
+    async def _guarded_request(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        priority: Any = None,
+        deadline: Optional[SyncCastDeadline] = None,
+        **kwargs
+    ) -> "httpx.Response":
+        """
+        `_routed_request` whose outcome and latency are recorded by the circuit breaker, if any.
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await self._routed_request(method, url, endpoint, priority, deadline, **kwargs)
+
+        started = time.monotonic()
+        try:
+            response = await self._routed_request(method, url, endpoint, priority, deadline, **kwargs)
+        except SyncCastBackpressureError:
+            breaker.release(endpoint)
+            raise
+        except SyncCastDispatchError:
+            breaker.record(endpoint, time.monotonic() - started, failed=True)
+            raise
+        except BaseException:
+            breaker.release(endpoint)  # Not an outcome of the endpoint (a bug, or a cancelled task)
+            raise
+        breaker.record(endpoint, time.monotonic() - started, failed=response.status_code >= 500)
+        return response
+
+    def _handle_response(self, response: "httpx.Response") -> Union[Dict[str, Any], str]:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            self.logger.error(f"[AsyncSyncCastDispatcher] HTTP {e.response.status_code} - {e.response.text}")
+            raise SyncCastAPIError(
+                message=f"API responded with status {e.response.status_code}",
+                extra={
+                    "status_code": e.response.status_code,
+                    "body": e.response.text,
+                    "url": str(e.response.url)
+                }
+            ) from e
+
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    # Public request methods
+
+    async def post(
+        self,
+        endpoint: str,
+        deadline_ms: Union[float, SyncCastDeadline, None] = None,
+        **kwargs
+    ) -> Union[Dict[str, Any], str]:
+        """
+        POST to `endpoint`, within `deadline_ms` as a whole when given (see `SyncCastDispatcher.post`).
+        """
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow(endpoint):
+            if self.circuit_fallback is None and self.spool is None:
+                return self._circuit_open(endpoint, kwargs)
+            return await asyncio.get_running_loop().run_in_executor(  # Fallbacks may block (e.g. ORM)
+                None, functools.partial(self._circuit_open, endpoint, kwargs)
+            )
+
+        try:
+            deadline = SyncCastDeadline.coerce(deadline_ms)
+            original = dict(kwargs) if self.spool is not None else None
+            url = self._build_url(endpoint)
+            priority = self._priority_of(kwargs)
+            kwargs = self._prepare_body(endpoint, kwargs, body_kwarg="content")
+        except Exception:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release(endpoint)  # Never sent: give back a half-open slot
+            raise
+        self._log_request("post", url, **kwargs)
+        try:
+            response = await self._guarded_request("post", url, endpoint, priority, deadline, **kwargs)
+            return self._handle_response(response)
+        except (SyncCastDispatchError, SyncCastAPIError) as e:
+            if original is None or not self._spoolable(e):
+                raise
+            return await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(self._spool_failed, endpoint, original, e)
+            )
+
+    async def post_encoded(self, entries: Iterable[bytes]) -> Union[Dict[str, Any], str]:
+        """
+        Send pre-encoded batch entries (see `encode_fanout_entries`) as one batch request.
+        """
+        return await self.post(PushEndpoints.BATCH, content=encode_batch(entries))
+
+    async def get(self, endpoint: str, **kwargs) -> Union[Dict[str, Any], str]:
+        url = self._build_url(endpoint)
+        kwargs = self._prepare_body(endpoint, kwargs, body_kwarg="content")
+        self._log_request("get", url, **kwargs)
+        response = await self._safe_request("get", url, **kwargs)
+        return self._handle_response(response)
+
+    async def put(self, endpoint: str, **kwargs) -> Union[Dict[str, Any], str]:
+        url = self._build_url(endpoint)
+        kwargs = self._prepare_body(endpoint, kwargs, body_kwarg="content")
+        self._log_request("put", url, **kwargs)
+        response = await self._safe_request("put", url, **kwargs)
+        return self._handle_response(response)
+
+    async def delete(self, endpoint: str, **kwargs) -> Union[Dict[str, Any], str]:
+        url = self._build_url(endpoint)
+        kwargs = self._prepare_body(endpoint, kwargs, body_kwarg="content")
+        self._log_request("delete", url, **kwargs)
+        response = await self._safe_request("delete", url, **kwargs)
+        return self._handle_response(response)
@@ -0,0 +1,283 @@
+# Default package imports
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Iterable, Tuple, Deque
+
+# SyncCast payload serializers
+from synccast.core.serializers import SyncCastSerializer, get_serializer
+
+# SyncCast service endpoints
+from synccast.core.endpoints import PushEndpoints
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastDispatchError
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+def encode_batch_entry(
+    endpoint: str,
+    payload: Dict[str, Any],
+    serializer: Optional[SyncCastSerializer] = None
+) -> bytes:
+    """
+    Encode one `{"endpoint": ..., "payload": ...}` entry of a batch request.
+    """
+    serializer = serializer or get_serializer()
+    return (
+        b'{"endpoint":' + serializer.dumps(endpoint)
+        + b',"payload":' + serializer.dumps(payload)
+        + b'}'
+    )
+
+
+def encode_fanout_entries(
+    endpoint: str,
+    shared: Dict[str, Any],
+    recipients: Iterable[Tuple[str, str]],
+    serializer: Optional[SyncCastSerializer] = None
+) -> List[bytes]:
+    """
+    Encode one batch entry per `(user_id, topic)` recipient for a payload that
+    is otherwise identical. `shared` (the payload without `user_id` and
+    `topic`) is serialized once; each entry splices the recipient's fields
+    in front of it.
+    """
+    serializer = serializer or get_serializer()
+    dumps = serializer.dumps
+
+    body = dumps(shared)
+    head = b'{"endpoint":' + dumps(endpoint) + b',"payload":{"user_id":'
+    tail = (b',' + body[1:] if len(body) > 2 else b'}') + b'}'
+
+    return [head + dumps(user_id) + b',"topic":' + dumps(topic) + tail for user_id, topic in recipients]
+
+
+def encode_batch(entries: Iterable[bytes]) -> bytes:
+    """
+    Join encoded entries into the `PushEndpoints.BATCH` request body.
+    """
+    return b'{"events":[' + b",".join(entries) + b']}'
+
+
+class _BatchItem:
+    """
+    One queued event: its pre-encoded batch entry and the future resolved on flush.
+    """
+
+    __slots__ = ("body", "future")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.future: Future = Future()
+
+
+class SyncCastBatcher:
+    """
+    Micro-batching stage in front of `SyncCastDispatcher`.
+
+    Payloads submitted here are coalesced and sent to `PushEndpoints.BATCH` as a
+    single request of the form `{"events": [{"endpoint": ..., "payload": ...}]}`.
+    A batch is flushed when it reaches `max_batch_size` events, `max_batch_bytes`
+    of encoded payload, or when its oldest event has waited `max_linger_ms`.
+
+    Each submission returns a `concurrent.futures.Future` resolved with that
+    event's entry from the response `results` list (or the whole response when
+    the API does not return per-event results). The batcher exposes a
+    dispatcher-compatible `post(endpoint, json=...)`, so it can be handed to any
+    service in place of the dispatcher; `send_*` calls then return futures.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Any,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 512 * 1024,
+        max_linger_ms: float = 10,
+        endpoint: str = PushEndpoints.BATCH,
+        serializer: Optional[SyncCastSerializer] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.dispatcher = dispatcher
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_linger = max_linger_ms / 1000.0
+        self.endpoint = endpoint
+        self.serializer = serializer or getattr(dispatcher, "serializer", None) or get_serializer()
+        self.logger = logger_instance or logger
+
+        self._cond = threading.Condition()
+        self._pending: Deque[_BatchItem] = deque()
+        self._pending_bytes = 0
+        self._oldest: Optional[float] = None
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ── Submission ──────────────────────────────────────────────────────────────
+
+    def encode(self, endpoint: str, payload: Dict[str, Any]) -> bytes:
+        """
+        Encode one batch entry. Payloads are serialized exactly once, here.
+        """
+        return encode_batch_entry(endpoint, payload, self.serializer)
+
+    def submit(self, endpoint: str, payload: Dict[str, Any]) -> Future:
+        """
+        Queue one payload for `endpoint` and return a future for its result.
+        """
+        return self.submit_encoded(self.encode(endpoint, payload))
+
+    def submit_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> List[Future]:
+        """
+        Queue many `(endpoint, payload)` pairs at once; returns their futures in order.
+        """
+        return self.submit_encoded_many(self.encode(ep, payload) for ep, payload in items)
+
+    def submit_encoded(self, body: bytes) -> Future:
+        """
+        Queue an already encoded batch entry (see `encode`).
+        """
+        return self.submit_encoded_many([body])[0]
+
+    def submit_encoded_many(self, bodies: Iterable[bytes]) -> List[Future]:
+        items = [_BatchItem(body) for body in bodies]
+
+        with self._cond:
+            if self._closed:
+                raise SyncCastDispatchError(
+                    message="Batcher is closed",
+                    extra={"endpoint": self.endpoint}
+                )
+            self._ensure_worker()
+
+            if self._oldest is None and items:
+                self._oldest = time.monotonic()
+            for item in items:
+                self._pending.append(item)
+                self._pending_bytes += len(item.body)
+            self._cond.notify()
+
+        return [item.future for item in items]
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Future:
+        """
+        Dispatcher-compatible entry point used by the services.
+        """
+        return self.submit(endpoint, json or {})
+
+    def post_encoded(self, entries: Iterable[bytes]) -> List[Future]:
+        """
+        Queue pre-encoded batch entries (see `encode_fanout_entries`).
+        """
+        return self.submit_encoded_many(entries)
+
+    # ── Flushing ────────────────────────────────────────────────────────────────
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="synccast-batcher", daemon=True
+            )
+            self._thread.start()
+
+    def _is_due(self) -> bool:
+        if not self._pending:
+            return False
+        return (
+            self._closed
+            or self._flush_requested
+            or len(self._pending) >= self.max_batch_size
+            or self._pending_bytes >= self.max_batch_bytes
+            or time.monotonic() - self._oldest >= self.max_linger
+        )
+
+    def _take_batch(self) -> List[_BatchItem]:
+        """
+        Cut the next batch off the pending list, honoring size and byte budgets.
+        Must be called with the condition held.
+        """
+        batch, size = [], 0
+        while self._pending and len(batch) < self.max_batch_size:
+            item_size = len(self._pending[0].body)
+            if batch and size + item_size > self.max_batch_bytes:
+                break
+            batch.append(self._pending.popleft())
+            size += item_size
+
+        self._pending_bytes -= size
+        self._oldest = time.monotonic() if self._pending else None
+        self._flush_requested = self._flush_requested and bool(self._pending)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._is_due():
+                    if self._closed and not self._pending:
+                        return
+                    timeout = None
+                    if self._oldest is not None:
+                        timeout = max(0.0, self.max_linger - (time.monotonic() - self._oldest))
+                    self._cond.wait(timeout)
+                batch = self._take_batch()
+                self._in_flight += 1
+
+            try:
+                self._send(batch)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _send(self, batch: List[_BatchItem]) -> None:
+        body = encode_batch(item.body for item in batch)
+
+        try:
+            response = self.dispatcher.post(self.endpoint, data=body)
+        except Exception as e:
+            self.logger.error(f"[SyncCastBatcher] Batch of {len(batch)} events failed: {e}")
+            for item in batch:
+                item.future.set_exception(e)
+            return
+
+        results = response.get("results") if isinstance(response, dict) else None
+        if isinstance(results, list) and len(results) == len(batch):
+            for item, result in zip(batch, results):
+                item.future.set_result(result)
+        else:
+            for item in batch:
+                item.future.set_result(response)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send everything queued so far and wait until those requests complete.
+
+        Returns:
+            bool: False if `timeout` elapsed before the queue drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = bool(self._pending)
+            self._cond.notify_all()
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting events, flush what is queued and stop the flusher thread.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -0,0 +1,204 @@
+# Default package imports
+import time
+import logging
+import threading
+from collections import deque
+from typing import Optional, Dict, Any, List, Callable, Deque, Tuple
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Gauge values of `breaker.<endpoint>.state`
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class _Circuit:
+    """
+    State of one endpoint's circuit and its sliding window of recent calls.
+    """
+
+    __slots__ = ("state", "calls", "opened_at", "trials", "trial_successes")
+
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.calls: Deque[Tuple[bool, bool]] = deque(maxlen=window)  # (failed, slow)
+        self.opened_at = 0.0
+        self.trials = 0
+        self.trial_successes = 0
+
+
+class SyncCastCircuitBreaker:
+    """
+    Per-endpoint circuit breaker for the SyncCast API.
+
+    Each endpoint is judged on its last `window` calls. Once at least
+    `min_calls` were seen, the circuit opens when the share of failures
+    (connection errors, timeouts, 5xx) reaches `failure_rate`, or the share of
+    calls slower than `slow_call_seconds` reaches `slow_call_rate`. While
+    open, `allow()` is False and callers fail fast. After `open_seconds` the
+    circuit is half-open: up to `half_open_calls` trial calls go through, and
+    it closes when they all succeed or re-opens on the first failure.
+
+    `on_state_change(endpoint, old_state, new_state)` hooks (passed in or added
+    with `add_listener()`) run on every transition.
+
+    Metrics recorded (see `SyncCastMetrics`): gauge `breaker.<endpoint>.state`
+    (0 closed, 1 half-open, 2 open), counters `breaker.opened` and `breaker.rejected`.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_seconds: Optional[float] = 2.0,
+        slow_call_rate: Optional[float] = 0.8,
+        window: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1,
+        on_state_change: Optional[Callable[[str, str, str], Any]] = None,
+        metrics: Optional[SyncCastMetrics] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.window = window
+        self.min_calls = min(min_calls, window)
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+        self._listeners: List[Callable[[str, str, str], Any]] = [on_state_change] if on_state_change else []
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def add_listener(self, listener: Callable[[str, str, str], Any]) -> None:
+        """
+        Call `listener(endpoint, old_state, new_state)` on every transition.
+        """
+        self._listeners.append(listener)
+
+    def state(self, endpoint: str) -> str:
+        """
+        Current state of `endpoint`'s circuit ("closed", "open" or "half_open").
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit is not None else CLOSED
+
+    def _circuit(self, endpoint: str) -> _Circuit:
+        """
+        Must be called with the lock held.
+        """
+        circuit = self._circuits.get(endpoint)
+        if circuit is None:
+            circuit = self._circuits[endpoint] = _Circuit(self.window)
+        return circuit
+
+    def _set_state(self, endpoint: str, circuit: _Circuit, state: str, transitions: List[Tuple[str, str]]) -> None:
+        """
+        Must be called with the lock held; listeners run after it is released.
+        """
+        transitions.append((circuit.state, state))
+        circuit.state = state
+        circuit.trials = circuit.trial_successes = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+            self.metrics.incr("breaker.opened")
+        elif state == CLOSED:
+            circuit.calls.clear()
+
+    def _notify(self, endpoint: str, transitions: List[Tuple[str, str]]) -> None:
+        for old, new in transitions:
+            self.metrics.gauge(f"breaker.{endpoint.strip('/')}.state", STATE_VALUES[new])
+            log = self.logger.warning if new == OPEN else self.logger.info
+            log(f"[SyncCastCircuitBreaker] {endpoint}: {old} -> {new}")
+            for listener in self._listeners:
+                try:
+                    listener(endpoint, old, new)
+                except Exception as e:
+                    self.logger.error(f"[SyncCastCircuitBreaker] State change hook failed: {e}")
+
+    def allow(self, endpoint: str) -> bool:
+        """
+        Whether a call to `endpoint` may go out now. In half-open state this
+        takes one of the trial slots, so every allowed call must be followed
+        by `record()` or `release()`.
+        """
+        transitions: List[Tuple[str, str]] = []
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.open_seconds:
+                self._set_state(endpoint, circuit, HALF_OPEN, transitions)
+
+            if circuit.state == CLOSED:
+                allowed = True
+            elif circuit.state == HALF_OPEN and circuit.trials < self.half_open_calls:
+                circuit.trials += 1
+                allowed = True
+            else:
+                allowed = False
+
+        self._notify(endpoint, transitions)
+        if not allowed:
+            self.metrics.incr("breaker.rejected")
+        return allowed
+
+    def release(self, endpoint: str) -> None:
+        """
+        Give back a slot taken by `allow()` for a call that was never made.
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == HALF_OPEN and circuit.trials:
+                circuit.trials -= 1
+
+    def record(self, endpoint: str, elapsed: float, failed: bool) -> None:
+        """
+        Record the outcome of a call allowed by `allow()`.
+        """
+        slow = self.slow_call_seconds is not None and elapsed >= self.slow_call_seconds
+        transitions: List[Tuple[str, str]] = []
+
+        with self._lock:
+            circuit = self._circuit(endpoint)
+
+            if circuit.state == HALF_OPEN:
+                if failed or slow:
+                    self._set_state(endpoint, circuit, OPEN, transitions)
+                else:
+                    circuit.trial_successes += 1
+                    if circuit.trial_successes >= self.half_open_calls:
+                        self._set_state(endpoint, circuit, CLOSED, transitions)
+
+            elif circuit.state == CLOSED:
+                circuit.calls.append((failed, slow))
+                calls = len(circuit.calls)
+                if calls >= self.min_calls:
+                    failures = sum(1 for call_failed, _ in circuit.calls if call_failed)
+                    slow_calls = sum(1 for _, call_slow in circuit.calls if call_slow)
+                    if failures / calls >= self.failure_rate or (
+                        self.slow_call_rate is not None and slow_calls / calls >= self.slow_call_rate
+                    ):
+                        self._set_state(endpoint, circuit, OPEN, transitions)
+
+        self._notify(endpoint, transitions)
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """
+        Close `endpoint`'s circuit (every circuit when omitted).
+        """
+        with self._lock:
+            if endpoint is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(endpoint, None)
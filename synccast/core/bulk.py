@@ -0,0 +1,120 @@
+# Default package imports
+import time
+import threading
+from itertools import islice
+from typing import Optional, Dict, Any, List, Iterable, Iterator
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Lazily split `items` (any iterable, including generators) into lists of `size`.
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class SyncCastRatePacer:
+    """
+    Spaces out sends shared by several threads so that, together, they do not
+    exceed `rate` events per second.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def reserve(self, count: int = 1) -> float:
+        """
+        Reserve `count` events without waiting (e.g. to `asyncio.sleep` instead).
+
+        Returns:
+            float: Seconds until they may be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + count * self.interval
+        return start - now
+
+    def acquire(self, count: int = 1) -> float:
+        """
+        Reserve `count` events and sleep until they may be sent.
+
+        Returns:
+            float: Seconds waited.
+        """
+        wait = self.reserve(count)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class SyncCastBulkResult:
+    """
+    Summary of a bulk send. Only failed recipients are kept by id (to be
+    retried); successes are counted, so memory does not grow with the
+    recipient count. Recipients diverted to the spool or outbox are counted
+    as `spooled`, not `sent`: they are delivered when it is replayed.
+    `chunks` holds one entry per chunk:
+    `{"index", "size", "failed", "spooled", "latency", "error"}`.
+    """
+
+    def __init__(self):
+        self.sent = 0
+        self.spooled = 0
+        self.failed_ids: List[str] = []
+        self.chunks: List[Dict[str, Any]] = []
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def failed(self) -> int:
+        return len(self.failed_ids)
+
+    @property
+    def total(self) -> int:
+        return self.sent + self.failed + self.spooled
+
+    def record(
+        self,
+        index: int,
+        size: int,
+        failed_ids: List[str],
+        latency: float,
+        error: Optional[str] = None,
+        spooled: int = 0
+    ) -> None:
+        with self._lock:
+            self.sent += size - len(failed_ids) - spooled
+            self.spooled += spooled
+            self.failed_ids.extend(failed_ids)
+            self.chunks.append({
+                "index": index,
+                "size": size,
+                "failed": len(failed_ids),
+                "spooled": spooled,
+                "latency": latency,
+                "error": error,
+            })
+
+    def as_dict(self) -> Dict[str, Any]:
+        latencies = [chunk["latency"] for chunk in self.chunks]
+        return {
+            "total": self.total,
+            "sent": self.sent,
+            "failed": self.failed,
+            "failed_ids": list(self.failed_ids),
+            "spooled": self.spooled,
+            "chunks": len(self.chunks),
+            "chunk_latency_avg": sum(latencies) / len(latencies) if latencies else 0.0,
+            "chunk_latency_max": max(latencies, default=0.0),
+            "elapsed": self.elapsed,
+        }
+
+    def __repr__(self) -> str:
+        return f"SyncCastBulkResult(sent={self.sent}, failed={self.failed}, spooled={self.spooled}, chunks={len(self.chunks)})"
@@ -0,0 +1,266 @@
+# Default package imports
+import time
+import atexit
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Iterable, Tuple, Callable
+
+# SyncCast enums
+from synccast.core.enums import SyncCastEventType
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastDispatchError
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+def deep_merge(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return `base` updated with `update`, merging nested dicts key by key.
+    Any other value in `update` (lists included) replaces the one in `base`.
+    """
+    merged = dict(base)
+    for key, value in update.items():
+        current = merged.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged[key] = deep_merge(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class _PendingUpdate:
+    """
+    Latest update for one endpoint/topic and the futures of every update it replaced.
+    """
+
+    __slots__ = ("endpoint", "payload", "kwargs", "futures", "deadline")
+
+    def __init__(self, endpoint: str, payload: Dict[str, Any], kwargs: Dict[str, Any], deadline: float):
+        self.endpoint = endpoint
+        self.payload = payload
+        self.kwargs = kwargs
+        self.futures: List[Future] = []
+        self.deadline = deadline
+
+
+def _chain(source: Future, targets: List[Future]) -> None:
+    def resolve(done: Future) -> None:
+        error = done.exception()
+        for target in targets:
+            if error is not None:
+                target.set_exception(error)
+            else:
+                target.set_result(done.result())
+    source.add_done_callback(resolve)
+
+
+class SyncCastCoalescer:
+    """
+    Last-write-wins stage for state-style events (UI sync by default).
+
+    The first update for an endpoint/topic opens a `window_ms` window; updates
+    arriving for the same topic before it closes replace the pending one
+    (or are deep-merged into it with `merge=True`, for partial updates), and
+    only the final state is sent when the window expires. Pending updates are
+    also sent by `flush()` / `close()` and at interpreter exit.
+
+    `post()` returns a `Future`; every update collapsed into one send resolves
+    with that send's result. Events of other types pass straight through.
+
+    Metrics recorded (see `SyncCastMetrics`):
+        - counters `coalesce.flushed` (sends) and `coalesce.collapsed` (updates
+          that never went out on their own).
+        - timer-style sample `coalesce.updates_per_flush` (updates per send).
+    """
+
+    def __init__(
+        self,
+        dispatcher: Any,
+        window_ms: float = 100,
+        merge: bool = False,
+        event_types: Iterable[Any] = (SyncCastEventType.DATA_SYNC,),
+        metrics: Optional[SyncCastMetrics] = None,
+        flush_on_exit: bool = True,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.dispatcher = dispatcher
+        self.window = window_ms / 1000.0
+        self.merge = merge
+        self.event_types = {getattr(event_type, "value", event_type) for event_type in event_types}
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+        self._cond = threading.Condition()
+        self._pending: Dict[Tuple[str, str], _PendingUpdate] = {}
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._flush_on_exit = flush_on_exit
+        if flush_on_exit:
+            atexit.register(self.close)
+
+    # ── Submission ──────────────────────────────────────────────────────────────
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        Dispatcher-compatible entry point used by the services.
+        """
+        payload = json or {}
+        topic = payload.get("topic")
+        if payload.get("type") not in self.event_types or not topic:
+            return self.dispatcher.post(endpoint, json=payload, **kwargs)
+
+        future: Future = Future()
+        key = (endpoint, topic)
+
+        with self._cond:
+            if self._closed:
+                raise SyncCastDispatchError(
+                    message="Coalescer is closed",
+                    extra={"endpoint": endpoint, "topic": topic}
+                )
+
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = _PendingUpdate(
+                    endpoint, payload, kwargs, time.monotonic() + self.window
+                )
+                self._ensure_worker()
+                self._cond.notify()
+            else:
+                if self.merge:
+                    data = deep_merge(pending.payload.get("data") or {}, payload.get("data") or {})
+                    payload = {**payload, "data": data}
+                pending.payload, pending.kwargs = payload, kwargs
+            pending.futures.append(future)
+
+        return future
+
+    @property
+    def serializer(self) -> Any:
+        return getattr(self.dispatcher, "serializer", None)
+
+    @property
+    def post_encoded(self) -> Optional[Callable[[Iterable[bytes]], Any]]:
+        """
+        The wrapped dispatcher's `post_encoded`, if it has one: pre-encoded
+        batches (see `encode_fanout_entries`) pass straight through.
+        """
+        return getattr(self.dispatcher, "post_encoded", None)
+
+    # ── Flushing ────────────────────────────────────────────────────────────────
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="synccast-coalescer", daemon=True
+            )
+            self._thread.start()
+
+    def _take_due(self) -> List[_PendingUpdate]:
+        """
+        Remove and return the updates whose window has closed (all of them when
+        flushing or closing). Pending updates are kept in arrival order, so the
+        due ones are always at the front. Must be called with the condition held.
+        """
+        flush_all = self._closed or self._flush_requested
+        now = time.monotonic()
+
+        due = []
+        for key, pending in self._pending.items():
+            if not flush_all and pending.deadline > now:
+                break
+            due.append(key)
+
+        self._flush_requested = False
+        return [self._pending.pop(key) for key in due]
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._pending:
+                        if self._closed or self._flush_requested:
+                            break
+                        remaining = next(iter(self._pending.values())).deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+                due = self._take_due()
+                self._in_flight += 1
+
+            try:
+                for pending in due:
+                    self._send(pending)
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _send(self, pending: _PendingUpdate) -> None:
+        collapsed = len(pending.futures) - 1
+        self.metrics.incr("coalesce.flushed")
+        self.metrics.incr("coalesce.collapsed", collapsed)
+        self.metrics.observe("coalesce.updates_per_flush", len(pending.futures))
+        if collapsed and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "[SyncCastCoalescer] %s collapsed %d updates into one", pending.payload.get("topic"), collapsed + 1
+            )
+
+        try:
+            result = self.dispatcher.post(pending.endpoint, json=pending.payload, **pending.kwargs)
+        except Exception as e:
+            self.logger.error(f"[SyncCastCoalescer] Update to {pending.payload.get('topic')} failed: {e}")
+            for future in pending.futures:
+                future.set_exception(e)
+            return
+
+        if isinstance(result, Future):
+            _chain(result, pending.futures)
+        else:
+            for future in pending.futures:
+                future.set_result(result)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send every pending update now, without waiting for its window.
+
+        Returns:
+            bool: False if `timeout` elapsed before they were sent.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = bool(self._pending)
+            self._cond.notify_all()
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting updates, send what is pending and stop the flusher thread.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        if self._flush_on_exit:
+            atexit.unregister(self.close)
+            self._flush_on_exit = False
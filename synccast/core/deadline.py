@@ -0,0 +1,80 @@
+# Default package imports
+import time
+from typing import Optional, Dict, Any, List, Union
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastDeadlineError
+
+
+class SyncCastDeadline:
+    """
+    Total time budget of one publish, started when it is created.
+
+    Unlike the dispatcher's per-attempt `timeout`, the budget covers every
+    attempt, backoff and rate-limit wait of the call; each of them is recorded
+    so that `error()` can report where the time went. A deadline created by a
+    service call keeps counting while the event waits in a queueing stage.
+    """
+
+    __slots__ = ("budget", "started", "expires", "phases")
+
+    def __init__(self, budget_ms: float):
+        self.budget = budget_ms / 1000.0
+        self.started = time.monotonic()
+        self.expires = self.started + self.budget
+        self.phases: List[Dict[str, Any]] = []
+
+    @classmethod
+    def coerce(cls, value: Union['SyncCastDeadline', float, None]) -> Optional['SyncCastDeadline']:
+        """
+        A deadline from a `SyncCastDeadline` or a budget in milliseconds.
+        """
+        if value is None or isinstance(value, cls):
+            return value
+        return cls(value)
+
+    def remaining(self) -> float:
+        """
+        Seconds left in the budget (negative once exceeded).
+        """
+        return self.expires - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def record(self, phase: str, seconds: float, **details: Any) -> None:
+        """
+        Account `seconds` spent in `phase` ("attempt", "backoff", "rate_limit", ...).
+        """
+        self.phases.append({"phase": phase, "ms": round(seconds * 1000, 3), **details})
+
+    def sleep(self, seconds: float, phase: str) -> None:
+        """
+        Sleep for `seconds` (capped at the remaining budget) and record it.
+        """
+        seconds = max(0.0, min(seconds, self.remaining()))
+        if seconds:
+            time.sleep(seconds)
+        self.record(phase, seconds)
+
+    def breakdown(self) -> Dict[str, Any]:
+        """
+        Budget, elapsed time, time per phase and the individual phases.
+        """
+        totals: Dict[str, float] = {}
+        for phase in self.phases:
+            totals[phase["phase"]] = round(totals.get(phase["phase"], 0.0) + phase["ms"], 3)
+        return {
+            "deadline_ms": round(self.budget * 1000, 3),
+            "elapsed_ms": round((time.monotonic() - self.started) * 1000, 3),
+            "spent_ms": totals,
+            "phases": list(self.phases),
+        }
+
+    def error(self, endpoint: str, **extra: Any) -> SyncCastDeadlineError:
+        attempts = sum(1 for phase in self.phases if phase["phase"] == "attempt")
+        return SyncCastDeadlineError(
+            message=f"Deadline of {self.budget * 1000:g}ms exceeded after {attempts} attempt(s)",
+            extra={"endpoint": endpoint, **self.breakdown(), **extra}
+        )
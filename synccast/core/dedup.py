@@ -0,0 +1,147 @@
+# Default package imports
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Iterable, Tuple, Callable
+
+# SyncCast payload serializers
+from synccast.core.serializers import SyncCastSerializer, get_serializer
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+# Payload fields that make up an event's content fingerprint (`by_content=True`)
+CONTENT_FIELDS = ("type", "user_id", "topic", "data")
+
+
+class SyncCastDeduplicator:
+    """
+    Suppresses repeated publishes of the same event within `window_seconds`.
+
+    An event is identified by its endpoint, topic and `event_id` (so the
+    per-recipient posts of one broadcast stay distinct), or, with
+    `by_content=True`, by a digest of its type, user, topic and data — for
+    callers that cannot pass a stable `event_id` (a double-submitted form, a
+    task retried after it already published). Events without an ID pass
+    straight through.
+
+    The first publish of a key is forwarded and its result remembered; a
+    repeat within the window returns that result (or
+    `{"duplicate": True, "event_id": ...}` while the first is still in flight)
+    without reaching the dispatcher. A publish that fails, or whose `Future`
+    fails, is forgotten so it can be retried. At most `max_keys` recent keys
+    are kept, oldest evicted first.
+
+    Metrics recorded (see `SyncCastMetrics`): counter `dedup.suppressed`.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Any,
+        window_seconds: float = 60.0,
+        max_keys: int = 100_000,
+        by_content: bool = False,
+        serializer: Optional[SyncCastSerializer] = None,
+        metrics: Optional[SyncCastMetrics] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.dispatcher = dispatcher
+        self.window = window_seconds
+        self.max_keys = max_keys
+        self.by_content = by_content
+        self.serializer = serializer or getattr(dispatcher, "serializer", None) or get_serializer()
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+        self._lock = threading.Lock()
+        self._recent: "OrderedDict[Tuple[Any, ...], List[Any]]" = OrderedDict()  # key -> [expires, result]
+
+    def key(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Deduplication key of an event, or None if it cannot be identified.
+        """
+        if self.by_content:
+            content = self.serializer.dumps({name: payload.get(name) for name in CONTENT_FIELDS})
+            return (endpoint, hashlib.blake2b(content, digest_size=16).digest())
+
+        event_id = payload.get("event_id")
+        if event_id is None:
+            return None
+        return (endpoint, payload.get("topic"), event_id)
+
+    def _expire(self, now: float) -> None:
+        """
+        Must be called with the lock held. Keys are inserted in expiry order,
+        so only the oldest ones need checking.
+        """
+        while self._recent:
+            key, entry = next(iter(self._recent.items()))
+            if entry[0] > now:
+                break
+            del self._recent[key]
+
+    def forget(self, key: Tuple[Any, ...], entry: Optional[List[Any]] = None) -> None:
+        """
+        Drop `key` (only if it still maps to `entry`, when given).
+        """
+        with self._lock:
+            if entry is None or self._recent.get(key) is entry:
+                self._recent.pop(key, None)
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        Dispatcher-compatible entry point used by the services.
+        """
+        key = self.key(endpoint, json) if json else None
+        if key is None:
+            return self.dispatcher.post(endpoint, json=json, **kwargs)
+
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            previous = self._recent.get(key)
+            if previous is None:
+                entry = self._recent[key] = [now + self.window, None]
+                while len(self._recent) > self.max_keys:
+                    self._recent.popitem(last=False)
+
+        if previous is not None:
+            self.metrics.incr("dedup.suppressed")
+            self.logger.debug("[SyncCastDeduplicator] Suppressed duplicate %s on %s", json.get("event_id"), endpoint)
+            if previous[1] is not None:
+                return previous[1]
+            return {"duplicate": True, "event_id": json.get("event_id")}
+
+        try:
+            result = self.dispatcher.post(endpoint, json=json, **kwargs)
+        except Exception:
+            self.forget(key, entry)
+            raise
+
+        entry[1] = result
+        if isinstance(result, Future):
+            result.add_done_callback(lambda done: self._on_delivered(key, entry, done))
+        return result
+
+    @property
+    def post_encoded(self) -> Optional[Callable[[Iterable[bytes]], Any]]:
+        """
+        The wrapped dispatcher's `post_encoded`, if it has one: pre-encoded
+        batches (see `encode_fanout_entries`) pass straight through.
+        """
+        return getattr(self.dispatcher, "post_encoded", None)
+
+    def _on_delivered(self, key: Tuple[Any, ...], entry: List[Any], done: Future) -> None:
+        if done.cancelled() or done.exception() is not None:
+            self.forget(key, entry)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            self._recent.clear()
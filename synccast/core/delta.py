@@ -0,0 +1,212 @@
+# Default package imports
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Iterable, Tuple, Callable
+
+# SyncCast payload serializers
+from synccast.core.serializers import SyncCastSerializer, get_serializer
+
+# SyncCast enums
+from synccast.core.enums import SyncCastEventType
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    RFC 6902 operations (`add`, `remove`, `replace`) turning `old` into `new`.
+
+    Objects are diffed key by key and equal-length arrays index by index;
+    arrays that changed length are replaced whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif old[key] != value:
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (before, after) in enumerate(zip(old, new)):
+            if before != after:
+                ops.extend(json_diff(before, after, f"{path}/{index}"))
+        return ops
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, ops: Iterable[Dict[str, Any]]) -> Any:
+    """
+    Apply `add` / `remove` / `replace` operations produced by `json_diff`.
+    `document` is modified in place; the (possibly replaced) root is returned.
+    """
+    for op in ops:
+        if op["path"] == "":
+            document = op["value"]
+            continue
+
+        *parents, last = [_unescape(token) for token in op["path"].split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+
+        if isinstance(target, list):
+            index = len(target) if last == "-" else int(last)
+            if op["op"] == "add":
+                target.insert(index, op["value"])
+            elif op["op"] == "remove":
+                del target[index]
+            else:
+                target[index] = op["value"]
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = op["value"]
+    return document
+
+
+class SyncCastDeltaEncoder:
+    """
+    Delta-encoding stage for UI sync updates.
+
+    Remembers the last document sent per topic (bounded LRU of `max_topics`)
+    and replaces `data` with an RFC 6902 patch against it. Each payload gains
+    a `sync` block telling subscribers how to apply it:
+
+        {"sync": {"mode": "snapshot", "version": 7}, "data": {...full document...}}
+        {"sync": {"mode": "patch", "version": 8, "base_version": 7}, "data": [...ops...]}
+
+    A full snapshot is sent when the topic is not cached, every
+    `keyframe_interval` versions (so late subscribers resynchronize), when
+    the patch would not be smaller than the snapshot, and after `invalidate()`
+    — call it when a subscriber reports a version gap. A failed delivery
+    invalidates its topic as well, so the next update is a snapshot.
+
+    Events of other types pass straight through.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Any,
+        max_topics: int = 1024,
+        keyframe_interval: int = 100,
+        event_types: Iterable[Any] = (SyncCastEventType.DATA_SYNC,),
+        serializer: Optional[SyncCastSerializer] = None,
+        metrics: Optional[SyncCastMetrics] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.dispatcher = dispatcher
+        self.max_topics = max_topics
+        self.keyframe_interval = keyframe_interval
+        self.event_types = {getattr(event_type, "value", event_type) for event_type in event_types}
+        self.serializer = serializer or getattr(dispatcher, "serializer", None) or get_serializer()
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+        self._lock = threading.Lock()
+        self._documents: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+
+    def invalidate(self, topic: Optional[str] = None) -> None:
+        """
+        Forget the last document of `topic` (of every topic when omitted).
+        """
+        with self._lock:
+            if topic is None:
+                self._documents.clear()
+            else:
+                self._documents.pop(topic, None)
+
+    def encode(self, topic: str, data: Any) -> Tuple[Dict[str, Any], Any]:
+        """
+        The `sync` block and `data` to send for the new document of `topic`.
+        """
+        snapshot = self.serializer.dumps(data)
+        document = self.serializer.loads(snapshot)  # Private copy; callers may mutate `data`
+
+        with self._lock:
+            cached = self._documents.get(topic)
+            version = 1 if cached is None else cached[0] + 1
+            self._documents[topic] = (version, document)
+            self._documents.move_to_end(topic)
+            while len(self._documents) > self.max_topics:
+                self._documents.popitem(last=False)
+
+        if cached is not None and version % self.keyframe_interval:
+            ops = json_diff(cached[1], document)
+            patch = self.serializer.dumps(ops)
+            if len(patch) < len(snapshot):
+                self.metrics.incr("delta.patches")
+                self.metrics.incr("delta.bytes_saved", len(snapshot) - len(patch))
+                return {"mode": "patch", "version": version, "base_version": version - 1}, ops
+
+        self.metrics.incr("delta.snapshots")
+        return {"mode": "snapshot", "version": version}, document
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        Dispatcher-compatible entry point used by the services.
+        """
+        payload = json or {}
+        topic = payload.get("topic")
+        if payload.get("type") not in self.event_types or not topic:
+            return self.dispatcher.post(endpoint, json=payload, **kwargs)
+
+        sync, data = self.encode(topic, payload.get("data") or {})
+        try:
+            result = self.dispatcher.post(endpoint, json={**payload, "sync": sync, "data": data}, **kwargs)
+        except Exception:
+            self.invalidate(topic)
+            raise
+
+        if isinstance(result, Future):
+            result.add_done_callback(lambda done: self._on_delivered(topic, done))
+        return result
+
+    @property
+    def post_encoded(self) -> Optional[Callable[[Iterable[bytes]], Any]]:
+        """
+        Pass pre-encoded batches (see `encode_fanout_entries`) through to the
+        wrapped dispatcher's `post_encoded`, if it has one. Their updates are
+        sent whole, so the topics they touch restart from a snapshot.
+        """
+        if getattr(self.dispatcher, "post_encoded", None) is None:
+            return None
+        return self._post_encoded
+
+    def _post_encoded(self, entries: Iterable[bytes]) -> Any:
+        entries = list(entries)
+        for entry in entries:
+            payload = self.serializer.loads(entry).get("payload") or {}
+            if payload.get("type") in self.event_types and payload.get("topic"):
+                self.invalidate(payload["topic"])
+        return self.dispatcher.post_encoded(entries)
+
+    def _on_delivered(self, topic: str, done: Future) -> None:
+        if done.exception() is not None:
+            self.invalidate(topic)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self.invalidate()
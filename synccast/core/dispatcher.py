@@ -1,26 +1,361 @@
 # Default package imports
+import os
+import time
+import hashlib
 import requests
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Iterable, Callable, List
 
 # syncCast sdk singelton instance
 from synccast import synccast
 
+# SyncCast payload serializers
+from synccast.core.serializers import SyncCastSerializer, get_serializer
+
+# SyncCast request body compression
+from synccast.core.compression import SyncCastCompressor, get_compressor
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# SyncCast client-side rate limiting
+from synccast.core.ratelimit import SyncCastRateLimiter, parse_retry_after
+
+# SyncCast circuit breaker
+from synccast.core.breaker import SyncCastCircuitBreaker
+
+# SyncCast deadline budgets
+from synccast.core.deadline import SyncCastDeadline
+
+# SyncCast multi-endpoint routing
+from synccast.core.routing import SyncCastEndpointRouter
+
+# SyncCast enums
+from synccast.core.enums import SyncCastPriorityLevel
+
+# SyncCast service endpoints and batch encoding
+from synccast.core.endpoints import PushEndpoints
+from synccast.core.batching import encode_batch
+
 # SyncCast custom exceptions
 from synccast.exceptions.types import (
     SyncCastDispatchError, 
+    SyncCastBackpressureError,
+    SyncCastCircuitOpenError,
+    SyncCastDeadlineError,
     SyncCastAPIError
 )
 
 # logger instance
 logger = logging.getLogger(__name__)
 
-class SyncCastDispatcher:
+# Per-thread switches turning urllib3 retries off for deadline-bound attempts
+# and for attempts that fail over to another base URL
+_attempt_mode = threading.local()
+
+
+class _SyncCastAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter` whose retry policy can be switched off for the current
+    thread, so deadline-bound calls and failover attempts share the
+    connection pool while scheduling their own retries.
+    """
+
+    @property
+    def max_retries(self) -> Retry:
+        if getattr(_attempt_mode, "single", False) or getattr(_attempt_mode, "failover", False):
+            return Retry(0, read=False)
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, value: Retry) -> None:
+        self._max_retries = value
+
+
+class SyncCastDispatcherBase:
+    """
+    Transport-agnostic configuration shared by the sync and async dispatchers:
+    base URL, default headers, credential injection, body encoding and compression.
+    """
+
+    serializer: SyncCastSerializer
+    metrics: SyncCastMetrics
+
+    # Statuses retried (within the retry count / deadline budget)
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Header carrying the event ID (or body digest), identical on every retry of a request
+    IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+    # Request body compression (off unless `with_compression()` is called)
+    compressor: Optional[SyncCastCompressor] = None
+    compress_threshold: int = 16 * 1024
+    compress_thresholds: Dict[str, int] = {}
+
+    # Shared client-side rate limiter (off unless `with_rate_limiter()` is called)
+    rate_limiter: Optional[SyncCastRateLimiter] = None
+    app_id: Optional[str] = None
+
+    # Circuit breaker (off unless `with_circuit_breaker()` is called)
+    circuit_breaker: Optional[SyncCastCircuitBreaker] = None
+    circuit_fallback: Optional[Callable[[str, Any], Any]] = None
+
+    # Spool for events that could not be delivered (off unless `with_spool()` is called)
+    spool: Optional[Callable[[str, Any], Any]] = None
+
+    # Several base URLs chosen by latency / error rate (off unless `with_router()` is called)
+    router: Optional[SyncCastEndpointRouter] = None
+    hedge_priorities: frozenset = frozenset()
+
+    def with_serializer(self, serializer: Union[SyncCastSerializer, str]) -> 'SyncCastDispatcherBase':
+        self.serializer = get_serializer(serializer) if isinstance(serializer, str) else serializer
+        return self
+
+    def with_compression(
+        self,
+        codec: Union[SyncCastCompressor, str] = "gzip",
+        threshold: int = 16 * 1024,
+        per_endpoint: Optional[Dict[str, int]] = None
+    ) -> 'SyncCastDispatcherBase':
+        """
+        Compress request bodies of at least `threshold` bytes (overridable per
+        endpoint) with `codec` ("gzip", "zstd", "br", "auto") and send the
+        matching `Content-Encoding`. The SyncCast API must accept that encoding.
+        """
+        self.compressor = get_compressor(codec) if isinstance(codec, str) else codec
+        self.compress_threshold = threshold
+        self.compress_thresholds = dict(per_endpoint or {})
+        return self
+
+    def with_rate_limiter(self, limiter: SyncCastRateLimiter) -> 'SyncCastDispatcherBase':
+        """
+        Pace requests through `limiter` (shareable between dispatchers), which
+        then also handles 429 responses and their `Retry-After`.
+        """
+        self.rate_limiter = limiter
+        return self
+
+    def with_circuit_breaker(
+        self,
+        breaker: SyncCastCircuitBreaker,
+        fallback: Optional[Callable[[str, Any], Any]] = None
+    ) -> 'SyncCastDispatcherBase':
+        """
+        Fail fast while `breaker` (shareable between dispatchers) holds the
+        endpoint's circuit open. With `fallback(endpoint, payload)`, rejected
+        posts are handed to it instead (e.g. `SyncCastOutboxFallback` to spool
+        them) and its return value is returned.
+        """
+        self.circuit_breaker = breaker
+        self.circuit_fallback = fallback
+        return self
+
+    def with_spool(self, spool: Optional[Callable[[str, Any], Any]]) -> 'SyncCastDispatcherBase':
+        """
+        Write posts that still fail once retries are exhausted (connection
+        errors, timeouts, 429 and 5xx responses) to `spool` (a `SyncCastSpool`)
+        and return its result instead of raising. The spool is also the
+        circuit breaker's fallback when none is set.
+        """
+        self.spool = spool
+        return self
+
+    def _circuit_open(self, endpoint: str, kwargs: Dict[str, Any]) -> Any:
+        """
+        Handle a post rejected by the open circuit: divert it to the fallback or fail fast.
+        """
+        fallback = self.circuit_fallback or self.spool
+        if fallback is None:
+            raise SyncCastCircuitOpenError(
+                message=f"Circuit open for {endpoint}",
+                extra={"endpoint": endpoint, "state": self.circuit_breaker.state(endpoint)}
+            )
+
+        self.metrics.incr("breaker.diverted")
+        return self._divert(fallback, endpoint, kwargs)
+
+    def _divert(self, fallback: Callable[[str, Any], Any], endpoint: str, kwargs: Dict[str, Any]) -> Any:
+        """
+        Hand the payload of a post (decoding a pre-encoded body) to `fallback`.
+        """
+        payload = kwargs.get("json")
+        body = kwargs.get("data", kwargs.get("content"))
+        if payload is None and isinstance(body, bytes):
+            payload = self.serializer.loads(body)
+        return fallback(endpoint, payload)
+
+    @staticmethod
+    def _spoolable(error: Exception) -> bool:
+        """
+        Whether a failed post should go to the spool: delivery failures and
+        retryable API statuses, but not events shed on purpose by backpressure.
+        """
+        if isinstance(error, SyncCastAPIError):
+            status = (error.extra or {}).get("status_code") or 0
+            return status == 429 or status >= 500
+        return isinstance(error, SyncCastDispatchError) and not isinstance(error, SyncCastBackpressureError)
+
+    def _spool_failed(self, endpoint: str, kwargs: Dict[str, Any], error: Exception) -> Any:
+        self.logger.warning(f"[{type(self).__name__}] Delivery to {endpoint} failed, spooled: {error}")
+        self.metrics.incr("dispatcher.spooled")
+        return self._divert(self.spool, endpoint, kwargs)
+
+    def with_base_url(self, url: str) -> 'SyncCastDispatcherBase':
+        self.base_url = url.rstrip("/")
+        return self
+
+    def with_base_urls(self, urls: Iterable[str], hedge_priorities: Iterable[Any] = (SyncCastPriorityLevel.HIGH,), **options) -> 'SyncCastDispatcherBase':
+        """
+        Spread posts over several base URLs (e.g. one ingress per region)
+        through a new `SyncCastEndpointRouter` built with `options`.
+        """
+        router = SyncCastEndpointRouter(urls, **{"metrics": self.metrics, **options})
+        return self.with_router(router, hedge_priorities)
+
+    def with_router(self, router: SyncCastEndpointRouter, hedge_priorities: Iterable[Any] = (SyncCastPriorityLevel.HIGH,)) -> 'SyncCastDispatcherBase':
+        """
+        Send each post to the best base URL of `router` (shareable between
+        dispatchers) and fail over to the next ones on connection errors,
+        timeouts and 5xx responses. Posts of `hedge_priorities` are hedged:
+        when the best URL has not answered within its p95 latency, a copy
+        goes to the second one and the first success wins (both carry the
+        same `Idempotency-Key`).
+        """
+        self.router = router
+        self.hedge_priorities = frozenset(getattr(priority, "value", priority) for priority in hedge_priorities)
+        self.base_url = router.base_urls[0]
+        return self
+
+    def _hedge_delay(self, candidates: List[str], priority: Any) -> Optional[float]:
+        """
+        How long to wait for the best base URL before hedging, or None not to hedge.
+        """
+        if len(candidates) < 2 or getattr(priority, "value", priority) not in self.hedge_priorities:
+            return None
+        return self.router.hedge_delay(candidates[0])
+
+    def _failed_over(self, base_url: str, endpoint: str, reason: Any) -> None:
+        self.metrics.incr("routing.failover")
+        self.logger.warning(f"[{type(self).__name__}] {base_url} failed for {endpoint} ({reason}), failing over")
+
+    def with_headers(self, headers: Dict[str, str]) -> 'SyncCastDispatcherBase':
+        self.headers.update(headers)
+        return self
+
+    def with_auth_token(self, token: str, header_name: str = "Authorization") -> 'SyncCastDispatcherBase':
+        self.headers[header_name] = f"Bearer {token}"
+        return self
+
+    def with_secret(
+        self,
+        app_id: str,
+        app_secret: str,
+        id_header: str = "X-App-Id",
+        secret_header: str = "X-App-Secret"
+    ) -> 'SyncCastDispatcherBase':
+        self.app_id = app_id
+        self.headers[id_header] = app_id
+        self.headers[secret_header] = app_secret
+        return self
+
+    def _build_url(self, endpoint: str, base_url: Optional[str] = None) -> str:
+        if base_url is None:
+            base_url = self.router.best() if self.router is not None else self.base_url
+        return f"{base_url}/{endpoint.lstrip('/')}"
+
+    def _limit_key(self, endpoint: str) -> tuple:
+        return (self.app_id, endpoint)
+
+    @staticmethod
+    def _priority_of(kwargs: Dict[str, Any]) -> Any:
+        payload = kwargs.get("json")
+        return payload.get("priority") if isinstance(payload, dict) else None
+
+    def encode(self, payload: Any) -> bytes:
+        """
+        Encode `payload` with the dispatcher's serializer.
+        """
+        return self.serializer.dumps(payload)
+
+    def _prepare_body(self, endpoint: str, kwargs: Dict[str, Any], body_kwarg: str = "data") -> Dict[str, Any]:
+        """
+        Encode a `json=` payload once into `bytes` (sent as `body_kwarg`) and
+        label pre-encoded bodies, instead of letting the HTTP client re-encode.
+        Large bodies are compressed when compression is enabled.
+
+        Each body is labelled with an `Idempotency-Key`: the payload's
+        `event_id`, or a digest of the body when it has none (batches), so
+        every retry of the request carries the same key.
+        """
+        event_id = None
+        if "json" in kwargs:
+            payload = kwargs.pop("json")
+            if payload is not None:
+                kwargs[body_kwarg] = self.encode(payload)
+                event_id = payload.get("event_id") if isinstance(payload, dict) else None
+        elif body_kwarg != "data" and isinstance(kwargs.get("data"), bytes):
+            kwargs[body_kwarg] = kwargs.pop("data")
+
+        if isinstance(kwargs.get(body_kwarg), bytes):
+            headers = kwargs.get("headers") or {}
+            if not any(name.lower() == "content-type" for name in headers):
+                headers = kwargs["headers"] = {**headers, "Content-Type": self.serializer.content_type}
+            if not any(name.lower() == self.IDEMPOTENCY_HEADER.lower() for name in headers):
+                key = event_id or hashlib.sha256(kwargs[body_kwarg]).hexdigest()[:32]
+                headers = kwargs["headers"] = {**headers, self.IDEMPOTENCY_HEADER: str(key)}
+            if self.compressor is not None and not any(name.lower() == "content-encoding" for name in headers):
+                self._compress(endpoint, kwargs, body_kwarg)
+        return kwargs
+
+    def _compress(self, endpoint: str, kwargs: Dict[str, Any], body_kwarg: str) -> None:
+        """
+        Compress the body in place if it reaches the endpoint's threshold and
+        actually shrinks. Records ratio and CPU time under `compression.<endpoint>.*`.
+        """
+        body = kwargs[body_kwarg]
+        if len(body) < self.compress_thresholds.get(endpoint, self.compress_threshold):
+            return
+
+        started = time.thread_time()
+        compressed = self.compressor.compress(body)
+        cpu = time.thread_time() - started
+
+        name = f"compression.{endpoint.strip('/')}"
+        self.metrics.observe(f"{name}.cpu", cpu)
+        self.metrics.incr(f"{name}.bytes_in", len(body))
+        self.metrics.incr(f"{name}.bytes_out", min(len(compressed), len(body)))
+        self.metrics.gauge(f"{name}.ratio", len(compressed) / len(body))
+
+        if len(compressed) < len(body):
+            kwargs[body_kwarg] = compressed
+            kwargs["headers"] = {**kwargs["headers"], "Content-Encoding": self.compressor.encoding}
+
+    def _log_request(self, method: str, url: str, **kwargs):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("[%s] %s %s | kwargs=%s", type(self).__name__, method.upper(), url, kwargs)
+
+
+class SyncCastDispatcher(SyncCastDispatcherBase):
     """
     HTTP client for communicating with SyncCast APIs.
     Handles secret injection, retries, and structured error reporting.
+
+    Connections are kept alive in urllib3 pools of `pool_maxsize` connections
+    per host (`host_pools` overrides the size for given `scheme://host[:port]`
+    prefixes); with `pool_block=True` threads wait for a free connection
+    instead of opening throwaway ones ("Connection pool is full"). One
+    dispatcher can be shared by any number of threads. The session is
+    recreated on first use in a forked child, so a dispatcher created before
+    a pre-fork server (gunicorn, uWSGI, Celery) forks never shares sockets
+    with its parent.
+
+    With several base URLs (`with_base_urls()` / `with_router()`), posts go
+    to the one with the best observed latency and error rate and fail over
+    to the others; hedged copies run on up to `hedge_workers` threads.
     """
 
     def __init__(
@@ -30,6 +365,13 @@ class SyncCastDispatcher:
         timeout: int = 5,
         retries: Optional[int] = 3,
         backoff_factor: float = 0.3,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        host_pools: Optional[Dict[str, int]] = None,
+        hedge_workers: int = 8,
+        serializer: Union[SyncCastSerializer, str, None] = None,
+        metrics: Optional[SyncCastMetrics] = None,
         logger_instance: Optional[logging.Logger] = None
     ):
 
@@ -37,51 +379,134 @@ class SyncCastDispatcher:
         self.headers = headers or {}
         self.timeout = timeout
         self.logger = logger_instance or logger
-        self.session = requests.Session()
+        self.with_serializer(serializer or get_serializer())
+        self.metrics = metrics or SyncCastMetrics()
 
-        retry_strategy = Retry(
+        self.retries = retries or 0
+        self.backoff_factor = backoff_factor
+        self.retry_strategy = Retry(
             total=retries,
             backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=list(self.RETRY_STATUSES),
             allowed_methods=["GET", "POST", "PUT", "DELETE"]
         )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.host_pools = dict(host_pools or {})
+        self.hedge_workers = hedge_workers
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self._session_lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._session_pid: Optional[int] = None
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._hedge_pid: Optional[int] = None
 
-    def with_base_url(self, url: str) -> 'SyncCastDispatcher':
-        self.base_url = url.rstrip("/")
-        return self
+    # Connection management
 
-    def with_headers(self, headers: Dict[str, str]) -> 'SyncCastDispatcher':
-        self.headers.update(headers)
-        return self
+    def _make_adapter(self, maxsize: int) -> HTTPAdapter:
+        return _SyncCastAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=maxsize,
+            pool_block=self.pool_block,
+            max_retries=self.retry_strategy,
+        )
 
-    def with_auth_token(self, token: str, header_name: str = "Authorization") -> 'SyncCastDispatcher':
-        self.headers[header_name] = f"Bearer {token}"
-        return self
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = self._make_adapter(self.pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        for prefix, maxsize in self.host_pools.items():
+            session.mount(prefix.rstrip("/") + "/", self._make_adapter(maxsize))
+        return session
 
-    def with_secret(
-        self,
-        app_id: str,
-        app_secret: str,
-        id_header: str = "X-App-Id",
-        secret_header: str = "X-App-Secret"
-    ) -> 'SyncCastDispatcher':
-        self.headers[id_header] = app_id
-        self.headers[secret_header] = app_secret
-        return self
+    @property
+    def session(self) -> requests.Session:
+        """
+        The `requests.Session` of the current process, created on first use
+        and recreated after a fork (the parent's sockets are left untouched).
+        """
+        pid = os.getpid()
+        session = self._session
+        if session is not None and self._session_pid == pid:
+            return session
 
-    def _build_url(self, endpoint: str) -> str:
-        return f"{self.base_url}/{endpoint.lstrip('/')}"
+        with self._session_lock:
+            if self._session is None or self._session_pid != pid:
+                if self._session is not None:
+                    self.metrics.incr("dispatcher.session_recreated")
+                self._session = self._new_session()
+                self._session_pid = pid
+            return self._session
 
-    def _log_request(self, method: str, url: str, **kwargs):
-        self.logger.debug(f"[SyncCastDispatcher] {method.upper()} {url} | kwargs={kwargs}")
+    def warmup(self, connections: int = 1, path: str = "/") -> int:
+        """
+        Open `connections` keep-alive connections to the base URL (to each of
+        the router's base URLs) ahead of traffic, so DNS resolution and
+        TCP/TLS handshakes are not paid by the first requests. Any HTTP
+        response counts: only the connection matters.
+
+        Returns:
+            int: Number of connections established.
+        """
+        base_urls = self.router.base_urls if self.router is not None else [self.base_url]
+        return sum(self._warmup(self._build_url(path, base_url), connections) for base_url in base_urls)
+
+    def _warmup(self, url: str, connections: int) -> int:
+        connections = max(1, min(connections, self._pool_size(url)))
+
+        def probe(_: int) -> bool:
+            try:
+                self.session.head(url, timeout=self.timeout, headers=self.headers, allow_redirects=False)
+                return True
+            except requests.exceptions.RequestException as e:
+                self.logger.warning(f"[SyncCastDispatcher] Warmup of {url} failed: {e}")
+                return False
+
+        with self.metrics.timer("dispatcher.warmup"):
+            if connections == 1:
+                established = int(probe(0))
+            else:
+                # Concurrent probes, so each one holds (and then returns) its own pooled connection
+                with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="synccast-warmup") as executor:
+                    established = sum(executor.map(probe, range(connections)))
+
+        self.metrics.incr("dispatcher.warmed_connections", established)
+        return established
+
+    def _pool_size(self, url: str) -> int:
+        matches = [prefix for prefix in self.host_pools if url.startswith(prefix.rstrip("/") + "/")]
+        return self.host_pools[max(matches, key=len)] if matches else self.pool_maxsize
+
+    def close(self) -> None:
+        """
+        Close pooled connections. The dispatcher stays usable; a new session is
+        created on the next request.
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+            hedge_pool, self._hedge_pool = self._hedge_pool, None
+        if session is not None and self._session_pid == os.getpid():
+            session.close()
+        if hedge_pool is not None and self._hedge_pid == os.getpid():
+            hedge_pool.shutdown(wait=False)
+
+    @property
+    def hedge_pool(self) -> ThreadPoolExecutor:
+        """
+        Threads running hedged requests, created on first use (again after a fork).
+        """
+        pid = os.getpid()
+        with self._session_lock:
+            if self._hedge_pool is None or self._hedge_pid != pid:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=self.hedge_workers, thread_name_prefix="synccast-hedge")
+                self._hedge_pid = pid
+            return self._hedge_pool
 
     def _safe_request(self, method: str, *args, **kwargs) -> requests.Response:
         try:
-            headers_to_use = kwargs.get('headers', self.headers)
+            headers_to_use = {**self.headers, **(kwargs.pop('headers', None) or {})}
             return getattr(self.session, method)(*args, timeout=self.timeout, headers=headers_to_use, **kwargs)
         except requests.exceptions.RequestException as e:
             self.logger.exception(f"[SyncCastDispatcher] {method.upper()} request failed")
@@ -90,6 +515,223 @@ class SyncCastDispatcher:
                 extra={"exception": str(e), "url": args[0] if args else None}
             ) from e
 
+    def with_rate_limiter(self, limiter: SyncCastRateLimiter) -> 'SyncCastDispatcher':
+        # 429s are retried through the limiter, not independently by urllib3 in each thread
+        super().with_rate_limiter(limiter)
+        self.retry_strategy = self.retry_strategy.new(
+            status_forcelist=[status for status in self.retry_strategy.status_forcelist if status != 429],
+            respect_retry_after_header=False,
+        )
+        self.close()
+        return self
+
+    def _budgeted_request(
+        self, method: str, endpoint: str, url: str, priority: Any, deadline: SyncCastDeadline, **kwargs
+    ) -> requests.Response:
+        """
+        A call bounded by `deadline` as a whole. Each attempt runs without
+        urllib3's retries, with its timeout capped at the remaining budget;
+        retries, backoff and rate-limit waits are only scheduled while they
+        fit in it. Every phase is recorded on the deadline for the error report.
+        """
+        limiter = self.rate_limiter
+        key = self._limit_key(endpoint)
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+        last: Dict[str, Any] = {}
+        response = None
+        retries = 0 if getattr(_attempt_mode, "failover", False) else self.retries
+
+        for attempt in range(retries + 1):
+            if limiter is not None:
+                wait = limiter.reserve(key, priority)
+                if wait >= deadline.remaining():
+                    raise deadline.error(endpoint, url=url, waiting_for="rate_limit", **last)
+                if wait > 0:
+                    deadline.sleep(wait, "rate_limit")
+
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                break
+
+            started = time.monotonic()
+            _attempt_mode.single = True
+            try:
+                response = self.session.request(
+                    method.upper(), url, timeout=min(self.timeout, remaining), headers=headers, **kwargs
+                )
+            except requests.exceptions.RequestException as e:
+                deadline.record("attempt", time.monotonic() - started, error=type(e).__name__)
+                last, response = {"last_error": str(e)}, None
+            else:
+                deadline.record("attempt", time.monotonic() - started, status=response.status_code)
+                if limiter is not None:
+                    if response.status_code == 429:
+                        limiter.on_throttled(key, parse_retry_after(response.headers.get("Retry-After")))
+                    else:
+                        limiter.on_success(key)
+                if response.status_code not in self.RETRY_STATUSES:
+                    return response
+                last = {"last_status": response.status_code}
+            finally:
+                _attempt_mode.single = False
+
+            if attempt < retries:
+                backoff = self.backoff_factor * (2 ** attempt)
+                if backoff >= deadline.remaining():
+                    break
+                if backoff > 0:
+                    deadline.sleep(backoff, "backoff")
+        else:
+            # Retries exhausted within the budget: same outcome as without a deadline
+            if response is not None:
+                return response
+            self.logger.error(f"[SyncCastDispatcher] {method.upper()} request failed: {last.get('last_error')}")
+            raise SyncCastDispatchError(
+                message=f"{method.upper()} request failed",
+                extra={"exception": last.get("last_error"), "url": url, **deadline.breakdown()}
+            )
+
+        self.logger.error(f"[SyncCastDispatcher] {method.upper()} {url} exceeded its {deadline.budget * 1000:g}ms deadline")
+        raise deadline.error(endpoint, url=url, **last)
+
+    def _limited_request(
+        self, method: str, endpoint: str, url: str, priority: Any = None, deadline: Optional[SyncCastDeadline] = None, **kwargs
+    ) -> requests.Response:
+        """
+        `_safe_request` paced by the rate limiter, if any: waits for a token
+        before each attempt and retries 429 responses once the limiter allows.
+        """
+        if deadline is not None:
+            return self._budgeted_request(method, endpoint, url, priority, deadline, **kwargs)
+
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self._safe_request(method, url, **kwargs)
+
+        key = self._limit_key(endpoint)
+        for attempt in range(self.retries + 1):
+            limiter.acquire(key, priority)
+            response = self._safe_request(method, url, **kwargs)
+            if response.status_code != 429:
+                limiter.on_success(key)
+                return response
+            limiter.on_throttled(key, parse_retry_after(response.headers.get("Retry-After")))
+        return response
+
+    def _route_attempt(
+        self, method: str, endpoint: str, base_url: str, priority: Any, deadline: Optional[SyncCastDeadline], failover: bool, **kwargs
+    ) -> requests.Response:
+        """
+        `_limited_request` to `base_url`, recorded by the router. With
+        `failover`, it makes a single attempt, leaving retries to the next URL.
+        """
+        started = time.monotonic()
+        _attempt_mode.failover = failover
+        try:
+            response = self._limited_request(method, endpoint, self._build_url(endpoint, base_url), priority, deadline, **kwargs)
+        except SyncCastBackpressureError:
+            raise
+        except SyncCastDispatchError:
+            self.router.record(base_url, time.monotonic() - started, failed=True)
+            raise
+        finally:
+            _attempt_mode.failover = False
+        self.router.record(base_url, time.monotonic() - started, failed=response.status_code >= 500)
+        return response
+
+    def _routed_request(
+        self, method: str, endpoint: str, url: str, priority: Any = None, deadline: Optional[SyncCastDeadline] = None, **kwargs
+    ) -> requests.Response:
+        """
+        `_limited_request` to the router's best base URL, failing over to the
+        next ones (hedged for `hedge_priorities`). Without a router, to `url`.
+        """
+        if self.router is None:
+            return self._limited_request(method, endpoint, url, priority, deadline, **kwargs)
+
+        candidates = self.router.ranked()
+        delay = self._hedge_delay(candidates, priority)
+        if delay is not None and (deadline is None or delay < deadline.remaining()):
+            return self._hedged_request(method, endpoint, candidates, delay, priority, deadline, **kwargs)
+
+        for index, base_url in enumerate(candidates):
+            last = index == len(candidates) - 1
+            try:
+                response = self._route_attempt(method, endpoint, base_url, priority, deadline, not last, **kwargs)
+            except (SyncCastBackpressureError, SyncCastDeadlineError):
+                raise
+            except SyncCastDispatchError as e:
+                if last:
+                    raise
+                self._failed_over(base_url, endpoint, (e.extra or {}).get("exception"))
+                continue
+            if last or response.status_code < 500:
+                return response
+            self._failed_over(base_url, endpoint, response.status_code)
+
+    def _hedged_request(
+        self, method: str, endpoint: str, candidates: List[str], delay: float, priority: Any, deadline: Optional[SyncCastDeadline], **kwargs
+    ) -> requests.Response:
+        """
+        Send to the best base URL and, if it has not answered after `delay`
+        (or failed), to the second one; return the first success, else the
+        last outcome. The slower request is left to finish in the background.
+        """
+        pool = self.hedge_pool
+        primary = pool.submit(self._route_attempt, method, endpoint, candidates[0], priority, deadline, False, **kwargs)
+        pending = {primary}
+        hedged = False
+        response, error = None, None
+
+        while pending:
+            done, pending = wait(pending, timeout=None if hedged else delay, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except SyncCastDispatchError as e:
+                    error = e
+                    continue
+                if response.status_code < 500:
+                    if future is not primary:
+                        self.metrics.incr("routing.hedge_won")
+                    return response
+
+            if not hedged and (not done or not pending):
+                # Slower than its p95, or already failed: try the second URL too
+                hedged = True
+                self.metrics.incr("routing.hedged")
+                pending.add(pool.submit(self._route_attempt, method, endpoint, candidates[1], priority, deadline, False, **kwargs))
+
+        if response is not None:
+            return response
+        raise error
+
+    def _guarded_request(
+        self, method: str, endpoint: str, url: str, priority: Any = None, deadline: Optional[SyncCastDeadline] = None, **kwargs
+    ) -> requests.Response:
+        """
+        `_limited_request` whose outcome and latency are recorded by the
+        circuit breaker, if any. Calls shed by the rate limiter are not counted.
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return self._routed_request(method, endpoint, url, priority, deadline, **kwargs)
+
+        started = time.monotonic()
+        try:
+            response = self._routed_request(method, endpoint, url, priority, deadline, **kwargs)
+        except SyncCastBackpressureError:
+            breaker.release(endpoint)
+            raise
+        except SyncCastDispatchError:
+            breaker.record(endpoint, time.monotonic() - started, failed=True)
+            raise
+        except Exception:
+            breaker.release(endpoint)  # Not an outcome of the endpoint
+            raise
+        breaker.record(endpoint, time.monotonic() - started, failed=response.status_code >= 500)
+        return response
+
     def _handle_response(self, response: requests.Response) -> Union[Dict[str, Any], str]:
         try:
             response.raise_for_status()
@@ -117,26 +759,62 @@ class SyncCastDispatcher:
 
     # Public request methods
 
-    def post(self, endpoint: str, **kwargs) -> Union[Dict[str, Any], str]:
-        url = self._build_url(endpoint)
+    def post(
+        self,
+        endpoint: str,
+        deadline_ms: Union[float, SyncCastDeadline, None] = None,
+        **kwargs
+    ) -> Union[Dict[str, Any], str]:
+        """
+        POST to `endpoint`. With `deadline_ms` (milliseconds, or a running
+        `SyncCastDeadline`), the whole call, retries included, must finish
+        within that budget or raise `SyncCastDeadlineError`.
+        """
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow(endpoint):
+            return self._circuit_open(endpoint, kwargs)
+
+        try:
+            deadline = SyncCastDeadline.coerce(deadline_ms)
+            original = dict(kwargs) if self.spool is not None else None
+            url = self._build_url(endpoint)
+            priority = self._priority_of(kwargs)
+            kwargs = self._prepare_body(endpoint, kwargs)
+        except Exception:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release(endpoint)  # Never sent: give back a half-open slot
+            raise
         self._log_request("post", url, **kwargs)
-        response = self._safe_request("post", url, **kwargs)
-        return self._handle_response(response)
+        try:
+            response = self._guarded_request("post", endpoint, url, priority, deadline, **kwargs)
+            return self._handle_response(response)
+        except (SyncCastDispatchError, SyncCastAPIError) as e:
+            if original is None or not self._spoolable(e):
+                raise
+            return self._spool_failed(endpoint, original, e)
+
+    def post_encoded(self, entries: Iterable[bytes]) -> Union[Dict[str, Any], str]:
+        """
+        Send pre-encoded batch entries (see `encode_fanout_entries`) as one batch request.
+        """
+        return self.post(PushEndpoints.BATCH, data=encode_batch(entries))
 
     def get(self, endpoint: str, **kwargs) -> Union[Dict[str, Any], str]:
         url = self._build_url(endpoint)
+        kwargs = self._prepare_body(endpoint, kwargs)
         self._log_request("get", url, **kwargs)
         response = self._safe_request("get", url, **kwargs)
         return self._handle_response(response)
 
     def put(self, endpoint: str, **kwargs) -> Union[Dict[str, Any], str]:
         url = self._build_url(endpoint)
+        kwargs = self._prepare_body(endpoint, kwargs)
         self._log_request("put", url, **kwargs)
         response = self._safe_request("put", url, **kwargs)
         return self._handle_response(response)
 
     def delete(self, endpoint: str, **kwargs) -> Union[Dict[str, Any], str]:
         url = self._build_url(endpoint)
+        kwargs = self._prepare_body(endpoint, kwargs)
         self._log_request("delete", url, **kwargs)
         response = self._safe_request("delete", url, **kwargs)
         return self._handle_response(response)
@@ -18,3 +18,4 @@ class PushEndpoints:
     PRESENCE: Final[str] = "/api/chat/presence/"      # Online/offline presence updates
     NOTIFICATION: Final[str] = "/api/chat/notification/"  # App-level notifications (e.g. alerts)
     SYNC: Final[str] = "/api/chat/sync/"              # UI or client sync triggers (e.g. refresh data)
+    BATCH: Final[str] = "/api/chat/batch/"            # Many events in one request ({"events": [{"endpoint", "payload"}, ...]})
@@ -23,4 +23,11 @@ class SyncCastQosLevel(IntEnum):
     """MQTT Quality of Service levels."""
     FIRE_AND_FORGET = 0     # At most once: Fast, unreliable
     DELIVER_AT_LEAST_ONCE = 1  # Guaranteed delivery, may duplicate
-    DELIVER_EXACTLY_ONCE = 2   # Most reliable, no duplicates
\ No newline at end of file
+    DELIVER_EXACTLY_ONCE = 2   # Most reliable, no duplicates
+
+class SyncCastOverflowPolicy(str, Enum):
+    """What a bounded dispatch queue does with an event when it is full."""
+    BLOCK = "block"                # Wait (up to a timeout) for room, then reject
+    DROP_OLDEST = "drop_oldest"    # Evict the oldest queued event of the same type
+    DROP_NEWEST = "drop_newest"    # Reject the incoming event
+    COALESCE = "coalesce"          # Replace the queued event for the same endpoint/topic
@@ -0,0 +1,94 @@
+# Default package imports
+import logging
+from typing import Optional, Dict, Any, Iterable, Callable
+
+# SyncCast enums
+from synccast.core.enums import SyncCastPriorityLevel, SyncCastQosLevel
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+class SyncCastLaneRouter:
+    """
+    Routes each publish to a delivery lane chosen from the `priority` and `qos`
+    stamped on its payload by `SyncCastPayloadBuilder`:
+
+        - "urgent":     `HIGH` priority. Sent synchronously on a dedicated
+                        dispatcher (its own connection pool), never batched or
+                        queued behind bulk traffic.
+        - "background": `LOW` priority or `FIRE_AND_FORGET` QoS. Handed to a
+                        non-blocking lane (typically a `SyncCastDispatchPool`
+                        over a dispatcher with retries disabled).
+        - "standard":   everything else, through the regular pipeline.
+
+    Lanes that are not configured fall back to "standard", and so do
+    delta-encoded updates (payloads with a `sync` block, see
+    `SyncCastDeltaEncoder`): each patch builds on the previous one, so they
+    must not overtake each other on the urgent lane nor be queued, coalesced
+    or reordered on the background lane. The router exposes a
+    dispatcher-compatible `post(endpoint, json=...)`.
+    """
+
+    URGENT = "urgent"
+    BACKGROUND = "background"
+    STANDARD = "standard"
+
+    def __init__(
+        self,
+        standard: Any,
+        urgent: Optional[Any] = None,
+        background: Optional[Any] = None,
+        metrics: Optional[SyncCastMetrics] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.lanes: Dict[str, Any] = {self.STANDARD: standard}
+        if urgent is not None:
+            self.lanes[self.URGENT] = urgent
+        if background is not None:
+            self.lanes[self.BACKGROUND] = background
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+    def lane_for(self, payload: Dict[str, Any]) -> str:
+        """
+        Name of the lane `payload` is delivered on.
+        """
+        if "sync" in payload:
+            return self.STANDARD
+
+        priority = payload.get("priority")
+        if priority == SyncCastPriorityLevel.HIGH.value and self.URGENT in self.lanes:
+            return self.URGENT
+
+        if (
+            priority == SyncCastPriorityLevel.LOW.value
+            or payload.get("qos") == SyncCastQosLevel.FIRE_AND_FORGET.value
+        ) and self.BACKGROUND in self.lanes:
+            return self.BACKGROUND
+
+        return self.STANDARD
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        Dispatcher-compatible entry point used by the services.
+        """
+        payload = json or {}
+        lane = self.lane_for(payload)
+        self.metrics.incr(f"lanes.{lane}")
+        return self.lanes[lane].post(endpoint, json=payload, **kwargs)
+
+    @property
+    def serializer(self) -> Any:
+        return getattr(self.lanes[self.STANDARD], "serializer", None)
+
+    @property
+    def post_encoded(self) -> Optional[Callable[[Iterable[bytes]], Any]]:
+        """
+        The standard lane's `post_encoded`, if it has one: pre-encoded batches
+        (see `encode_fanout_entries`) always take the standard lane.
+        """
+        return getattr(self.lanes[self.STANDARD], "post_encoded", None)
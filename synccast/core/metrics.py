@@ -0,0 +1,80 @@
+# Default package imports
+import time
+import threading
+from contextlib import contextmanager
+from collections import defaultdict
+from typing import Dict, Any, Iterator
+
+
+class SyncCastMetrics:
+    """
+    Thread-safe, in-process counters, gauges and timers for SyncCast delivery stages.
+
+    Stages record into a shared instance; `snapshot()` returns a plain dict
+    suitable for logging or exporting to a metrics backend.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._timers: Dict[str, list] = {}
+
+    def incr(self, name: str, value: float = 1) -> None:
+        """
+        Increment counter `name` by `value`.
+        """
+        with self._lock:
+            self._counters[name] += value
+
+    def gauge(self, name: str, value: float) -> None:
+        """
+        Set gauge `name` to its current `value`.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Record one duration sample (in seconds) for timer `name`.
+        """
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                timer[2] = max(timer[2], seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Context manager recording the wall time of its block under `name`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a copy of all metrics:
+        `{"counters": {...}, "gauges": {...}, "timers": {name: {count, total, avg, max}}}`.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timers": {
+                    name: {"count": count, "total": total, "avg": total / count, "max": peak}
+                    for name, (count, total, peak) in self._timers.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timers.clear()
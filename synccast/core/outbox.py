@@ -0,0 +1,279 @@
+# Default package imports
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+
+# Django imports
+from django.apps import apps
+from django.db import transaction, close_old_connections
+from django.utils import timezone
+
+# SyncCast service endpoints
+from synccast.core.endpoints import PushEndpoints
+
+# SyncCast payload serializers
+from synccast.core.serializers import SyncCastSerializer, get_serializer
+
+# SyncCast batch encoding
+from synccast.core.batching import encode_batch, encode_batch_entry
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+def get_concrete_outbox_model():
+    """
+    Dynamically find the concrete model subclassing AbstractSyncCastOutbox.
+    """
+    from synccast.models.outbox import AbstractSyncCastOutbox
+
+    for model in apps.get_models():
+        if issubclass(model, AbstractSyncCastOutbox) and not model._meta.abstract:
+            return model
+
+    raise LookupError("No concrete model found inheriting from AbstractSyncCastOutbox.")
+
+
+class SyncCastOutboxFallback:
+    """
+    Circuit-breaker fallback that stores publishes diverted from an open
+    circuit as pending outbox rows (one per event, batches included), to be
+    relayed by `synccast_drain_outbox` once the API recovers.
+    """
+
+    def __init__(self, model: Optional[Any] = None, using: Optional[str] = None):
+        self._model = model
+        self.using = using
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = get_concrete_outbox_model()
+        return self._model
+
+    def __call__(self, endpoint: str, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if endpoint == PushEndpoints.BATCH and isinstance(payload, dict) and "events" in payload:
+            rows = [self.model(endpoint=event["endpoint"], payload=event["payload"]) for event in payload["events"]]
+        else:
+            rows = [self.model(endpoint=endpoint, payload=payload or {})]
+        self.model.objects.using(self.using).bulk_create(rows)
+        return {"spooled": len(rows)}
+
+
+class _PendingFlush:
+    """
+    On-commit callback flushing every outbox row written in one transaction.
+
+    It is registered once per intent, so it survives the rollback of any
+    savepoint that registered it; the first call after commit flushes all
+    collected rows and the others do nothing. Ids of rolled-back rows are
+    harmless: `flush()` only sends rows that exist and are still pending.
+    """
+
+    def __init__(self, outbox: 'SyncCastOutboxDispatcher'):
+        self.outbox = outbox
+        self.ids: List[int] = []
+        self.done = False
+
+    def __call__(self) -> None:
+        if self.done:
+            return
+        self.done = True
+        if getattr(self.outbox._local, "pending", None) is self:
+            self.outbox._local.pending = None
+        self.outbox._on_commit(self.ids)
+
+
+class SyncCastOutboxDispatcher:
+    """
+    Transactional outbox in front of `SyncCastDispatcher`.
+
+    `post()` does not call the API: it stores the publish intent as an outbox
+    row in the current database transaction. Once that transaction commits,
+    the rows it wrote are sent as one ordered batch request; a rollback
+    discards them together with the rest of the transaction. Rows that could
+    not be delivered stay pending for `drain()` / `manage.py synccast_drain_outbox`,
+    giving at-least-once delivery.
+
+    With `flush_in_background=True` (the default) the after-commit flush runs
+    on a single background thread, so web requests never wait on API latency.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Any,
+        model: Optional[Any] = None,
+        using: Optional[str] = None,
+        flush_on_commit: bool = True,
+        flush_in_background: bool = True,
+        batch_size: int = 500,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.dispatcher = dispatcher
+        self._model = model
+        self.using = using
+        self.flush_on_commit = flush_on_commit
+        self.batch_size = batch_size
+        self.logger = logger_instance or logger
+
+        self._local = threading.local()
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="synccast-outbox")
+            if flush_in_background else None
+        )
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = get_concrete_outbox_model()
+        return self._model
+
+    # ── Writing intents ─────────────────────────────────────────────────────────
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        Dispatcher-compatible entry point: record the intent, flush after commit.
+
+        Returns:
+            The created outbox row.
+        """
+        return self._record([(endpoint, json or {})])[0]
+
+    @property
+    def serializer(self) -> SyncCastSerializer:
+        return getattr(self.dispatcher, "serializer", None) or get_serializer()
+
+    def post_encoded(self, entries: Iterable[bytes]) -> List[Any]:
+        """
+        Record pre-encoded batch entries (see `encode_fanout_entries`) as one
+        outbox row each; they are flushed with the transaction's other rows.
+
+        Returns:
+            The created outbox rows.
+        """
+        events = [self.serializer.loads(entry) for entry in entries]
+        return self._record([(event["endpoint"], event["payload"]) for event in events])
+
+    def _record(self, intents: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        manager = self.model.objects.using(self.using)
+        rows = [manager.create(endpoint=endpoint, payload=payload) for endpoint, payload in intents]
+
+        if self.flush_on_commit and rows:
+            # Registered after the ids are collected: outside `atomic()` the
+            # callback runs immediately and must already see these rows
+            pending = self._pending_flush()
+            pending.ids.extend(row.pk for row in rows)
+            transaction.on_commit(pending, using=self.using)
+
+        return rows
+
+    def _pending_flush(self) -> '_PendingFlush':
+        """
+        The after-commit flush collecting this thread's intents until it runs.
+        """
+        pending = getattr(self._local, "pending", None)
+        if pending is None or pending.done:
+            pending = self._local.pending = _PendingFlush(self)
+        return pending
+
+    def _on_commit(self, ids: List[int]) -> None:
+        if self._executor is not None:
+            self._executor.submit(self._flush_in_thread, ids)
+        else:
+            self.flush(ids)
+
+    def _flush_in_thread(self, ids: List[int]) -> None:
+        close_old_connections()
+        try:
+            self.flush(ids)
+        finally:
+            close_old_connections()
+
+    # ── Delivery ────────────────────────────────────────────────────────────────
+
+    def flush(self, ids: Iterable[int]) -> int:
+        """
+        Send the given pending rows, in primary-key order.
+
+        Returns:
+            int: Number of rows delivered.
+        """
+        with transaction.atomic(using=self.using):
+            rows = list(
+                self.model.objects.using(self.using)
+                .select_for_update(skip_locked=True)
+                .filter(pk__in=list(ids), status=self.model.OutboxStatus.PENDING)
+                .order_by("pk")
+            )
+            return self._send(rows)
+
+    def drain(self, batch_size: Optional[int] = None, limit: Optional[int] = None) -> int:
+        """
+        Relay loop body: deliver pending rows oldest-first in batches of
+        `batch_size` until none are left (or `limit` rows were handled).
+
+        Rows are locked with `SELECT ... FOR UPDATE SKIP LOCKED` where the
+        database supports it, so several relays can drain concurrently.
+
+        Returns:
+            int: Number of rows delivered.
+        """
+        batch_size = batch_size or self.batch_size
+        delivered = handled = 0
+
+        while limit is None or handled < limit:
+            size = batch_size if limit is None else min(batch_size, limit - handled)
+            with transaction.atomic(using=self.using):
+                rows = list(
+                    self.model.objects.using(self.using)
+                    .select_for_update(skip_locked=True)
+                    .filter(status=self.model.OutboxStatus.PENDING)
+                    .order_by("pk")[:size]
+                )
+                if not rows:
+                    break
+                sent = self._send(rows)
+
+            delivered += sent
+            handled += len(rows)
+            if sent < len(rows):
+                break  # API is failing; leave the rest for the next run
+
+        return delivered
+
+    def _send(self, rows: List[Any]) -> int:
+        if not rows:
+            return 0
+
+        manager = self.model.objects.using(self.using)
+        try:
+            if len(rows) == 1:
+                self.dispatcher.post(rows[0].endpoint, json=rows[0].payload)
+            else:
+                self.dispatcher.post(
+                    PushEndpoints.BATCH,
+                    data=encode_batch(
+                        encode_batch_entry(row.endpoint, row.payload, getattr(self.dispatcher, "serializer", None))
+                        for row in rows
+                    ),
+                )
+        except Exception as e:
+            self.logger.error(f"[SyncCastOutboxDispatcher] Delivery of {len(rows)} outbox rows failed: {e}")
+            for row in rows:
+                row.attempts += 1
+                row.last_error = str(e)
+            manager.bulk_update(rows, ["attempts", "last_error"])
+            return 0
+
+        manager.filter(pk__in=[row.pk for row in rows]).update(
+            status=self.model.OutboxStatus.SENT, sent_at=timezone.now()
+        )
+        return len(rows)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for in-progress background flushes to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
@@ -1,4 +1,6 @@
 # Package imports
+import uuid
+from functools import lru_cache
 from typing import Optional, Dict, Any, Union
 
 # SyncCast abstract model
@@ -14,10 +16,23 @@ from synccast.core.enums import (
 # SyncCast custom exceptions
 from synccast.exceptions.types import SyncCastPayloadError
 
+
+def new_event_id() -> str:
+    """
+    A fresh event ID (random UUID, hex).
+    """
+    return uuid.uuid4().hex
+
+
 class SyncCastPayloadBuilder:
     """
     Builds structured notification payloads for SyncCast events.
     Allows setting sender info, core data, metadata, and actions.
+
+    Every payload carries an `event_id`, generated once per builder unless
+    set with `set_event_id()` (e.g. to a message's primary key). Dispatchers
+    send it as the `Idempotency-Key` header, and retries, spool replays and
+    outbox relays reuse it, so the server can drop redelivered events.
     """
 
     def __init__(
@@ -37,6 +52,16 @@ class SyncCastPayloadBuilder:
         self.sender_info: Dict[str, Any] = {}
         self.metadata: Dict[str, Any] = {}
         self.action: Dict[str, str] = {}
+        self.event_id: Optional[str] = None
+
+    def set_event_id(self, event_id: Union[int, str]) -> 'SyncCastPayloadBuilder':
+        if event_id is None or event_id == "":
+            raise SyncCastPayloadError(
+                message="Invalid event ID",
+                extra={"provided": event_id}
+            )
+        self.event_id = str(event_id)
+        return self
 
     def set_sender_info(self, sender_id: str, sender_name: str, sender_role: Optional[str] = None) -> 'SyncCastPayloadBuilder':
         self.sender_info = {
@@ -92,8 +117,11 @@ class SyncCastPayloadBuilder:
                 message="Payload missing required 'topic'",
                 extra={"scope": self.scope, "user": self.user}
             )
+        if self.event_id is None:
+            self.event_id = new_event_id()
 
         return {
+            "event_id": self.event_id,
             "user_id": self.user,
             "type": self.type.value,
             "priority": self.priority.value,
@@ -107,4 +135,69 @@ class SyncCastPayloadBuilder:
         }
 
     def __str__(self):
-        return str(self.build())
\ No newline at end of file
+        return str(self.build())
+
+
+class SyncCastPayloadSkeleton:
+    """
+    Pre-resolved constant part of a payload (type, priority, qos, scope) for
+    high-frequency events such as typing and presence.
+
+    `make()` produces the same dict as `SyncCastPayloadBuilder.build()` in a
+    single dict literal, without a builder object, enum lookups or setter
+    calls. Skeletons are immutable and shared; use `get_payload_skeleton()`.
+    """
+
+    __slots__ = ("type", "priority", "qos", "scope")
+
+    def __init__(
+        self,
+        type: SyncCastEventType,
+        priority: SyncCastPriorityLevel = SyncCastPriorityLevel.MEDIUM,
+        qos: SyncCastQosLevel = SyncCastQosLevel.DELIVER_AT_LEAST_ONCE,
+        scope: Optional[str] = None
+    ) -> None:
+        self.type: str = type.value
+        self.priority: str = priority.value
+        self.qos: int = qos.value
+        self.scope: Optional[str] = scope
+
+    def make(
+        self,
+        topic: str,
+        data: Optional[Dict[str, Any]] = None,
+        user_id: Optional[Union[int, str]] = None,
+        event_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if not topic or type(topic) is not str:
+            raise SyncCastPayloadError(
+                message="Invalid topic format",
+                extra={"provided": topic}
+            )
+
+        return {
+            "event_id": event_id or uuid.uuid4().hex,
+            "user_id": None if user_id is None else str(user_id),
+            "type": self.type,
+            "priority": self.priority,
+            "qos": self.qos,
+            "scope": self.scope,
+            "topic": topic,
+            "data": data or {},
+            "sender": {},
+            "metadata": {},
+            "action": {}
+        }
+
+
+@lru_cache(maxsize=None)
+def get_payload_skeleton(
+    type: SyncCastEventType,
+    priority: SyncCastPriorityLevel = SyncCastPriorityLevel.MEDIUM,
+    qos: SyncCastQosLevel = SyncCastQosLevel.DELIVER_AT_LEAST_ONCE,
+    scope: Optional[str] = None
+) -> SyncCastPayloadSkeleton:
+    """
+    Shared skeleton for one (type, priority, qos, scope) combination.
+    """
+    return SyncCastPayloadSkeleton(type, priority, qos, scope)
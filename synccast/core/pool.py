@@ -0,0 +1,361 @@
+# Default package imports
+import time
+import atexit
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Deque, Tuple, Iterable, Callable
+
+# SyncCast enums
+from synccast.core.enums import SyncCastEventType, SyncCastOverflowPolicy
+
+# SyncCast service endpoints
+from synccast.core.endpoints import PushEndpoints
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastBackpressureError
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+# Overflow policy per event type; anything not listed uses the pool's default policy.
+DEFAULT_OVERFLOW_POLICIES: Dict[str, SyncCastOverflowPolicy] = {
+    SyncCastEventType.USER_TYPING: SyncCastOverflowPolicy.DROP_OLDEST,
+    SyncCastEventType.USER_PRESENCE: SyncCastOverflowPolicy.DROP_OLDEST,
+    SyncCastEventType.DATA_SYNC: SyncCastOverflowPolicy.COALESCE,
+    SyncCastEventType.CHAT_MESSAGE: SyncCastOverflowPolicy.BLOCK,
+}
+
+
+class _QueuedEvent:
+    """
+    An event waiting in the pool. Coalesced submissions share one entry and
+    all of their futures are resolved with its result. A pre-encoded batch
+    carries its `entries` instead of a payload.
+    """
+
+    __slots__ = (
+        "endpoint", "payload", "kwargs", "entries", "event_type", "key", "futures", "enqueued_at", "queued", "dropped"
+    )
+
+    def __init__(self, endpoint: str, payload: Dict[str, Any], kwargs: Dict[str, Any], key: Tuple[str, Any]):
+        self.endpoint = endpoint
+        self.payload = payload
+        self.kwargs = kwargs
+        self.entries: Optional[List[bytes]] = None
+        self.event_type = payload.get("type")
+        self.key = key
+        self.futures: List[Future] = [Future()]
+        self.enqueued_at = time.monotonic()
+        self.queued = False
+        self.dropped = False
+
+
+class SyncCastDispatchPool:
+    """
+    Non-blocking delivery: `post()` enqueues onto a bounded in-process queue and
+    returns a `Future` immediately, while a pool of worker threads drains the
+    queue through the wrapped dispatcher (and its pooled HTTP session).
+
+    When the queue holds `maxsize` events, the event type's overflow policy
+    decides what happens (see `SyncCastOverflowPolicy`). By default typing and
+    presence drop their oldest queued event, data sync coalesces per
+    endpoint/topic, and chat messages block for up to `block_timeout` seconds.
+
+    Metrics recorded (see `SyncCastMetrics`):
+        - gauge `pool.depth`: events currently queued.
+        - counters `pool.enqueued`, `pool.sent`, `pool.failed`, `pool.coalesced`,
+          `pool.dropped.<type>`, `pool.rejected.<type>`.
+        - timers `pool.queue_wait` (enqueue to pickup) and `pool.flush` (dispatch latency).
+    """
+
+    def __init__(
+        self,
+        dispatcher: Any,
+        workers: int = 4,
+        maxsize: int = 10_000,
+        policies: Optional[Dict[str, SyncCastOverflowPolicy]] = None,
+        default_policy: SyncCastOverflowPolicy = SyncCastOverflowPolicy.BLOCK,
+        block_timeout: float = 1.0,
+        metrics: Optional[SyncCastMetrics] = None,
+        drain_on_exit: bool = True,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.dispatcher = dispatcher
+        self.maxsize = maxsize
+        # Keyed by the plain "type" string found in built payloads
+        self.policies = {
+            getattr(event_type, "value", event_type): policy
+            for event_type, policy in {**DEFAULT_OVERFLOW_POLICIES, **(policies or {})}.items()
+        }
+        self.default_policy = default_policy
+        self.block_timeout = block_timeout
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+        self._cond = threading.Condition()
+        self._queue: Deque[_QueuedEvent] = deque()
+        self._by_type: Dict[Any, Deque[_QueuedEvent]] = {}
+        self._by_key: Dict[Tuple[str, Any], _QueuedEvent] = {}
+        self._depth = 0
+        self._busy = 0
+        self._closed = False
+
+        self._workers = [
+            threading.Thread(target=self._run, name=f"synccast-pool-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        self._drain_on_exit = drain_on_exit
+        if drain_on_exit:
+            atexit.register(self.shutdown)
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of events currently waiting in the queue.
+        """
+        return self._depth
+
+    def policy_for(self, event_type: Any) -> SyncCastOverflowPolicy:
+        return self.policies.get(event_type, self.default_policy)
+
+    # ── Submission ──────────────────────────────────────────────────────────────
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Future:
+        """
+        Dispatcher-compatible entry point used by the services.
+        """
+        return self.submit(endpoint, json or {}, **kwargs)
+
+    def submit(self, endpoint: str, payload: Dict[str, Any], **kwargs) -> Future:
+        """
+        Enqueue `payload` for `endpoint`; returns a future for the dispatcher's result.
+
+        Raises:
+            SyncCastBackpressureError: If the pool is shut down, or a blocking
+                event type could not be queued within `block_timeout`.
+        """
+        event = _QueuedEvent(endpoint, payload, kwargs, (endpoint, payload.get("topic")))
+        return self._submit(event, self.policy_for(event.event_type))
+
+    @property
+    def serializer(self) -> Any:
+        return getattr(self.dispatcher, "serializer", None)
+
+    @property
+    def post_encoded(self) -> Optional[Callable[[Iterable[bytes]], Future]]:
+        """
+        `submit_encoded`, if the wrapped dispatcher can send pre-encoded batches.
+        """
+        if getattr(self.dispatcher, "post_encoded", None) is None:
+            return None
+        return self.submit_encoded
+
+    def submit_encoded(self, entries: Iterable[bytes]) -> Future:
+        """
+        Enqueue pre-encoded batch entries (see `encode_fanout_entries`) as one
+        event, sent through the wrapped dispatcher's `post_encoded`. A batch
+        may hold a whole fanout, so it is never coalesced or dropped: it
+        blocks like a chat message when the queue is full.
+
+        Raises:
+            SyncCastBackpressureError: As `submit()`.
+        """
+        event = _QueuedEvent(PushEndpoints.BATCH, {}, {}, (PushEndpoints.BATCH, None))
+        event.entries = list(entries)
+        return self._submit(event, SyncCastOverflowPolicy.BLOCK)
+
+    def _submit(self, event: _QueuedEvent, policy: SyncCastOverflowPolicy) -> Future:
+        with self._cond:
+            if self._closed:
+                raise SyncCastBackpressureError(
+                    message="Dispatch pool is shut down",
+                    extra={"type": event.event_type}
+                )
+
+            if policy == SyncCastOverflowPolicy.COALESCE:
+                queued = self._by_key.get(event.key)
+                if queued is not None:
+                    queued.payload, queued.kwargs = event.payload, event.kwargs
+                    queued.futures.append(event.futures[0])
+                    self.metrics.incr("pool.coalesced")
+                    return event.futures[0]
+
+            if self._depth >= self.maxsize and not self._make_room(event, policy):
+                return event.futures[0]
+
+            self._enqueue(event, policy)
+
+        return event.futures[0]
+
+    def _make_room(self, event: _QueuedEvent, policy: SyncCastOverflowPolicy) -> bool:
+        """
+        Apply `policy` to a full queue. Returns True if `event` may be enqueued.
+        Must be called with the condition held.
+        """
+        if policy == SyncCastOverflowPolicy.BLOCK:
+            deadline = time.monotonic() + self.block_timeout
+            while self._depth >= self.maxsize and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.metrics.incr(f"pool.rejected.{event.event_type}")
+                    raise SyncCastBackpressureError(
+                        message="Dispatch queue full",
+                        extra={"type": event.event_type, "depth": self._depth, "timeout": self.block_timeout}
+                    )
+                self._cond.wait(remaining)
+            if self._closed:
+                raise SyncCastBackpressureError(
+                    message="Dispatch pool is shut down",
+                    extra={"type": event.event_type}
+                )
+            return True
+
+        if policy == SyncCastOverflowPolicy.DROP_OLDEST:
+            same_type = self._by_type.get(event.event_type)
+            if same_type:
+                self._drop(same_type.popleft(), reason="evicted by a newer event")
+                return True
+
+        self._drop(event, reason="queue full")
+        return False
+
+    def _enqueue(self, event: _QueuedEvent, policy: SyncCastOverflowPolicy) -> None:
+        event.queued = True
+        self._queue.append(event)
+        self._by_type.setdefault(event.event_type, deque()).append(event)
+        if policy == SyncCastOverflowPolicy.COALESCE:
+            self._by_key[event.key] = event
+        self._depth += 1
+        self.metrics.incr("pool.enqueued")
+        self.metrics.gauge("pool.depth", self._depth)
+        self._cond.notify()
+
+    def _drop(self, event: _QueuedEvent, reason: str) -> None:
+        """
+        Discard `event`, failing its futures. Queued events are only marked;
+        workers skip them when they reach the head of the queue.
+        """
+        if event.queued:
+            event.queued = False
+            event.dropped = True
+            self._depth -= 1
+            if self._by_key.get(event.key) is event:
+                del self._by_key[event.key]
+            self.metrics.gauge("pool.depth", self._depth)
+
+        self.metrics.incr(f"pool.dropped.{event.event_type}")
+        error = SyncCastBackpressureError(
+            message=f"Event dropped: {reason}",
+            extra={"type": event.event_type, "topic": event.payload.get("topic")}
+        )
+        for future in event.futures:
+            future.set_exception(error)
+
+    # ── Workers ─────────────────────────────────────────────────────────────────
+
+    def _next_event(self) -> Optional[_QueuedEvent]:
+        with self._cond:
+            while True:
+                while self._queue and self._queue[0].dropped:
+                    self._queue.popleft()
+                if self._queue:
+                    break
+                if self._closed:
+                    return None
+                self._cond.wait()
+
+            event = self._queue.popleft()
+            event.queued = False
+            self._by_type[event.event_type].popleft()
+            if self._by_key.get(event.key) is event:
+                del self._by_key[event.key]
+            self._depth -= 1
+            self._busy += 1
+            self.metrics.gauge("pool.depth", self._depth)
+            self._cond.notify_all()
+            return event
+
+    def _run(self) -> None:
+        while True:
+            event = self._next_event()
+            if event is None:
+                return
+
+            self.metrics.observe("pool.queue_wait", time.monotonic() - event.enqueued_at)
+            try:
+                with self.metrics.timer("pool.flush"):
+                    if event.entries is not None:
+                        result = self.dispatcher.post_encoded(event.entries)
+                    else:
+                        result = self.dispatcher.post(event.endpoint, json=event.payload, **event.kwargs)
+                    if isinstance(result, Future):
+                        result = result.result()
+                    elif isinstance(result, list) and all(isinstance(item, Future) for item in result):
+                        result = [item.result() for item in result]  # A batcher's per-entry futures
+            except Exception as e:
+                self.metrics.incr("pool.failed")
+                self.logger.error(f"[SyncCastDispatchPool] Dispatch to {event.endpoint} failed: {e}")
+                for future in event.futures:
+                    future.set_exception(e)
+            else:
+                self.metrics.incr("pool.sent")
+                for future in event.futures:
+                    future.set_result(result)
+            finally:
+                with self._cond:
+                    self._busy -= 1
+                    self._cond.notify_all()
+
+    # ── Shutdown ────────────────────────────────────────────────────────────────
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been dispatched.
+
+        Returns:
+            bool: False if `timeout` elapsed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._depth or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting events and stop the workers.
+
+        With `drain=True` (the default, also used at interpreter exit) queued
+        events are dispatched first; otherwise they are dropped.
+        """
+        with self._cond:
+            if not drain:
+                while self._queue:
+                    event = self._queue.popleft()
+                    if not event.dropped:
+                        self._drop(event, reason="pool shut down")
+                self._by_type.clear()
+            self._closed = True
+            self._cond.notify_all()
+
+        for worker in self._workers:
+            worker.join(timeout)
+
+        if self._drain_on_exit:
+            atexit.unregister(self.shutdown)
+            self._drain_on_exit = False
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self.shutdown(drain=True, timeout=timeout)
@@ -0,0 +1,448 @@
+# Default package imports
+import time
+import atexit
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, List, Tuple, Union, Iterable
+
+# Django imports
+from django.apps import apps
+from django.core.cache import caches
+from django.db import close_old_connections
+from django.db.models import Case, When, Value, DateTimeField
+from django.utils import timezone
+
+# SyncCast batch encoding
+from synccast.core.batching import encode_batch_entry
+
+# SyncCast topic templates
+from synccast.core.topic import SyncCastTopicTemplate
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+OFFLINE = "offline"
+
+
+def get_concrete_presence_model():
+    """
+    Dynamically find the concrete model subclassing AbstractSyncCastUserPresence.
+    """
+    from synccast.models.presence import AbstractSyncCastUserPresence
+
+    for model in apps.get_models():
+        if issubclass(model, AbstractSyncCastUserPresence) and not model._meta.abstract:
+            return model
+
+    raise LookupError("No concrete model found inheriting from AbstractSyncCastUserPresence.")
+
+
+# ── State stores ───────────────────────────────────────────────────────────────
+
+class SyncCastPresenceStore(ABC):
+    """
+    Where the current status of each user is kept. Transitions are detected
+    against it, so a store shared by all processes (see `CachePresenceStore`)
+    avoids re-publishing a status another process already announced.
+
+    Shared stores also keep when each user was last seen (epoch seconds), so
+    a process does not announce a user offline while they are still sending
+    heartbeats to another one. Process-local stores need not implement it.
+    """
+
+    @abstractmethod
+    def get_status(self, user_id: str) -> Optional[str]:
+        """
+        Last status recorded for `user_id`, or None.
+        """
+
+    @abstractmethod
+    def set_status(self, user_id: str, status: str) -> None:
+        """
+        Record the current status of `user_id`.
+        """
+
+    def get_last_seen_many(self, user_ids: Iterable[str]) -> Dict[str, float]:
+        return {}
+
+    def set_last_seen_many(self, last_seen: Dict[str, float]) -> None:
+        """
+        Record last-seen times, keeping any newer one already stored.
+        """
+
+
+class InMemoryPresenceStore(SyncCastPresenceStore):
+    """
+    Process-local store (the default).
+    """
+
+    def __init__(self):
+        self._statuses: Dict[str, str] = {}
+
+    def get_status(self, user_id: str) -> Optional[str]:
+        return self._statuses.get(user_id)
+
+    def set_status(self, user_id: str, status: str) -> None:
+        self._statuses[user_id] = status
+
+
+class CachePresenceStore(SyncCastPresenceStore):
+    """
+    Store backed by a Django cache (e.g. Redis), shared across processes.
+    Entries expire after `timeout` seconds without a transition.
+    """
+
+    def __init__(self, alias: str = "default", prefix: str = "synccast:presence:", timeout: Optional[float] = 3600):
+        self.cache = caches[alias]
+        self.prefix = prefix
+        self.timeout = timeout
+
+    def get_status(self, user_id: str) -> Optional[str]:
+        return self.cache.get(self.prefix + user_id)
+
+    def set_status(self, user_id: str, status: str) -> None:
+        self.cache.set(self.prefix + user_id, status, self.timeout)
+
+    def get_last_seen_many(self, user_ids: Iterable[str]) -> Dict[str, float]:
+        keys = {self.prefix + "seen:" + user_id: user_id for user_id in user_ids}
+        return {keys[key]: seen for key, seen in self.cache.get_many(list(keys)).items()}
+
+    def set_last_seen_many(self, last_seen: Dict[str, float]) -> None:
+        current = self.get_last_seen_many(last_seen)  # Never move a newer value from another process back
+        self.cache.set_many({
+            self.prefix + "seen:" + user_id: max(seen, current.get(user_id, seen))
+            for user_id, seen in last_seen.items()
+        }, self.timeout)
+
+
+# ── Manager ────────────────────────────────────────────────────────────────────
+
+class SyncCastPresenceManager:
+    """
+    Turns client heartbeats into presence transitions.
+
+    `heartbeat()` only touches memory: it records when the user was last seen
+    and compares the reported status with the store. Only real transitions
+    are published, collected for up to `flush_interval` seconds and sent as one
+    batch for all users. `last_seen_at` (and the status of transitioned users)
+    is written behind every `write_interval` seconds with bulk `UPDATE`s, which
+    do not bump the rows' `auto_now` timestamps; presence rows are created for
+    users that have none. Users silent for `offline_after` seconds transition
+    to offline, unless the store saw them more recently in another process
+    (last-seen times are pushed to it on every flush).
+
+    Metrics recorded (see `SyncCastMetrics`): counters `presence.heartbeats`,
+    `presence.transitions`, `presence.rows_written`, timer `presence.write`.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        template: Optional[SyncCastTopicTemplate] = None,
+        store: Optional[SyncCastPresenceStore] = None,
+        model: Optional[Any] = None,
+        using: Optional[str] = None,
+        flush_interval: float = 0.5,
+        write_interval: float = 30.0,
+        offline_after: Optional[float] = 90.0,
+        chunk_size: int = 1000,
+        metrics: Optional[SyncCastMetrics] = None,
+        flush_on_exit: bool = True,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.service = service
+        self.template = template
+        self.store = store or InMemoryPresenceStore()
+        self._model = model
+        self.using = using
+        self.flush_interval = flush_interval
+        self.write_interval = write_interval
+        self.offline_after = offline_after
+        self.chunk_size = chunk_size
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+        self._cond = threading.Condition()
+        self._last_seen: Dict[str, Tuple[float, Optional[str]]] = {}  # user -> (epoch seconds, topic)
+        self._seen_shared: Dict[str, float] = {}
+        self._seen_dirty: Dict[str, Any] = {}
+        self._status_dirty: Dict[str, str] = {}
+        self._transitions: List[Dict[str, Any]] = []
+        self._last_write = time.monotonic()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._flush_on_exit = flush_on_exit
+        if flush_on_exit:
+            atexit.register(self.close)
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = get_concrete_presence_model()
+        return self._model
+
+    # ── Heartbeats ──────────────────────────────────────────────────────────────
+
+    def heartbeat(
+        self,
+        user_id: Union[int, str],
+        status: str = "online",
+        topic: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Record a heartbeat. Returns True if it changed the user's status.
+
+        The transition is published on `topic` (remembered for later automatic
+        offline transitions), or on the manager's `template` rendered for the user.
+        """
+        user_id = str(user_id)
+        now = timezone.now()
+
+        with self._cond:
+            self._ensure_worker()
+            topic = topic or self._topic_for(user_id)
+            self._last_seen[user_id] = (now.timestamp(), topic)
+            self._seen_shared[user_id] = now.timestamp()
+            self._seen_dirty[user_id] = now
+        self.metrics.incr("presence.heartbeats")
+
+        if (self.store.get_status(user_id) or OFFLINE) == status:
+            return False
+
+        self._transition(user_id, status, topic, data)
+        return True
+
+    def disconnect(self, user_id: Union[int, str], topic: Optional[str] = None) -> bool:
+        """
+        Mark the user offline now.
+        """
+        user_id = str(user_id)
+        with self._cond:
+            topic = topic or self._topic_for(user_id)
+            self._last_seen.pop(user_id, None)
+            self._seen_shared.pop(user_id, None)
+
+        if (self.store.get_status(user_id) or OFFLINE) == OFFLINE:
+            return False
+
+        with self._cond:
+            self._ensure_worker()
+        self._transition(user_id, OFFLINE, topic, None)
+        return True
+
+    def _topic_for(self, user_id: str) -> Optional[str]:
+        """
+        Must be called with the condition held.
+        """
+        seen = self._last_seen.get(user_id)
+        if seen is not None and seen[1]:
+            return seen[1]
+        return self.template.render(user_id) if self.template else None
+
+    def _transition(self, user_id: str, status: str, topic: Optional[str], data: Optional[Dict[str, Any]]) -> None:
+        """
+        Must be called without the condition held: the store may be remote.
+        """
+        self.store.set_status(user_id, status)
+        with self._cond:
+            self._status_dirty[user_id] = status
+            self._transitions.append({
+                "user_id": user_id,
+                "topic": topic,
+                "data": {**(data or {}), "status": status},
+            })
+        self.metrics.incr("presence.transitions")
+
+    # ── Background work ─────────────────────────────────────────────────────────
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="synccast-presence", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed:  # `close()` may have notified before this thread waited
+                    self._cond.wait(self.flush_interval)
+                if self._closed:
+                    return
+            close_old_connections()
+            try:
+                self.flush(write=time.monotonic() - self._last_write >= self.write_interval)
+            except Exception as e:
+                self.logger.error(f"[SyncCastPresenceManager] Flush failed: {e}")
+            finally:
+                close_old_connections()
+
+    def _share_last_seen(self) -> None:
+        """
+        Push the last-seen times recorded since the previous flush to the store.
+        """
+        with self._cond:
+            seen, self._seen_shared = self._seen_shared, {}
+        if seen:
+            self.store.set_last_seen_many(seen)
+
+    def _expire(self) -> None:
+        """
+        Transition users silent for `offline_after` to offline. Users the
+        store saw more recently (in another process) are kept until that
+        time is `offline_after` old as well.
+        """
+        if self.offline_after is None:
+            return
+        cutoff = time.time() - self.offline_after
+        with self._cond:
+            silent = [(user, topic) for user, (seen, topic) in self._last_seen.items() if seen < cutoff]
+            for user_id, _ in silent:
+                del self._last_seen[user_id]
+        if not silent:
+            return
+
+        shared = self.store.get_last_seen_many([user_id for user_id, _ in silent])
+        for user_id, topic in silent:
+            seen = shared.get(user_id)
+            if seen is not None and seen >= cutoff:
+                with self._cond:
+                    self._last_seen.setdefault(user_id, (seen, topic))  # Unless a heartbeat arrived meanwhile
+                continue
+            if (self.store.get_status(user_id) or OFFLINE) != OFFLINE:
+                self._transition(user_id, OFFLINE, topic, None)
+
+    def flush(self, write: bool = True) -> int:
+        """
+        Publish pending transitions as one batch and, with `write=True`,
+        write `last_seen_at` and statuses behind.
+
+        Returns:
+            int: Number of transitions published.
+        """
+        self._share_last_seen()
+        self._expire()
+        with self._cond:
+            transitions, self._transitions = self._transitions, []
+
+        self._publish(transitions)
+        if write:
+            self.write_behind()
+        return len(transitions)
+
+    def _publish(self, transitions: List[Dict[str, Any]]) -> None:
+        if not transitions:
+            return
+
+        service = self.service
+        payloads = []
+        for transition in transitions:
+            if not transition["topic"]:
+                self.logger.warning(f"[SyncCastPresenceManager] No topic for user {transition['user_id']}; skipped")
+                continue
+            payloads.append(service.build_payload(**transition))
+        if not payloads:
+            return
+
+        post_encoded = getattr(service.dispatcher, "post_encoded", None)
+        try:
+            if post_encoded is not None:
+                serializer = getattr(service.dispatcher, "serializer", None)
+                post_encoded([encode_batch_entry(service.endpoint, payload, serializer) for payload in payloads])
+            else:
+                for payload in payloads:
+                    service.dispatcher.post(service.endpoint, json=payload)
+        except Exception as e:
+            self.logger.error(f"[SyncCastPresenceManager] Publishing {len(payloads)} transitions failed: {e}")
+
+    def write_behind(self) -> int:
+        """
+        Bulk-write pending `last_seen_at` values and statuses.
+
+        `last_seen_at` is set to each user's latest heartbeat of the write
+        interval with one `UPDATE ... CASE` per chunk of users; statuses with
+        one `UPDATE` per status value.
+
+        Returns:
+            int: Number of rows updated or created.
+        """
+        with self._cond:
+            seen, self._seen_dirty = self._seen_dirty, {}
+            statuses, self._status_dirty = self._status_dirty, {}
+            self._last_write = time.monotonic()
+
+        if not seen and not statuses:
+            return 0
+
+        try:
+            written = self._write(seen, statuses)
+        except Exception:
+            # Keep the values for the next write; newer ones recorded meanwhile win
+            with self._cond:
+                self._seen_dirty = {**seen, **self._seen_dirty}
+                self._status_dirty = {**statuses, **self._status_dirty}
+            raise
+
+        self.metrics.incr("presence.rows_written", written)
+        return written
+
+    def _write(self, seen: Dict[str, Any], statuses: Dict[str, str]) -> int:
+        manager = self.model.objects.using(self.using)
+        written = 0
+        with self.metrics.timer("presence.write"):
+            if seen:
+                users = list(seen)
+                for start in range(0, len(users), self.chunk_size):
+                    chunk = users[start:start + self.chunk_size]
+                    stamps = Case(
+                        *(When(user_id=user_id, then=Value(seen[user_id])) for user_id in chunk),
+                        output_field=DateTimeField()
+                    )
+                    written += manager.filter(user_id__in=chunk).update(last_seen_at=stamps)
+
+            by_status: Dict[str, List[str]] = {}
+            for user_id, status in statuses.items():
+                by_status.setdefault(status, []).append(user_id)
+
+            now = timezone.now()
+            for status, users in by_status.items():
+                for start in range(0, len(users), self.chunk_size):
+                    chunk = users[start:start + self.chunk_size]
+                    written += manager.filter(user_id__in=chunk).update(status=status, last_updated_at=now)
+
+            if statuses:
+                existing = {str(pk) for pk in manager.filter(user_id__in=list(statuses)).values_list("user_id", flat=True)}
+                missing = [
+                    self.model(user_id=user_id, status=status, last_seen_at=seen.get(user_id, now))
+                    for user_id, status in statuses.items() if user_id not in existing
+                ]
+                manager.bulk_create(missing, batch_size=self.chunk_size)
+                written += len(missing)
+
+        return written
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread, publishing and writing whatever is pending.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        try:
+            self.flush(write=True)
+        except Exception as e:
+            self.logger.error(f"[SyncCastPresenceManager] Final flush failed: {e}")
+
+        if self._flush_on_exit:
+            atexit.unregister(self.close)
+            self._flush_on_exit = False
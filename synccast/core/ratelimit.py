@@ -0,0 +1,201 @@
+# Default package imports
+import time
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Iterable, Tuple
+
+# SyncCast enums
+from synccast.core.enums import SyncCastPriorityLevel
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastRateLimitError
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a `Retry-After` header (delta-seconds or HTTP-date).
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _Bucket:
+    """
+    Token bucket of one (app_id, endpoint). `updated` may lie in the future
+    while a `Retry-After` pause is in effect; no tokens accrue until then.
+    """
+
+    __slots__ = ("rate", "tokens", "updated", "last_decrease")
+
+    def __init__(self, rate: float, now: float):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = now
+        self.last_decrease = 0.0
+
+
+class SyncCastRateLimiter:
+    """
+    Client-side token-bucket limiter shared by every thread (and dispatcher)
+    of the process, with one bucket per (app_id, endpoint).
+
+    The rate adapts AIMD-style: each successful request raises it so that it
+    grows by about `increase` requests/s per second of traffic, up to
+    `max_rate`; a 429 multiplies it by `decrease` (at most once per
+    `cooldown` seconds, so a burst of 429s counts once) down to `min_rate`,
+    and a `Retry-After` pauses the bucket until then. Callers wait for a token
+    instead of retrying in lockstep.
+
+    When a token is not immediately available, events of `shed_priorities`
+    (`LOW` by default) are rejected with `SyncCastRateLimitError` rather than
+    queued; others wait up to `max_wait` seconds before being rejected.
+
+    Metrics recorded (see `SyncCastMetrics`): gauge `ratelimit.<endpoint>.rate`,
+    timer `ratelimit.wait`, counters `ratelimit.throttled` and `ratelimit.shed`.
+    """
+
+    def __init__(
+        self,
+        rate: float = 50.0,
+        min_rate: float = 1.0,
+        max_rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        max_wait: Optional[float] = 5.0,
+        shed_priorities: Iterable[Any] = (SyncCastPriorityLevel.LOW,),
+        metrics: Optional[SyncCastMetrics] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate * 10
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.max_wait = max_wait
+        self.shed_priorities = {getattr(priority, "value", priority) for priority in shed_priorities}
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[Any, str], _Bucket] = {}
+
+    def _bucket(self, key: Tuple[Any, str], now: float) -> _Bucket:
+        """
+        Must be called with the lock held.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.initial_rate, now)
+        return bucket
+
+    def _refill(self, bucket: _Bucket, now: float) -> None:
+        """
+        Must be called with the lock held.
+        """
+        if now > bucket.updated:
+            capacity = self.burst or max(1.0, bucket.rate)
+            bucket.tokens = min(capacity, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+
+    def rate(self, key: Tuple[Any, str]) -> float:
+        """
+        Current rate (requests/s) of `key`.
+        """
+        with self._lock:
+            bucket = self._buckets.get(key)
+            return bucket.rate if bucket is not None else self.initial_rate
+
+    def reserve(self, key: Tuple[Any, str], priority: Any = None) -> float:
+        """
+        Take a token for `key` and return how long to wait before using it,
+        without sleeping (for async callers).
+
+        Raises:
+            SyncCastRateLimitError: If the event is shed or would wait longer than `max_wait`.
+        """
+        priority = getattr(priority, "value", priority)
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._bucket(key, now)
+            self._refill(bucket, now)
+            wait = max(bucket.updated - now, 0.0) + max(1.0 - bucket.tokens, 0.0) / bucket.rate
+
+            if wait > 0 and (
+                priority in self.shed_priorities or (self.max_wait is not None and wait > self.max_wait)
+            ):
+                self.metrics.incr("ratelimit.shed")
+                raise SyncCastRateLimitError(
+                    message="Rate limit budget exhausted",
+                    extra={"app_id": key[0], "endpoint": key[1], "priority": priority, "wait": wait, "rate": bucket.rate}
+                )
+
+            bucket.tokens -= 1.0  # May go negative: later callers queue behind this reservation
+
+        self.metrics.observe("ratelimit.wait", wait)
+        return wait
+
+    def acquire(self, key: Tuple[Any, str], priority: Any = None) -> float:
+        """
+        Block until a token for `key` is available.
+
+        Returns:
+            float: Seconds waited.
+        """
+        wait = self.reserve(key, priority)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self, key: Tuple[Any, str]) -> None:
+        """
+        Additive increase after a request that was not throttled.
+        """
+        with self._lock:
+            bucket = self._bucket(key, time.monotonic())
+            if bucket.rate < self.max_rate:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase / bucket.rate)
+            rate = bucket.rate
+        self.metrics.gauge(f"ratelimit.{key[1].strip('/')}.rate", rate)
+
+    def on_throttled(self, key: Tuple[Any, str], retry_after: Optional[float] = None) -> None:
+        """
+        Multiplicative decrease after a 429, pausing the bucket for `retry_after` seconds.
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(key, now)
+            self._refill(bucket, now)
+            if now - bucket.last_decrease >= self.cooldown:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                bucket.last_decrease = now
+            bucket.tokens = min(bucket.tokens, 0.0)
+            if retry_after:
+                bucket.updated = max(bucket.updated, now + retry_after)
+            rate = bucket.rate
+
+        self.metrics.incr("ratelimit.throttled")
+        self.metrics.gauge(f"ratelimit.{key[1].strip('/')}.rate", rate)
+        self.logger.warning(
+            f"[SyncCastRateLimiter] {key[1]} throttled; rate now {rate:.1f}/s"
+            + (f", paused {retry_after:.1f}s" if retry_after else "")
+        )
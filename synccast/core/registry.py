@@ -0,0 +1,202 @@
+# Default package imports
+import time
+import logging
+import threading
+from typing import Optional, Dict, Any, FrozenSet
+
+# Django imports
+from django.apps import apps
+from django.conf import settings
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+def get_concrete_scope_model():
+    """
+    Dynamically find the concrete model subclassing AbstractSyncCastScope.
+    """
+    from synccast.models.scope import AbstractSyncCastScope
+
+    for model in apps.get_models():
+        if issubclass(model, AbstractSyncCastScope) and not model._meta.abstract:
+            return model
+
+    raise LookupError("No concrete model found inheriting from AbstractSyncCastScope.")
+
+
+def get_concrete_channel_model():
+    """
+    Dynamically find the concrete model subclassing AbstractSyncCastChannel.
+    """
+    from synccast.models.channel import AbstractSyncCastChannel
+
+    for model in apps.get_models():
+        if issubclass(model, AbstractSyncCastChannel) and not model._meta.abstract:
+            return model
+
+    raise LookupError("No concrete model found inheriting from AbstractSyncCastChannel.")
+
+
+def get_channel_accessor(scope_model) -> str:
+    """
+    Name of the reverse relation from the scope model to its channels
+    (the related name is chosen by the concrete channel model).
+    """
+    from synccast.models.channel import AbstractSyncCastChannel
+
+    for field in scope_model._meta.get_fields():
+        if (
+            field.is_relation
+            and field.auto_created
+            and not field.concrete
+            and field.related_model is not None
+            and issubclass(field.related_model, AbstractSyncCastChannel)
+        ):
+            return field.get_accessor_name()
+
+    raise LookupError("No SyncCastChannel reverse relation found on scope model.")
+
+
+class _ScopeEntry:
+    """
+    A cached scope instance and the names of its channels.
+    """
+
+    __slots__ = ("scope", "channels")
+
+    def __init__(self, scope: Any, channels: FrozenSet[str]):
+        self.scope = scope
+        self.channels = channels
+
+
+class SyncCastScopeRegistry:
+    """
+    Process-local cache of every scope and its channel names, so building a
+    topic is a dictionary lookup instead of 2-3 queries.
+
+    The registry loads all scopes and channels in two queries on first use.
+    Saving or deleting a scope or channel in this process invalidates it via
+    `post_save` / `post_delete` (connected in `SynccastConfig.ready`). Changes
+    made by other processes, or through `QuerySet.update()` / `bulk_create()`
+    which send no signals, are picked up once the cache is older than `ttl`
+    seconds (`SYNCCAST_REGISTRY_TTL`, default 300).
+
+    A scope missing from the cache is looked up directly before being reported
+    as unknown, and so is a cached scope that lacks a requested channel, so
+    newly created scopes and channels never fail while the cache is warm.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _ScopeEntry] = {}
+        self._loaded_at: Optional[float] = None
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is None:
+            return getattr(settings, "SYNCCAST_REGISTRY_TTL", 300.0)
+        return self._ttl
+
+    def _is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    # ── Loading ─────────────────────────────────────────────────────────────────
+
+    def load(self) -> 'SyncCastScopeRegistry':
+        """
+        (Re)load every scope with its channel names.
+        """
+        ScopeModel = get_concrete_scope_model()
+        accessor = get_channel_accessor(ScopeModel)
+
+        entries = {
+            scope.name: _ScopeEntry(scope, frozenset(c.name for c in getattr(scope, accessor).all()))
+            for scope in ScopeModel.objects.prefetch_related(accessor)
+        }
+
+        with self._lock:
+            self._entries = entries
+            self._loaded_at = time.monotonic()
+        return self
+
+    def _load_one(self, name: str) -> Optional[_ScopeEntry]:
+        ScopeModel = get_concrete_scope_model()
+        accessor = get_channel_accessor(ScopeModel)
+
+        scope = ScopeModel.objects.prefetch_related(accessor).filter(name=name).first()
+        if scope is None:
+            return None
+
+        entry = _ScopeEntry(scope, frozenset(c.name for c in getattr(scope, accessor).all()))
+        with self._lock:
+            self._entries = {**self._entries, name: entry}
+        return entry
+
+    def invalidate(self, *args, **kwargs) -> None:
+        """
+        Drop the cache; the next lookup reloads it. Usable as a signal receiver.
+        """
+        with self._lock:
+            self._loaded_at = None
+
+    # ── Lookups ─────────────────────────────────────────────────────────────────
+
+    def get(self, name: str) -> Optional[_ScopeEntry]:
+        """
+        Cached entry for scope `name`, or None if no such scope exists.
+        """
+        if not self._is_fresh():
+            self.load()
+
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = self._load_one(name)
+        return entry
+
+    def scope(self, name: str) -> Any:
+        """
+        The scope instance named `name`.
+
+        Raises:
+            LookupError: If no such scope exists.
+        """
+        entry = self.get(name)
+        if entry is None:
+            raise LookupError(f"Scope '{name}' does not exist.")
+        return entry.scope
+
+    def channels(self, scope: Any, channel: Optional[str] = None) -> FrozenSet[str]:
+        """
+        Channel names of `scope` (a scope instance or name). With `channel`,
+        the scope is reloaded once if that name is missing from the cache.
+        """
+        name = scope if isinstance(scope, str) else scope.name
+        entry = self.get(name)
+        if entry is not None and channel is not None and channel not in entry.channels:
+            entry = self._load_one(name)  # Created since the cache was loaded?
+        if entry is None:
+            raise LookupError(f"Scope '{name}' does not exist.")
+        return entry.channels
+
+    def connect_signals(self) -> None:
+        """
+        Invalidate on saves and deletes of the concrete scope and channel models.
+        """
+        from django.db.models.signals import post_save, post_delete
+
+        for get_model in (get_concrete_scope_model, get_concrete_channel_model):
+            try:
+                model = get_model()
+            except LookupError:
+                continue
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    self.invalidate, sender=model, weak=False,
+                    dispatch_uid=f"synccast-registry-{model._meta.label}"
+                )
+
+
+# Shared registry used by `SyncCastTopicBuilder`
+scope_registry = SyncCastScopeRegistry()
@@ -0,0 +1,148 @@
+# Default package imports
+import time
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+from typing import Optional, Dict, List, Iterable, Deque
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastValidationError
+
+
+class _Route:
+    """
+    Health of one base URL: EWMA latency and failure rate, recent latencies.
+    """
+
+    __slots__ = ("base_url", "name", "latency", "error_rate", "updated", "used", "samples")
+
+    def __init__(self, base_url: str, sample_size: int):
+        self.base_url = base_url
+        self.name = urlsplit(base_url).netloc or base_url
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.updated = 0.0
+        self.used = 0.0
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+
+
+class SyncCastEndpointRouter:
+    """
+    Chooses between several SyncCast base URLs (e.g. one ingress per region)
+    by observed latency and error rate.
+
+    Every call recorded for a base URL updates an EWMA of its latency and of
+    its failure rate, weighting the newest call by `alpha`. `ranked()` orders
+    the URLs best first by expected cost,
+    `latency * (1 + error_penalty * error_rate)`; URLs not called yet rank
+    first (in configured order), so each one gets measured, and a URL that
+    got no traffic for `probe_interval` seconds ranks first once, so its
+    figures do not go stale. Meanwhile its error rate decays with a half-life
+    of `error_half_life` seconds.
+
+    `hedge_delay(base_url)` is the 95th percentile of the URL's last
+    `sample_size` successful latencies (at least `min_hedge_delay`), or None
+    before `min_samples` of them were seen: how long to wait for it before
+    sending a hedged copy of a request elsewhere.
+
+    Shareable between dispatchers. Metrics recorded (see `SyncCastMetrics`):
+    gauges `routing.<host>.latency` and `routing.<host>.error_rate`.
+    """
+
+    def __init__(
+        self,
+        base_urls: Iterable[str],
+        alpha: float = 0.2,
+        error_penalty: float = 10.0,
+        error_half_life: float = 30.0,
+        probe_interval: Optional[float] = 10.0,
+        sample_size: int = 200,
+        min_samples: int = 20,
+        min_hedge_delay: float = 0.01,
+        metrics: Optional[SyncCastMetrics] = None
+    ):
+        self.base_urls: List[str] = [url.rstrip("/") for url in base_urls]
+        if not self.base_urls:
+            raise SyncCastValidationError(
+                message="SyncCastEndpointRouter needs at least one base URL",
+                extra={"provided": base_urls}
+            )
+
+        self.alpha = alpha
+        self.error_penalty = error_penalty
+        self.error_half_life = error_half_life
+        self.probe_interval = probe_interval
+        self.min_samples = min_samples
+        self.min_hedge_delay = min_hedge_delay
+        self.metrics = metrics or SyncCastMetrics()
+
+        self._lock = threading.Lock()
+        self._routes: Dict[str, _Route] = {url: _Route(url, sample_size) for url in self.base_urls}
+
+    def _error_rate(self, route: _Route, now: float) -> float:
+        if not route.error_rate or not self.error_half_life:
+            return route.error_rate
+        return route.error_rate * 0.5 ** ((now - route.updated) / self.error_half_life)
+
+    def _cost(self, route: _Route, now: float) -> float:
+        if route.latency is None:
+            return 0.0
+        if self.probe_interval is not None and now - route.used >= self.probe_interval:
+            return -1.0
+        return route.latency * (1.0 + self.error_penalty * self._error_rate(route, now))
+
+    def ranked(self) -> List[str]:
+        """
+        Base URLs, best first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            ranked = sorted(self.base_urls, key=lambda url: self._cost(self._routes[url], now))
+            self._routes[ranked[0]].used = now
+        return ranked
+
+    def best(self) -> str:
+        return self.ranked()[0]
+
+    def record(self, base_url: str, elapsed: float, failed: bool) -> None:
+        """
+        Account a call to `base_url` that took `elapsed` seconds.
+        """
+        now = time.monotonic()
+        with self._lock:
+            route = self._routes[base_url]
+            route.error_rate = self._error_rate(route, now)
+            route.error_rate += self.alpha * ((1.0 if failed else 0.0) - route.error_rate)
+            route.latency = elapsed if route.latency is None else route.latency + self.alpha * (elapsed - route.latency)
+            route.updated = route.used = now
+            if not failed:
+                route.samples.append(elapsed)
+            latency, error_rate = route.latency, route.error_rate
+
+        self.metrics.gauge(f"routing.{route.name}.latency", latency)
+        self.metrics.gauge(f"routing.{route.name}.error_rate", error_rate)
+
+    def hedge_delay(self, base_url: str) -> Optional[float]:
+        """
+        Seconds to wait for `base_url` before hedging, or None without enough samples.
+        """
+        with self._lock:
+            samples = sorted(self._routes[base_url].samples)
+        if len(samples) < self.min_samples:
+            return None
+        return max(self.min_hedge_delay, samples[min(len(samples) - 1, int(len(samples) * 0.95))])
+
+    def stats(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Current latency, error rate and hedge delay per base URL.
+        """
+        now = time.monotonic()
+        with self._lock:
+            routes = [(url, self._routes[url].latency, self._error_rate(self._routes[url], now)) for url in self.base_urls]
+        return {
+            url: {"latency": latency, "error_rate": error_rate, "hedge_delay": self.hedge_delay(url)}
+            for url, latency, error_rate in routes
+        }
@@ -0,0 +1,87 @@
+# Default package imports
+import json
+from abc import ABC, abstractmethod
+from typing import Optional, Any, Dict
+
+# Optional accelerated JSON encoder
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class SyncCastSerializer(ABC):
+    """
+    Encodes payloads to request bodies. Each payload is encoded exactly once,
+    at the point it is written to the wire, and sent as `bytes`.
+    """
+
+    name: str = "base"
+    content_type: str = "application/json"
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode `obj` to a request body.
+        """
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a body produced by `dumps()`.
+        """
+
+
+class JSONSerializer(SyncCastSerializer):
+    """
+    Standard-library encoder producing compact UTF-8 JSON.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer(SyncCastSerializer):
+    """
+    `orjson`-backed encoder; several times faster than the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonSerializer requires the 'orjson' package")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+SERIALIZERS: Dict[str, type] = {
+    JSONSerializer.name: JSONSerializer,
+    OrjsonSerializer.name: OrjsonSerializer,
+}
+
+_default: Optional[SyncCastSerializer] = None
+
+
+def get_serializer(name: Optional[str] = None) -> SyncCastSerializer:
+    """
+    Serializer by `name` ("json", "orjson"), or the default: `orjson` when
+    installed, the standard library otherwise.
+    """
+    global _default
+
+    if name is not None:
+        return SERIALIZERS[name]()
+
+    if _default is None:
+        _default = OrjsonSerializer() if orjson is not None else JSONSerializer()
+    return _default
@@ -0,0 +1,318 @@
+# Default package imports
+import os
+import json
+import time
+import logging
+import threading
+from typing import Optional, Dict, Any, List, Iterator, Tuple, BinaryIO
+
+# Django imports
+from django.conf import settings
+
+# SyncCast payload serializers
+from synccast.core.serializers import SyncCastSerializer, get_serializer
+
+# SyncCast service endpoints and batch encoding
+from synccast.core.endpoints import PushEndpoints
+from synccast.core.batching import encode_batch_entry
+
+# SyncCast bulk pacing
+from synccast.core.bulk import SyncCastRatePacer
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+FSYNC_ALWAYS = "always"
+FSYNC_INTERVAL = "interval"
+FSYNC_NEVER = "never"
+
+OPEN_SUFFIX = ".open"
+SEALED_SUFFIX = ".seg"
+INDEX_FILE = "index.json"
+
+
+def _segment_key(name: str) -> str:
+    """
+    Index key of segment `name`: its name without the suffix, so a position
+    recorded while the segment was open still applies once it is sealed.
+    """
+    return os.path.splitext(name)[0]
+
+
+def _writer_alive(name: str) -> bool:
+    """
+    Whether the process that owns open segment `name` is still running.
+    """
+    pid = int(name[: -len(OPEN_SUFFIX)].rsplit("-", 1)[1])
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SyncCastSpool:
+    """
+    Append-only on-disk spool for events that could not be delivered.
+
+    Each event is stored as its encoded batch entry (`{"endpoint", "payload"}`)
+    on one line of a segment file, so replay forwards the lines as-is without
+    decoding them. Every process appends to its own segment
+    (`<time_ns>-<pid>.open`), sealed to `.seg` once it reaches
+    `segment_bytes`, is older than `segment_seconds` (checked by a timer, so
+    a segment that stopped receiving writes is sealed too), or the spool is
+    closed; segments left open by a dead process count as sealed.
+
+    `fsync` controls durability: "always" syncs every append, "interval" at
+    most every `fsync_interval` seconds (and on seal), "never" leaves it to
+    the OS.
+
+    `replay()` streams sealed segments in name (i.e. time) order, posts their
+    entries in batches at up to `rate` events per second, records its
+    position in `index.json` after every batch and deletes each segment once
+    fully replayed. A failed batch stops the replay; the next one resumes
+    from the recorded position.
+
+    The spool is also a circuit-breaker fallback: `spool(endpoint, payload)`.
+    Directory defaults to `SYNCCAST_SPOOL_DIR`.
+
+    Metrics recorded (see `SyncCastMetrics`, when given): counters
+    `spool.written` and `spool.replayed`.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        segment_bytes: int = 16 * 1024 * 1024,
+        segment_seconds: float = 60.0,
+        fsync: str = FSYNC_INTERVAL,
+        fsync_interval: float = 1.0,
+        serializer: Optional[SyncCastSerializer] = None,
+        metrics: Optional[Any] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.directory = directory or getattr(settings, "SYNCCAST_SPOOL_DIR", None) or "synccast-spool"
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.serializer = serializer or get_serializer()
+        self.metrics = metrics
+        self.logger = logger_instance or logger
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = None
+        self._path: Optional[str] = None
+        self._pid: Optional[int] = None
+        self._opened_at = 0.0
+        self._last_sync = 0.0
+        self._timer: Optional[threading.Timer] = None
+
+    # ── Writing ─────────────────────────────────────────────────────────────────
+
+    def __call__(self, endpoint: str, payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {"spooled": self.spool(endpoint, payload)}
+
+    def spool(self, endpoint: str, payload: Optional[Dict[str, Any]]) -> int:
+        """
+        Append an event (or each event of a batch payload) to the spool.
+
+        Returns:
+            int: Number of events written.
+        """
+        if endpoint == PushEndpoints.BATCH and isinstance(payload, dict) and "events" in payload:
+            entries = [encode_batch_entry(event["endpoint"], event["payload"], self.serializer) for event in payload["events"]]
+        else:
+            entries = [encode_batch_entry(endpoint, payload or {}, self.serializer)]
+        return self.write(entries)
+
+    def write(self, entries: List[bytes]) -> int:
+        """
+        Append pre-encoded batch entries.
+        """
+        data = b"".join(entry + b"\n" for entry in entries)
+        with self._lock:
+            handle = self._segment(len(data))
+            handle.write(data)
+            handle.flush()
+
+            now = time.monotonic()
+            if self.fsync == FSYNC_ALWAYS or (self.fsync == FSYNC_INTERVAL and now - self._last_sync >= self.fsync_interval):
+                os.fsync(handle.fileno())
+                self._last_sync = now
+
+        if self.metrics is not None:
+            self.metrics.incr("spool.written", len(entries))
+        return len(entries)
+
+    def _segment(self, incoming: int) -> BinaryIO:
+        """
+        The segment to append `incoming` bytes to, sealing the current one
+        when it is full or too old. Must be called with the lock held.
+        """
+        if self._file is not None and (
+            self._pid != os.getpid()  # Forked: never write to the parent's segment
+            or (self._file.tell() and self._file.tell() + incoming > self.segment_bytes)
+            or time.monotonic() - self._opened_at >= self.segment_seconds
+        ):
+            self._seal()
+
+        if self._file is None:
+            self._pid = os.getpid()
+            self._path = os.path.join(self.directory, f"{time.time_ns():020d}-{self._pid}{OPEN_SUFFIX}")
+            self._file = open(self._path, "ab")
+            self._opened_at = time.monotonic()
+            self._timer = threading.Timer(self.segment_seconds, self._seal_expired, args=(self._path,))
+            self._timer.name = "synccast-spool-seal"
+            self._timer.daemon = True
+            self._timer.start()
+        return self._file
+
+    def _seal_expired(self, path: str) -> None:
+        """
+        Timer callback: seal segment `path` if it is still the current one.
+        """
+        with self._lock:
+            if self._file is not None and self._path == path and self._pid == os.getpid():
+                self._seal()
+
+    def _seal(self) -> None:
+        """
+        Must be called with the lock held.
+        """
+        handle, path, self._file, self._path = self._file, self._path, None, None
+        if self._pid != os.getpid():
+            return  # The parent process seals its own segment
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self.fsync != FSYNC_NEVER:
+            os.fsync(handle.fileno())
+        handle.close()
+        os.replace(path, path[: -len(OPEN_SUFFIX)] + SEALED_SUFFIX)
+
+    def seal(self) -> None:
+        """
+        Seal the current segment so that it can be replayed.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._seal()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self.seal()
+
+    # ── Replay ──────────────────────────────────────────────────────────────────
+
+    def segments(self, include_open: bool = False) -> List[str]:
+        """
+        Replayable segment paths, oldest first: sealed segments, segments
+        left open by dead processes and, with `include_open`, those still
+        being written (except this process's own).
+        """
+        paths = []
+        for name in os.listdir(self.directory):
+            if name.endswith(SEALED_SUFFIX):
+                paths.append(name)
+            elif name.endswith(OPEN_SUFFIX):
+                own = os.path.join(self.directory, name) == self._path
+                if not own and (include_open or not _writer_alive(name)):
+                    paths.append(name)
+        return [os.path.join(self.directory, name) for name in sorted(paths)]
+
+    def _read_index(self) -> Dict[str, int]:
+        try:
+            with open(os.path.join(self.directory, INDEX_FILE), "rb") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return {}
+
+    def _write_index(self, index: Dict[str, int]) -> None:
+        path = os.path.join(self.directory, INDEX_FILE)
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "w") as handle:
+            json.dump(index, handle)
+            handle.flush()
+            if self.fsync != FSYNC_NEVER:
+                os.fsync(handle.fileno())
+        os.replace(temp, path)
+
+    @staticmethod
+    def _iter_batches(path: str, offset: int, batch_size: int) -> Iterator[Tuple[List[bytes], int]]:
+        """
+        Yield `(entries, end_offset)` batches of complete lines from `offset`.
+        A trailing partial line (a write in progress) is left for later.
+        """
+        with open(path, "rb") as handle:
+            handle.seek(offset)
+            batch: List[bytes] = []
+            position = offset
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                position += len(line)
+                if line.strip():
+                    batch.append(line.rstrip(b"\n"))
+                if len(batch) >= batch_size:
+                    yield batch, position
+                    batch = []
+            if batch or position != offset:
+                yield batch, position
+
+    def replay(
+        self,
+        dispatcher: Any,
+        batch_size: int = 500,
+        rate: Optional[float] = None,
+        limit: Optional[int] = None,
+        include_open: bool = False
+    ) -> int:
+        """
+        Re-send spooled events in order through `dispatcher.post_encoded`,
+        compacting the segments that were fully replayed.
+
+        Returns:
+            int: Number of events delivered.
+        """
+        pacer = SyncCastRatePacer(rate) if rate else None
+        index = self._read_index()
+        delivered = 0
+
+        for path in self.segments(include_open=include_open):
+            name = os.path.basename(path)
+            key = _segment_key(name)
+            offset = index.get(key, 0)
+            sealed = not name.endswith(OPEN_SUFFIX) or not _writer_alive(name)
+
+            for entries, end in self._iter_batches(path, offset, batch_size if limit is None else min(batch_size, limit - delivered)):
+                if entries:
+                    if pacer is not None:
+                        pacer.acquire(len(entries))
+                    try:
+                        dispatcher.post_encoded(entries)
+                    except Exception as e:
+                        self.logger.error(f"[SyncCastSpool] Replay of {name} stopped at offset {offset}: {e}")
+                        self._write_index(index)
+                        return delivered
+                    delivered += len(entries)
+                    if self.metrics is not None:
+                        self.metrics.incr("spool.replayed", len(entries))
+
+                offset = index[key] = end
+                self._write_index(index)
+                if limit is not None and delivered >= limit:
+                    break
+
+            if sealed and offset >= os.path.getsize(path):
+                os.remove(path)  # Compaction: the whole segment was delivered
+                index.pop(key, None)
+                self._write_index(index)
+
+            if limit is not None and delivered >= limit:
+                break
+
+        return delivered
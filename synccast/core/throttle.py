@@ -0,0 +1,218 @@
+# Default package imports
+import time
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Iterable, Tuple, Callable
+
+# SyncCast enums
+from synccast.core.enums import SyncCastEventType
+
+# SyncCast event IDs
+from synccast.core.payload import new_event_id
+
+# SyncCast metrics
+from synccast.core.metrics import SyncCastMetrics
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+class _TypingState:
+    """
+    Last published typing event of one user on one topic.
+    """
+
+    __slots__ = ("endpoint", "payload", "kwargs", "last_seen", "last_sent")
+
+    def __init__(self, endpoint: str, payload: Dict[str, Any], kwargs: Dict[str, Any], now: float):
+        self.endpoint = endpoint
+        self.payload = payload
+        self.kwargs = kwargs
+        self.last_seen = now
+        self.last_sent = now
+
+
+class SyncCastTypingThrottle:
+    """
+    Throttling stage for typing indicators, keyed by (user, topic).
+
+    The first event of a user on a topic is sent (the "start"); repeats with
+    the same `data` are suppressed while the user keeps typing, optionally
+    re-sent every `resend_after` seconds so subscribers can expire stale
+    indicators. A different `data` is a state change and is sent immediately;
+    sending `stop_data` ends the state. When no event arrives for
+    `idle_timeout` seconds, the stop event is emitted automatically. Active
+    states are also stopped by `close()`.
+
+    Suppressed calls return None instead of the dispatcher's result. Events
+    of other types pass straight through.
+
+    Metrics recorded (see `SyncCastMetrics`): counters `typing.sent`,
+    `typing.suppressed` and `typing.auto_stopped`, gauge `typing.active`.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Any,
+        idle_timeout: float = 5.0,
+        resend_after: Optional[float] = None,
+        stop_data: Optional[Dict[str, Any]] = None,
+        event_types: Iterable[Any] = (SyncCastEventType.USER_TYPING,),
+        metrics: Optional[SyncCastMetrics] = None,
+        stop_on_exit: bool = True,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        self.dispatcher = dispatcher
+        self.idle_timeout = idle_timeout
+        self.resend_after = resend_after
+        self.stop_data = {"typing": False} if stop_data is None else stop_data
+        self.event_types = {getattr(event_type, "value", event_type) for event_type in event_types}
+        self.metrics = metrics or SyncCastMetrics()
+        self.logger = logger_instance or logger
+
+        self._cond = threading.Condition()
+        # Ordered by last activity, so the first entry is always the next to expire
+        self._states: "OrderedDict[Tuple[Any, str], _TypingState]" = OrderedDict()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._stop_on_exit = stop_on_exit
+        if stop_on_exit:
+            atexit.register(self.close)
+
+    @property
+    def active(self) -> int:
+        """
+        Number of (user, topic) pairs currently considered typing.
+        """
+        return len(self._states)
+
+    # ── Submission ──────────────────────────────────────────────────────────────
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        Dispatcher-compatible entry point used by the services.
+        """
+        payload = json or {}
+        topic = payload.get("topic")
+        if self._closed or payload.get("type") not in self.event_types or not topic:
+            return self.dispatcher.post(endpoint, json=payload, **kwargs)
+
+        key = (payload.get("user_id"), topic)
+        data = payload.get("data") or {}
+        now = time.monotonic()
+
+        with self._cond:
+            state = self._states.get(key)
+
+            if data == self.stop_data:
+                if state is None:
+                    self.metrics.incr("typing.suppressed")  # Not typing (or already auto-stopped)
+                    return None
+                del self._states[key]
+
+            elif state is not None and state.payload.get("data") == data and (
+                self.resend_after is None or now - state.last_sent < self.resend_after
+            ):
+                state.last_seen = now
+                self._states.move_to_end(key)
+                self.metrics.incr("typing.suppressed")
+                return None
+
+            elif state is not None:
+                state.payload, state.kwargs = payload, kwargs
+                state.last_seen = state.last_sent = now
+                self._states.move_to_end(key)
+
+            else:
+                self._states[key] = _TypingState(endpoint, payload, kwargs, now)
+                self._ensure_worker()
+                self._cond.notify()
+
+            self.metrics.gauge("typing.active", len(self._states))
+
+        self.metrics.incr("typing.sent")
+        return self.dispatcher.post(endpoint, json=payload, **kwargs)
+
+    @property
+    def serializer(self) -> Any:
+        return getattr(self.dispatcher, "serializer", None)
+
+    @property
+    def post_encoded(self) -> Optional[Callable[[Iterable[bytes]], Any]]:
+        """
+        The wrapped dispatcher's `post_encoded`, if it has one: pre-encoded
+        batches (see `encode_fanout_entries`) pass straight through.
+        """
+        return getattr(self.dispatcher, "post_encoded", None)
+
+    # ── Auto-stop ───────────────────────────────────────────────────────────────
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="synccast-typing-throttle", daemon=True
+            )
+            self._thread.start()
+
+    def _take_expired(self, now: float) -> List[_TypingState]:
+        """
+        Remove and return the states idle for `idle_timeout`.
+        Must be called with the condition held.
+        """
+        expired = []
+        while self._states:
+            key, state = next(iter(self._states.items()))
+            if now - state.last_seen < self.idle_timeout:
+                break
+            expired.append(self._states.pop(key))
+        if expired:
+            self.metrics.gauge("typing.active", len(self._states))
+        return expired
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if not self._states:
+                        self._cond.wait()
+                        continue
+                    remaining = next(iter(self._states.values())).last_seen + self.idle_timeout - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+                expired = self._take_expired(time.monotonic())
+
+            for state in expired:
+                self.metrics.incr("typing.auto_stopped")
+                self._send_stop(state)
+
+    def _send_stop(self, state: _TypingState) -> None:
+        try:
+            kwargs = {name: value for name, value in state.kwargs.items() if name != "deadline_ms"}  # Long expired
+            self.dispatcher.post(state.endpoint, json={**state.payload, "event_id": new_event_id(), "data": dict(self.stop_data)}, **kwargs)
+        except Exception as e:
+            self.logger.error(f"[SyncCastTypingThrottle] Stop event to {state.payload.get('topic')} failed: {e}")
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the sweeper thread and send a stop event for every active state.
+        """
+        with self._cond:
+            self._closed = True
+            active = list(self._states.values())
+            self._states.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        for state in active:
+            self._send_stop(state)
+
+        if self._stop_on_exit:
+            atexit.unregister(self.close)
+            self._stop_on_exit = False
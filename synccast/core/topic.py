@@ -1,9 +1,9 @@
 # Default package imports
-from typing import Optional, Dict, Any, Union
-from copy import deepcopy
+from typing import Optional, Dict, Any, Union, Iterable, List, Tuple
+from copy import copy
 
-# Django imports
-from django.apps import apps
+# SyncCast scope/channel registry
+from synccast.core.registry import scope_registry, get_concrete_scope_model
 
 # SyncCast custom exceptions
 from synccast.exceptions.types import SyncCastTopicError
@@ -31,13 +31,7 @@ class SyncCastTopicBuilder:
         """
         Dynamically find the concrete model subclassing AbstractSyncCastScope.
         """
-        from synccast.models.scope import AbstractSyncCastScope
-
-        for model in apps.get_models():
-            if issubclass(model, AbstractSyncCastScope) and not model._meta.abstract:
-                return model
-
-        raise LookupError("No concrete model found inheriting from AbstractSyncCastScope.")
+        return get_concrete_scope_model()
     
     
     @staticmethod
@@ -68,15 +62,8 @@ class SyncCastTopicBuilder:
 
         if isinstance(scope, str):
             try:
-                ScopeModel = self._get_concrete_scope_model()
-
-                # Fetch one object (no prefetch here — since related name is dynamic)
-                instance = ScopeModel.objects.get(name=scope)
-
-                # Trigger channel manager to cache related objects if needed (lazy eval is fine)
-                self.get_channel_related_manager(instance)
-
-                return instance
+                # Served from the process-local registry (no query once warm)
+                return scope_registry.scope(scope)
             except Exception as e:
                 raise SyncCastTopicError(
                     message=f"Scope with slug '{scope}' not found or failed to load.",
@@ -90,18 +77,17 @@ class SyncCastTopicBuilder:
 
     def channel(self, channel_name: str) -> 'SyncCastTopicBuilder':
         try:
-            channel_manager = self.get_channel_related_manager(self.scope)
+            channels = scope_registry.channels(self.scope, channel_name)
         except Exception as e:
             raise SyncCastTopicError(
                 message=f"Scope object does not have a valid channel relation.",
                 extra={"scope": str(self.scope), "error": str(e)}
             ) from e
 
-        if not any(c.name == channel_name for c in channel_manager.all()):
-            valid_channels = [c.name for c in channel_manager.all()]
+        if channel_name not in channels:
             raise SyncCastTopicError(
                 message=f"Channel '{channel_name}' not defined for scope '{self.scope.name}'.",
-                extra={"channel": channel_name, "valid_channels": valid_channels}
+                extra={"channel": channel_name, "valid_channels": sorted(channels)}
             )
 
         self._channel = channel_name
@@ -131,7 +117,16 @@ class SyncCastTopicBuilder:
         return self
 
     def clone(self) -> 'SyncCastTopicBuilder':
-        return deepcopy(self)
+        # The scope instance is shared (read-only); only the mutable parts are copied
+        cloned = copy(self)
+        cloned._extra_parts = list(self._extra_parts)
+        return cloned
+
+    def compile(self) -> 'SyncCastTopicTemplate':
+        """
+        Freeze the current scope, channel and extras into a `SyncCastTopicTemplate`.
+        """
+        return SyncCastTopicTemplate(self.app_id, self.scope, self._channel, self._extra_parts)
 
     def build(self) -> str:
         if not self._channel:
@@ -159,4 +154,63 @@ class SyncCastTopicBuilder:
         }
 
     def __str__(self) -> str:
-        return self.build()
\ No newline at end of file
+        return self.build()
+
+
+class SyncCastTopicTemplate:
+    """
+    Pre-validated, pre-joined topic for one scope/channel/extras combination.
+
+    Scope and channel are validated once, when the template is created; after
+    that `render(user_id)` is a single string concatenation and
+    `render_many(user_ids)` renders a whole fanout in one pass, without a
+    builder object per recipient.
+
+        template = SyncCastTopicTemplate(app_id, "chat", "message", ["room", 7])
+        topics = template.render_many(member_ids)
+    """
+
+    __slots__ = ("app_id", "scope", "channel", "extras", "_base", "_user_prefix")
+
+    def __init__(
+        self,
+        app_id: str,
+        scope: Union[str, object],
+        channel: str,
+        extras: Iterable[Union[str, int]] = (),
+    ):
+        builder = SyncCastTopicBuilder(app_id, scope).channel(channel).extra(*extras)
+
+        self.app_id: str = builder.app_id
+        self.scope: str = builder.scope.name
+        self.channel: str = channel
+        self.extras: Tuple[str, ...] = tuple(builder._extra_parts)
+        self._base = builder.build()
+        self._user_prefix = self._base + "/user/"
+
+    def render(self, user_id: Optional[Union[int, str]] = None) -> str:
+        """
+        Topic for `user_id`, or the shared (non per-user) topic when omitted.
+        """
+        if user_id is None:
+            return self._base
+        return self._user_prefix + str(user_id)
+
+    def render_many(self, user_ids: Iterable[Union[int, str]]) -> List[str]:
+        """
+        Topics for every user in `user_ids`, in order.
+        """
+        prefix = self._user_prefix
+        return [prefix + str(user_id) for user_id in user_ids]
+
+    def wildcard(self) -> str:
+        """
+        Subscription filter matching every user's topic.
+        """
+        return self._user_prefix + "+"
+
+    def __str__(self) -> str:
+        return self._base
+
+    def __repr__(self) -> str:
+        return f"SyncCastTopicTemplate({self._base!r})"
@@ -0,0 +1,261 @@
+# Default package imports
+import logging
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List
+
+# Optional MQTT client
+try:
+    import paho.mqtt.client as mqtt
+except ImportError:  # pragma: no cover - optional dependency
+    mqtt = None
+
+# SyncCast payload serializers
+from synccast.core.serializers import SyncCastSerializer, get_serializer
+
+# SyncCast enums
+from synccast.core.enums import SyncCastQosLevel
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastDispatchError
+
+# logger instance
+logger = logging.getLogger(__name__)
+
+
+class SyncCastTransport(ABC):
+    """
+    Interface between the services and the wire.
+
+    A transport receives the push endpoint and the built payload through the
+    same `post(endpoint, json=...)` call the services make on a dispatcher, so
+    any transport can be handed to a service (or wrapped by a delivery stage).
+    """
+
+    @abstractmethod
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        Deliver one payload.
+        """
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Release connections or background resources held by the transport.
+        """
+
+
+class SyncCastHTTPTransport(SyncCastTransport):
+    """
+    Default transport: posts to the SyncCast push API through a `SyncCastDispatcher`,
+    which republishes the event to MQTT server-side.
+    """
+
+    def __init__(self, dispatcher: Any):
+        self.dispatcher = dispatcher
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        return self.dispatcher.post(endpoint, json=json, **kwargs)
+
+
+class SyncCastMQTTTransport(SyncCastTransport):
+    """
+    Publishes payloads straight to the MQTT broker, skipping the HTTP push API.
+
+    Keeps one persistent connection (network loop on a background thread) and
+    publishes each payload to its `topic` with its `qos`. QoS 1/2 publishes are
+    pipelined: up to `max_inflight` may await their PUBACK/PUBCOMP at once, and
+    `post()` only blocks when that window is full. Every `post()` returns a
+    `Future` resolved with the message id once the broker has acknowledged it
+    (immediately after the write for QoS 0).
+
+    Requires `paho-mqtt` (`pip install syncast[mqtt]`) unless a client object
+    with the same interface is injected via `client` — e.g.
+    `LoopbackMQTTClient` for tests against a local broker stand-in.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 1883,
+        client: Optional[Any] = None,
+        client_id: str = "",
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        tls: bool = False,
+        keepalive: int = 60,
+        max_inflight: int = 100,
+        window_timeout: float = 5.0,
+        serializer: Optional[SyncCastSerializer] = None,
+        logger_instance: Optional[logging.Logger] = None
+    ):
+        if client is None:
+            if mqtt is None:
+                raise SyncCastDispatchError(
+                    message="SyncCastMQTTTransport requires the 'paho-mqtt' package",
+                    extra={"install": "pip install syncast[mqtt]"}
+                )
+            # A persistent session (QoS 1/2 redelivery across reconnects) needs a client id
+            options = {"client_id": client_id, "clean_session": not client_id}
+            if hasattr(mqtt, "CallbackAPIVersion"):  # paho-mqtt >= 2.0
+                client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, **options)
+            else:
+                client = mqtt.Client(**options)
+            if username:
+                client.username_pw_set(username, password)
+            if tls:
+                client.tls_set()
+
+        self.host = host
+        self.port = port
+        self.keepalive = keepalive
+        self.window_timeout = window_timeout
+        self.serializer = serializer or get_serializer()
+        self.logger = logger_instance or logger
+
+        self.client = client
+        self.client.max_inflight_messages_set(max_inflight)
+        self.client.on_publish = self._on_publish
+
+        self._lock = threading.RLock()
+        self._window = threading.BoundedSemaphore(max_inflight)
+        self._pending: Dict[int, Future] = {}
+        self._early_acks: set = set()
+        self._connected = False
+
+    def connect(self) -> 'SyncCastMQTTTransport':
+        """
+        Open the broker connection and start the network loop (idempotent).
+        """
+        with self._lock:
+            if not self._connected:
+                self.client.connect(self.host, self.port, self.keepalive)
+                self.client.loop_start()
+                self._connected = True
+        return self
+
+    def _on_publish(self, client: Any, userdata: Any, mid: int, *args) -> None:
+        with self._lock:
+            future = self._pending.pop(mid, None)
+            if future is None:
+                self._early_acks.add(mid)  # Acked before `post()` registered the mid
+                return
+        self._window.release()
+        future.set_result(mid)
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Future:
+        payload = json or {}
+        topic = payload.get("topic")
+        if not topic:
+            raise SyncCastDispatchError(
+                message="MQTT publish requires a payload topic",
+                extra={"endpoint": endpoint}
+            )
+        qos = int(payload.get("qos", SyncCastQosLevel.DELIVER_AT_LEAST_ONCE))
+
+        body = self.serializer.dumps(payload)
+        self.connect()
+        if not self._window.acquire(timeout=self.window_timeout):
+            raise SyncCastDispatchError(
+                message="MQTT in-flight window full",
+                extra={"topic": topic, "timeout": self.window_timeout}
+            )
+
+        future: Future = Future()
+        # Not under `_lock`: paho holds its own mutex in `publish()` and while
+        # calling `on_publish`, so nesting the two would deadlock
+        info = self.client.publish(topic, body, qos=qos)
+        if info.rc != 0:
+            self._window.release()
+            raise SyncCastDispatchError(
+                message="MQTT publish failed",
+                extra={"topic": topic, "rc": info.rc}
+            )
+        with self._lock:
+            if info.mid in self._early_acks:
+                self._early_acks.discard(info.mid)
+                acked = True
+            else:
+                self._pending[info.mid] = future
+                acked = False
+
+        if acked:
+            self._window.release()
+            future.set_result(info.mid)
+        return future
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Disconnect from the broker; publishes still awaiting an ack fail.
+        """
+        with self._lock:
+            if self._connected:
+                self.client.disconnect()
+                self.client.loop_stop()
+                self._connected = False
+            pending, self._pending = self._pending, {}
+
+        for mid, future in pending.items():
+            self._window.release()
+            future.set_exception(SyncCastDispatchError(
+                message="MQTT connection closed before acknowledgement",
+                extra={"mid": mid}
+            ))
+
+
+class _LoopbackMessageInfo:
+    def __init__(self, mid: int):
+        self.mid = mid
+        self.rc = 0
+
+
+class LoopbackMQTTClient:
+    """
+    In-memory stand-in for a paho MQTT client and broker.
+
+    Records every publish as `(topic, payload, qos)` in `published` and acks
+    QoS 1/2 messages immediately, or only when `ack()` is called if
+    `auto_ack=False` (to exercise the in-flight window).
+    """
+
+    def __init__(self, auto_ack: bool = True):
+        self.auto_ack = auto_ack
+        self.published: List[tuple] = []
+        self.unacked: List[int] = []
+        self.on_publish = None
+        self.connected = False
+        self._mid = 0
+
+    def connect(self, host: str, port: int = 1883, keepalive: int = 60) -> int:
+        self.connected = True
+        return 0
+
+    def loop_start(self) -> None:
+        pass
+
+    def loop_stop(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        self.connected = False
+
+    def max_inflight_messages_set(self, inflight: int) -> None:
+        pass
+
+    def publish(self, topic: str, payload: bytes, qos: int = 0) -> _LoopbackMessageInfo:
+        self._mid += 1
+        self.published.append((topic, payload, qos))
+        if qos == 0 or self.auto_ack:
+            self.on_publish(self, None, self._mid)
+        else:
+            self.unacked.append(self._mid)
+        return _LoopbackMessageInfo(self._mid)
+
+    def ack(self, count: Optional[int] = None) -> None:
+        """
+        Acknowledge the oldest `count` unacked messages (all by default).
+        """
+        count = len(self.unacked) if count is None else count
+        acked, self.unacked = self.unacked[:count], self.unacked[count:]
+        for mid in acked:
+            self.on_publish(self, None, mid)
@@ -0,0 +1,178 @@
+# Default package imports
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Tuple, Union
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastTopicError
+
+
+_MISSING = object()
+
+
+class _TrieNode:
+    __slots__ = ("children", "value")
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.value: Any = _MISSING
+
+
+class SyncCastTopicTrie:
+    """
+    Index of MQTT topic filters for matching concrete topics against many
+    subscriptions or ACL rules at once.
+
+    Filters are stored level by level, so `match(topic)` walks at most one
+    branch per level plus the `+` / `#` branches, instead of scanning every
+    filter. Wildcards follow MQTT semantics:
+
+        - `+` matches exactly one level (`app/+/message` matches `app/chat/message`).
+        - `#` must be the last level and matches its parent and any number of
+          levels below (`app/chat/#` matches `app/chat` and `app/chat/a/b`).
+        - Filters starting with a wildcard do not match topics starting with `$`.
+
+    Each filter maps to a value (the filter itself by default), returned by `match()`.
+    """
+
+    def __init__(self, filters: Optional[Iterable[Union[str, Tuple[str, Any]]]] = None):
+        self._root = _TrieNode()
+        self._size = 0
+        if filters is not None:
+            self.bulk_load(filters)
+
+    @staticmethod
+    def validate(topic_filter: str) -> List[str]:
+        """
+        Split `topic_filter` into levels, checking wildcard placement.
+
+        Raises:
+            SyncCastTopicError: If the filter is empty or misuses `+` / `#`.
+        """
+        if not topic_filter:
+            raise SyncCastTopicError(message="Topic filter must not be empty", extra={"filter": topic_filter})
+
+        levels = topic_filter.split("/")
+        for index, level in enumerate(levels):
+            if ("+" in level or "#" in level) and len(level) > 1:
+                raise SyncCastTopicError(
+                    message="Wildcards must occupy a whole topic level",
+                    extra={"filter": topic_filter, "level": level}
+                )
+            if level == "#" and index != len(levels) - 1:
+                raise SyncCastTopicError(
+                    message="'#' is only allowed as the last topic level",
+                    extra={"filter": topic_filter}
+                )
+        return levels
+
+    # ── Mutation ────────────────────────────────────────────────────────────────
+
+    def insert(self, topic_filter: str, value: Any = _MISSING) -> None:
+        """
+        Add `topic_filter` (replacing its value if already present).
+        """
+        node = self._root
+        for level in self.validate(topic_filter):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TrieNode()
+            node = child
+
+        if node.value is _MISSING:
+            self._size += 1
+        node.value = topic_filter if value is _MISSING else value
+
+    def bulk_load(self, filters: Iterable[Union[str, Tuple[str, Any]]]) -> 'SyncCastTopicTrie':
+        """
+        Insert many filters, given as strings or `(filter, value)` pairs.
+        """
+        for item in filters:
+            if isinstance(item, str):
+                self.insert(item)
+            else:
+                self.insert(*item)
+        return self
+
+    def remove(self, topic_filter: str) -> bool:
+        """
+        Remove `topic_filter`, pruning branches left empty.
+
+        Returns:
+            bool: False if the filter was not present.
+        """
+        path = [self._root]
+        levels = topic_filter.split("/")
+        for level in levels:
+            node = path[-1].children.get(level)
+            if node is None:
+                return False
+            path.append(node)
+
+        if path[-1].value is _MISSING:
+            return False
+        path[-1].value = _MISSING
+        self._size -= 1
+
+        for level, parent, node in zip(reversed(levels), reversed(path[:-1]), reversed(path)):
+            if node.children or node.value is not _MISSING:
+                break
+            del parent.children[level]
+        return True
+
+    def clear(self) -> None:
+        self._root = _TrieNode()
+        self._size = 0
+
+    # ── Matching ────────────────────────────────────────────────────────────────
+
+    def _iter_matches(self, topic: str) -> Iterator[Any]:
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards at the first level never match `$`-prefixed (system) topics
+        system = topic.startswith("$")
+
+        stack: List[Tuple[_TrieNode, int]] = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            children = node.children
+            wildcards_allowed = not (system and depth == 0)
+
+            if wildcards_allowed:
+                multi = children.get("#")
+                if multi is not None:
+                    yield multi.value
+
+            if depth == last:
+                if node.value is not _MISSING:
+                    yield node.value
+                continue
+
+            exact = children.get(levels[depth])
+            if exact is not None:
+                stack.append((exact, depth + 1))
+            if wildcards_allowed:
+                single = children.get("+")
+                if single is not None:
+                    stack.append((single, depth + 1))
+
+    def match(self, topic: str) -> List[Any]:
+        """
+        Values of every filter matching the concrete `topic`.
+        """
+        return list(self._iter_matches(topic))
+
+    def matches(self, topic: str) -> bool:
+        """
+        Whether any filter matches `topic` (stops at the first hit).
+        """
+        return next(self._iter_matches(topic), _MISSING) is not _MISSING
+
+    def __contains__(self, topic_filter: str) -> bool:
+        node = self._root
+        for level in topic_filter.split("/"):
+            node = node.children.get(level)
+            if node is None:
+                return False
+        return node.value is not _MISSING
+
+    def __len__(self) -> int:
+        return self._size
@@ -23,6 +23,10 @@ from .types import (
     SyncCastTopicError,                             # Raised for invalid or unresolved topics
     SyncCastPayloadError,                           # Raised for payload structure/validation issues
     SyncCastDispatchError,                          # Raised when dispatching to API fails
+    SyncCastBackpressureError,                      # Raised when a dispatch queue rejects an event
+    SyncCastRateLimitError,                         # Raised when the rate limiter sheds an event
+    SyncCastCircuitOpenError,                       # Raised while an endpoint's circuit is open
+    SyncCastDeadlineError,                          # Raised when a publish exceeds its deadline
     SyncCastValidationError,                        # Raised for bad input validation
     SyncCastPresenceError,                          # Raised on presence state violations
 )
@@ -34,6 +38,10 @@ __all__ = [
     "SyncCastTopicError",
     "SyncCastPayloadError",
     "SyncCastDispatchError",
+    "SyncCastBackpressureError",
+    "SyncCastRateLimitError",
+    "SyncCastCircuitOpenError",
+    "SyncCastDeadlineError",
     "SyncCastValidationError",
     "SyncCastPresenceError"
 ]
@@ -17,4 +17,8 @@ class SyncCastErrorCode(str, Enum):
     VALIDATION_ERROR = "validation_error"     # Input or field validation failure
     PRESENCE_ERROR = "presence_error"         # Presence system failure (e.g., unknown user state)
     NOTIFICATION_ERROR = "notification_error" # Notification routing or publishing failure
-    MESSAGE_ERROR = "message_error"           # Message sending, saving, or formatting failure
\ No newline at end of file
+    MESSAGE_ERROR = "message_error"           # Message sending, saving, or formatting failure
+    BACKPRESSURE_ERROR = "backpressure_error" # Event rejected or dropped by a full dispatch queue
+    RATE_LIMIT_ERROR = "rate_limit_error"     # Event shed by the client-side rate limiter
+    CIRCUIT_OPEN = "circuit_open"             # Call rejected by an open circuit breaker
+    DEADLINE_EXCEEDED = "deadline_exceeded"   # Publish could not complete within its time budget
@@ -74,6 +74,100 @@ class SyncCastDispatchError(SyncCastError):
         super().__init__(message, code=SyncCastErrorCode.DISPATCH_ERROR, extra=extra)
 
 
+class SyncCastBackpressureError(SyncCastDispatchError):
+    """
+    Raised (or set on the event's future) when a bounded dispatch queue cannot
+    accept an event.
+
+    Typical causes:
+        - The queue stayed full for the whole block timeout.
+        - The event was evicted by a drop-oldest / drop-newest overflow policy.
+        - The pool was shut down before the event could be sent.
+
+    Args:
+        message (str): A human-readable message describing the rejection.
+        extra (dict, optional): Additional metadata (e.g., event type, queue depth).
+
+    Example:
+        raise SyncCastBackpressureError(
+            message="Dispatch queue full",
+            extra={"type": "message", "depth": 10000}
+        )
+    """
+    def __init__(self, message: str = "Dispatch queue full", extra: Optional[dict] = None):
+        SyncCastError.__init__(self, message, code=SyncCastErrorCode.BACKPRESSURE_ERROR, extra=extra)
+
+
+class SyncCastRateLimitError(SyncCastBackpressureError):
+    """
+    Raised when the client-side rate limiter sheds an event instead of
+    letting it wait for the API's budget.
+
+    Typical causes:
+        - A low-priority event arrived while the endpoint's budget was exhausted.
+        - The wait for a token (e.g. a long `Retry-After`) exceeded `max_wait`.
+
+    Args:
+        message (str): A human-readable message describing the rejection.
+        extra (dict, optional): Additional metadata (e.g., endpoint, priority, wait, current rate).
+
+    Example:
+        raise SyncCastRateLimitError(
+            message="Rate limit budget exhausted",
+            extra={"endpoint": "/api/chat/messages/", "priority": "low", "wait": 0.4}
+        )
+    """
+    def __init__(self, message: str = "Rate limit budget exhausted", extra: Optional[dict] = None):
+        SyncCastError.__init__(self, message, code=SyncCastErrorCode.RATE_LIMIT_ERROR, extra=extra)
+
+
+class SyncCastCircuitOpenError(SyncCastDispatchError):
+    """
+    Raised without contacting the API while the circuit breaker of the
+    endpoint is open (and no fallback is configured).
+
+    Typical causes:
+        - Recent calls to the endpoint failed or were too slow too often.
+        - The half-open trial calls are already in flight.
+
+    Args:
+        message (str): A human-readable message describing the rejection.
+        extra (dict, optional): Additional metadata (e.g., endpoint, breaker state).
+
+    Example:
+        raise SyncCastCircuitOpenError(
+            message="Circuit open for /api/chat/messages/",
+            extra={"endpoint": "/api/chat/messages/", "state": "open"}
+        )
+    """
+    def __init__(self, message: str = "Circuit open", extra: Optional[dict] = None):
+        SyncCastError.__init__(self, message, code=SyncCastErrorCode.CIRCUIT_OPEN, extra=extra)
+
+
+class SyncCastDeadlineError(SyncCastDispatchError):
+    """
+    Raised when a publish could not be delivered within its total deadline
+    (`deadline_ms`), attempts, backoff and rate-limit waits included.
+
+    Typical causes:
+        - The API answered too slowly, or with retryable errors, until the budget ran out.
+        - The next backoff or rate-limit wait would not fit in the remaining budget.
+
+    Args:
+        message (str): A human-readable message describing the failure.
+        extra (dict, optional): Time breakdown (`deadline_ms`, `elapsed_ms`,
+            `spent_ms` per phase, `phases`) and the last status or error.
+
+    Example:
+        raise SyncCastDeadlineError(
+            message="Deadline of 250ms exceeded after 2 attempt(s)",
+            extra={"deadline_ms": 250, "elapsed_ms": 251.2, "spent_ms": {"attempt": 231.0, "backoff": 20.0}}
+        )
+    """
+    def __init__(self, message: str = "Deadline exceeded", extra: Optional[dict] = None):
+        SyncCastError.__init__(self, message, code=SyncCastErrorCode.DEADLINE_EXCEEDED, extra=extra)
+
+
 class SyncCastAPIError(SyncCastError):
     """
     Raised when an error occurs while interacting with external or internal APIs
@@ -0,0 +1,54 @@
+# Default package imports
+import time
+
+# Django imports
+from django.core.management.base import BaseCommand
+
+# SyncCast outbox relay
+from synccast.core.outbox import SyncCastOutboxDispatcher
+
+
+class Command(BaseCommand):
+    help = "Deliver pending SyncCast outbox rows in ordered batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Rows sent per batch request (default: 500)."
+        )
+        parser.add_argument(
+            "--limit", type=int, default=None,
+            help="Stop after handling this many rows."
+        )
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Keep polling for new rows instead of exiting when the outbox is empty."
+        )
+        parser.add_argument(
+            "--interval", type=float, default=1.0,
+            help="Seconds to sleep between polls in --loop mode (default: 1.0)."
+        )
+        parser.add_argument(
+            "--database", default=None,
+            help="Database alias holding the outbox table."
+        )
+
+    def handle(self, *args, **options):
+        from synccast import synccast
+
+        relay = SyncCastOutboxDispatcher(
+            synccast.dispatcher,
+            using=options["database"],
+            flush_on_commit=False,
+            flush_in_background=False,
+            batch_size=options["batch_size"],
+        )
+
+        while True:
+            delivered = relay.drain(limit=options["limit"])
+            if delivered:
+                self.stdout.write(f"Delivered {delivered} outbox rows.")
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,70 @@
+# Default package imports
+import time
+
+# Django imports
+from django.core.management.base import BaseCommand
+
+# SyncCast on-disk spool
+from synccast.core.spool import SyncCastSpool
+
+
+class Command(BaseCommand):
+    help = "Re-send events from the SyncCast on-disk spool in order, then compact replayed segments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--directory", default=None,
+            help="Spool directory (default: the one passed to enable_spool(), else SYNCCAST_SPOOL_DIR)."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Events sent per batch request (default: 500)."
+        )
+        parser.add_argument(
+            "--rate", type=float, default=None,
+            help="Maximum events per second (default: unlimited)."
+        )
+        parser.add_argument(
+            "--limit", type=int, default=None,
+            help="Stop after delivering this many events."
+        )
+        parser.add_argument(
+            "--include-open", action="store_true",
+            help="Also replay segments that running processes are still writing to."
+        )
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Keep polling for new segments instead of exiting when the spool is empty."
+        )
+        parser.add_argument(
+            "--interval", type=float, default=5.0,
+            help="Seconds to sleep between polls in --loop mode (default: 5.0)."
+        )
+
+    def handle(self, *args, **options):
+        from synccast import synccast
+
+        if options["directory"] or synccast.spool is None:
+            spool = SyncCastSpool(options["directory"], metrics=synccast.metrics)
+        else:
+            spool = synccast.spool
+
+        # Without a spool or fallback of its own: a failed replay must stop, not re-spool its batch
+        dispatcher = synccast._make_dispatcher().with_spool(None)
+        if dispatcher.circuit_breaker is not None:
+            dispatcher.with_circuit_breaker(dispatcher.circuit_breaker)
+
+        while True:
+            delivered = spool.replay(
+                dispatcher,
+                batch_size=options["batch_size"],
+                rate=options["rate"],
+                limit=options["limit"],
+                include_open=options["include_open"],
+            )
+            if delivered:
+                self.stdout.write(f"Replayed {delivered} spooled events.")
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -16,6 +16,7 @@ from .message import AbstractSyncCastMessage              # Core message structu
 from .attachment import AbstractSyncCastAttachment        # Attachments linked to messages
 from .reaction import AbstractSyncCastReaction            # Emoji or reaction tracking
 from .tracker import AbstractSyncCastReadTracker          # Per-user message read tracking
+from .outbox import AbstractSyncCastOutbox                # Transactional publish intents
 
 
 __all__ = [
@@ -26,4 +27,5 @@ __all__ = [
     "AbstractSyncCastAttachment",
     "AbstractSyncCastReaction",
     "AbstractSyncCastReadTracker",
+    "AbstractSyncCastOutbox",
 ]
@@ -0,0 +1,59 @@
+# synccast/models/outbox.py
+
+# Django imports
+from django.db import models
+
+# SyncCast abstract model
+from synccast.models.base import AbstractSyncCastBaseModel
+
+class AbstractSyncCastOutbox(AbstractSyncCastBaseModel):
+    """
+    Publish intent recorded inside the caller's database transaction.
+
+    Rows are written by the outbox dispatcher instead of calling the SyncCast
+    API directly, flushed after commit, and drained in order by the
+    `synccast_drain_outbox` relay for anything that was not delivered.
+    """
+
+    class OutboxStatus(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENT = "sent", "Sent"
+
+    endpoint = models.CharField(
+        max_length=255,
+        help_text="SyncCast push endpoint the payload is posted to, e.g. '/api/chat/messages/'."
+    )
+
+    payload = models.JSONField(
+        help_text="Payload built by SyncCastPayloadBuilder, sent as-is."
+    )
+
+    status = models.CharField(
+        max_length=16,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.PENDING,
+        db_index=True,
+        help_text="Delivery state of this publish intent."
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of failed delivery attempts so far."
+    )
+
+    last_error = models.TextField(
+        blank=True,
+        help_text="Error from the most recent failed delivery attempt."
+    )
+
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Timestamp when the payload was accepted by the SyncCast API."
+    )
+
+    class Meta:
+        abstract = True
+        indexes = [
+            models.Index(fields=["status", "id"]),
+        ]
@@ -4,6 +4,9 @@ from functools import cached_property
 # syncCast global configs
 from synccast import config
 
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastValidationError
+
 class SyncCastSDK:
     """
     Main entry point for accessing SyncCast services.
@@ -16,6 +19,26 @@ class SyncCastSDK:
     """
     def __init__(self):
         self._api_base = config.get_api_base()
+        self._batching = None
+        self._background = None
+        self._lanes = None
+        self._mqtt = None
+        self._outbox = None
+        self._compression = None
+        self._connection_pool = {}
+        self._warmup = 0
+        self._rate_limit = None
+        self._circuit_breaker = None
+        self._circuit_fallback = None
+        self._spool = None
+        self._routing = None
+        self._hedge_priorities = ()
+        self._coalescing = None
+        self._delta = None
+        self._typing_throttle = None
+        self._dedup = None
+        self._presence_manager = None
+        self._stages = []
 
     def set_credentials(self, app_id: str, app_secret: str):
         """
@@ -24,12 +47,319 @@ class SyncCastSDK:
         """
         config._app_id = app_id
         config._app_secret = app_secret
-        self.__dict__.pop("dispatcher", None)
+        self._reset()
+        return self
+
+    def enable_batching(self, **options):
+        """
+        Route service publishes through a `SyncCastBatcher`.
+
+        Options are passed to the batcher (`max_batch_size`, `max_batch_bytes`,
+        `max_linger_ms`). Once enabled, `send_*` calls return futures.
+        """
+        self._batching = options
+        self._reset()
+        return self
+
+    def enable_background_dispatch(self, **options):
+        """
+        Make `send_*` non-blocking: events are queued on a bounded in-process
+        queue and sent by a pool of worker threads (`SyncCastDispatchPool`).
+
+        Options are passed to the pool (`workers`, `maxsize`, `policies`,
+        `block_timeout`). `send_*` calls return futures. Cannot be combined
+        with delta encoding.
+        """
+        self._check_delta_order(background=options, delta=self._delta)
+        self._background = options
+        self._reset()
+        return self
+
+    def enable_lanes(self, background_workers: int = 2, background_maxsize: int = 10_000):
+        """
+        Deliver by QoS/priority lane (`SyncCastLaneRouter`): `HIGH` priority goes
+        synchronously over its own connection pool, `LOW` priority and
+        `FIRE_AND_FORGET` events go to a background pool with retries disabled,
+        everything else uses the regular pipeline.
+        """
+        self._lanes = {"workers": background_workers, "maxsize": background_maxsize}
+        self._reset()
+        return self
+
+    def enable_mqtt(self, host: str, port: int = 1883, **options):
+        """
+        Publish straight to the MQTT broker (`SyncCastMQTTTransport`) instead of
+        the HTTP push API. Credentials default to the app id / secret.
+
+        Batching and lanes target the HTTP API and are not applied in this mode;
+        the background pool still is.
+        """
+        self._mqtt = {"host": host, "port": port, **options}
+        self._reset()
+        return self
+
+    def enable_outbox(self, **options):
+        """
+        Publish through the transactional outbox (`SyncCastOutboxDispatcher`):
+        `send_*` writes an outbox row in the current transaction and the rows
+        are sent after commit; `manage.py synccast_drain_outbox` relays the rest.
+        Requires a concrete model subclassing `AbstractSyncCastOutbox`.
+        """
+        self._outbox = options
+        self._reset()
+        return self
+
+    def enable_coalescing(self, window_ms: float = 100, merge: bool = False, **options):
+        """
+        Coalesce UI sync updates (`SyncCastCoalescer`): within `window_ms` only
+        the latest `data` per topic is sent, deep-merging partial updates when
+        `merge=True`. `send_update` calls then return futures.
+
+        Not applied with the transactional outbox, which must record every intent.
+        """
+        self._coalescing = {"window_ms": window_ms, "merge": merge, **options}
+        self._reset()
+        return self
+
+    def enable_delta(self, max_topics: int = 1024, keyframe_interval: int = 100, **options):
+        """
+        Send UI sync updates as JSON patches against the last document sent on
+        their topic (`SyncCastDeltaEncoder`), with periodic full snapshots.
+        Subscribers apply them according to the payload's `sync` block.
+
+        Not applied with the transactional outbox. Cannot be combined with
+        background dispatch; with lanes, delta-encoded updates always take
+        the standard lane.
+        """
+        delta = {"max_topics": max_topics, "keyframe_interval": keyframe_interval, **options}
+        self._check_delta_order(background=self._background, delta=delta)
+        self._delta = delta
+        self._reset()
+        return self
+
+    @staticmethod
+    def _check_delta_order(background, delta):
+        """
+        Patches must reach subscribers in version order and none may be
+        dropped. The background pool coalesces queued sync updates and sends
+        with several workers, so it would leave version gaps delta never repairs.
+        """
+        if background is not None and delta is not None:
+            raise SyncCastValidationError(
+                message="Delta encoding cannot be combined with background dispatch",
+                extra={"delta": delta, "background": background}
+            )
+
+    def enable_typing_throttle(self, idle_timeout: float = 5.0, resend_after=None, **options):
+        """
+        Throttle typing events per (user, topic) (`SyncCastTypingThrottle`):
+        repeats of an unchanged state are suppressed and a stop event is sent
+        automatically after `idle_timeout` seconds without activity.
+
+        Not applied with the transactional outbox.
+        """
+        self._typing_throttle = {"idle_timeout": idle_timeout, "resend_after": resend_after, **options}
+        self._reset()
+        return self
+
+    def enable_dedup(self, window_seconds: float = 60.0, max_keys: int = 100_000, by_content: bool = False, **options):
+        """
+        Suppress repeated publishes of the same event within `window_seconds`
+        (`SyncCastDeduplicator`), keyed by `event_id` or, with `by_content`,
+        by the event's content.
+
+        Not applied with the transactional outbox.
+        """
+        self._dedup = {"window_seconds": window_seconds, "max_keys": max_keys, "by_content": by_content, **options}
+        self._reset()
+        return self
+
+    def enable_presence_manager(self, **options):
+        """
+        Configure `presence_manager` (`template`, `store`, `flush_interval`,
+        `write_interval`, `offline_after`, ...).
+        """
+        self._presence_manager = options
+        self._reset()
+        return self
+
+    def enable_compression(self, codec: str = "gzip", threshold: int = 16 * 1024, per_endpoint=None):
+        """
+        Compress request bodies of at least `threshold` bytes (optionally per
+        endpoint) with `codec` ("gzip", "zstd", "br" or "auto"). Compression
+        ratio and CPU time are recorded in `metrics` under `compression.*`.
+        """
+        self._compression = {"codec": codec, "threshold": threshold, "per_endpoint": per_endpoint}
+        self._reset()
+        return self
+
+    def enable_connection_pool(
+        self,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        host_pools=None,
+        warmup: int = 0,
+        **options
+    ):
+        """
+        Size the HTTP connection pools of the dispatchers: `pool_maxsize`
+        keep-alive connections per host (`host_pools` maps `scheme://host`
+        prefixes to their own size), waiting for a free connection when
+        `pool_block=True`. With `warmup`, that many connections are opened
+        as soon as the dispatcher is built (see `warmup()`).
+        """
+        self._connection_pool = {"pool_maxsize": pool_maxsize, "pool_block": pool_block, "host_pools": host_pools, **options}
+        self._warmup = warmup
+        self._reset()
+        return self
+
+    def enable_rate_limit(self, rate: float = 50.0, **options):
+        """
+        Pace HTTP publishes with one `SyncCastRateLimiter` shared by all
+        dispatchers: a token bucket per (app_id, endpoint) whose rate adapts to
+        429 responses and `Retry-After`. `LOW` priority events are shed first
+        (`SyncCastRateLimitError`) when the budget is exhausted. Options:
+        `min_rate`, `max_rate`, `burst`, `increase`, `decrease`, `max_wait`,
+        `shed_priorities`.
+        """
+        self._rate_limit = {"rate": rate, **options}
+        self._reset()
+        return self
+
+    @cached_property
+    def rate_limiter(self):
+        """
+        The shared `SyncCastRateLimiter`, or None unless `enable_rate_limit()` was called.
+        """
+        if self._rate_limit is None:
+            return None
+        from synccast.core.ratelimit import SyncCastRateLimiter
+        return SyncCastRateLimiter(**{"metrics": self.metrics, **self._rate_limit})
+
+    def enable_circuit_breaker(self, fallback=None, **options):
+        """
+        Fail fast on endpoints the API keeps failing (`SyncCastCircuitBreaker`
+        shared by all dispatchers): a circuit opens on its error rate or slow
+        call rate and is probed again after `open_seconds`. While open, posts
+        raise `SyncCastCircuitOpenError`, or are handed to `fallback(endpoint, payload)`;
+        `fallback="outbox"` spools them as outbox rows for `synccast_drain_outbox`
+        (ignored when the outbox itself is enabled, whose rows simply stay pending).
+        Options: `failure_rate`, `slow_call_seconds`, `slow_call_rate`, `window`,
+        `min_calls`, `open_seconds`, `half_open_calls`, `on_state_change`.
+        """
+        self._circuit_breaker = options
+        self._circuit_fallback = fallback
+        self._reset()
+        return self
+
+    @cached_property
+    def circuit_breaker(self):
+        """
+        The shared `SyncCastCircuitBreaker`, or None unless `enable_circuit_breaker()` was called.
+        """
+        if self._circuit_breaker is None:
+            return None
+        from synccast.core.breaker import SyncCastCircuitBreaker
+        return SyncCastCircuitBreaker(**{"metrics": self.metrics, **self._circuit_breaker})
+
+    def _circuit_fallback_for_dispatchers(self):
+        if self._circuit_fallback == "outbox":
+            if self._outbox is not None:
+                return None
+            from synccast.core.outbox import SyncCastOutboxFallback
+            return SyncCastOutboxFallback()
+        return self._circuit_fallback
+
+    def enable_spool(self, directory: str = None, **options):
+        """
+        Write events that cannot be delivered (retries exhausted, or circuit
+        open without another fallback) to an on-disk `SyncCastSpool` instead
+        of raising; `manage.py synccast_replay` re-sends them. Options:
+        `segment_bytes`, `segment_seconds`, `fsync` ("always", "interval",
+        "never"), `fsync_interval`. Ignored with the transactional outbox,
+        whose undelivered rows already stay pending.
+        """
+        self._spool = {"directory": directory, **options}
+        self._reset()
+        return self
+
+    @cached_property
+    def spool(self):
+        """
+        The shared `SyncCastSpool`, or None unless `enable_spool()` was called.
+        """
+        if self._spool is None:
+            return None
+        from synccast.core.spool import SyncCastSpool
+        return SyncCastSpool(**{"metrics": self.metrics, **self._spool})
+
+    def enable_endpoint_routing(self, base_urls, hedge_priorities=None, **options):
+        """
+        Publish over HTTP through several base URLs (e.g. one ingress per
+        region) instead of the single configured one: posts go to the URL with
+        the best EWMA latency and error rate (`SyncCastEndpointRouter` shared
+        by all dispatchers) and fail over to the others; `HIGH` priority posts
+        (or `hedge_priorities`) are hedged to the second URL after its p95
+        latency. Options: `alpha`, `error_penalty`, `error_half_life`,
+        `sample_size`, `min_samples`, `min_hedge_delay`.
+        """
+        from synccast.core.enums import SyncCastPriorityLevel
+        self._routing = {"base_urls": list(base_urls), **options}
+        self._hedge_priorities = (SyncCastPriorityLevel.HIGH,) if hedge_priorities is None else tuple(hedge_priorities)
+        self._reset()
+        return self
+
+    @cached_property
+    def endpoint_router(self):
+        """
+        The shared `SyncCastEndpointRouter`, or None unless `enable_endpoint_routing()` was called.
+        """
+        if self._routing is None:
+            return None
+        from synccast.core.routing import SyncCastEndpointRouter
+        return SyncCastEndpointRouter(**{"metrics": self.metrics, **self._routing})
+
+    def warmup(self, connections: int = None) -> int:
+        """
+        Pre-establish keep-alive connections to the SyncCast API, e.g. from
+        `AppConfig.ready()` or a gunicorn `post_fork` hook.
+
+        Returns:
+            int: Number of connections established.
+        """
+        return self.dispatcher.warmup(connections or self._warmup or 1)
+
+    @cached_property
+    def metrics(self):
+        """
+        Shared `SyncCastMetrics` recorded into by the enabled delivery stages.
+        """
+        from synccast.core.metrics import SyncCastMetrics
+        return SyncCastMetrics()
+
+    def _reset(self):
+        """
+        Drop cached dispatcher and services so they are rebuilt with current settings.
+        """
+        self.__dict__.pop("presence_manager", None)
+        self.__dict__.pop("publisher", None)
+        self.__dict__.pop("rate_limiter", None)
+        self.__dict__.pop("circuit_breaker", None)
+        self.__dict__.pop("endpoint_router", None)
+        spool = self.__dict__.pop("spool", None)
+        while self._stages:
+            self._stages.pop().close()  # Outermost first, so queued events drain inward
+        dispatcher = self.__dict__.pop("dispatcher", None)
+        if dispatcher is not None:
+            dispatcher.close()
+        if spool is not None:
+            spool.close()  # Last: draining stages may still spool undelivered events
         self.__dict__.pop("stream", None)
         self.__dict__.pop("presence", None)
         self.__dict__.pop("chat", None)
         self.__dict__.pop("notify", None)
-        return self   
+        self.__dict__.pop("typing", None)
+        self.__dict__.pop("aio", None)
 
     @property
     def app_id(self):
@@ -51,20 +381,120 @@ class SyncCastSDK:
         Lazy-loaded SyncCastDispatcher instance.
 
         Handles HTTP communication with SyncCast APIs using the current credentials.
+        It is safe to share between threads and re-creates its connections after a fork.
+        """
+        dispatcher = self._make_dispatcher()
+        if self._warmup:
+            dispatcher.warmup(self._warmup)
+        return dispatcher
+
+    def _make_dispatcher(self, **options):
+        """
+        Build a new SyncCastDispatcher (own session) with the current base URL and credentials.
         """
         from synccast.core.dispatcher import SyncCastDispatcher
-        dispatcher = SyncCastDispatcher().with_base_url(self._api_base)
+        options = {"metrics": self.metrics, **self._connection_pool, **options}
+        dispatcher = SyncCastDispatcher(**options).with_base_url(self._api_base)
+        if self.endpoint_router is not None:
+            dispatcher.with_router(self.endpoint_router, self._hedge_priorities)
         if config._app_id and config._app_secret:
             dispatcher.with_secret(config._app_id, config._app_secret)
+        if self._compression is not None:
+            dispatcher.with_compression(**self._compression)
+        if self.rate_limiter is not None:
+            dispatcher.with_rate_limiter(self.rate_limiter)
+        if self.circuit_breaker is not None:
+            dispatcher.with_circuit_breaker(self.circuit_breaker, self._circuit_fallback_for_dispatchers())
+        if self.spool is not None and self._outbox is None:
+            dispatcher.with_spool(self.spool)
         return dispatcher
 
+    @cached_property
+    def publisher(self):
+        """
+        The object services publish through: the (HTTP dispatcher or MQTT) and the delivery stages enabled on
+        top of it (batching, background pool, lanes, delta encoding, coalescing, typing throttle,
+        deduplication), or the transactional outbox.
+        """
+        if self._outbox is not None:
+            from synccast.core.outbox import SyncCastOutboxDispatcher
+            publisher = SyncCastOutboxDispatcher(self.dispatcher, **self._outbox)
+            self._stages.append(publisher)
+            return publisher
+
+        if self._mqtt is not None:
+            from synccast.core.transport import SyncCastMQTTTransport
+            options = {"username": config._app_id, "password": config._app_secret, **self._mqtt}
+            publisher = SyncCastMQTTTransport(**options)
+            self._stages.append(publisher)
+        else:
+            publisher = self.dispatcher
+
+        if self._batching is not None and self._mqtt is None:
+            from synccast.core.batching import SyncCastBatcher
+            publisher = SyncCastBatcher(publisher, **self._batching)
+            self._stages.append(publisher)
+        if self._background is not None:
+            from synccast.core.pool import SyncCastDispatchPool
+            options = {"metrics": self.metrics, **self._background}
+            publisher = SyncCastDispatchPool(publisher, **options)
+            self._stages.append(publisher)
+        if self._lanes is not None and self._mqtt is None:
+            from synccast.core.lanes import SyncCastLaneRouter
+            from synccast.core.pool import SyncCastDispatchPool
+            urgent = self._make_dispatcher()
+            background_dispatcher = self._make_dispatcher(retries=0)
+            self._stages.extend([urgent, background_dispatcher])  # Closed after the pool drains into them
+            background = SyncCastDispatchPool(background_dispatcher, metrics=self.metrics, **self._lanes)
+            self._stages.append(background)
+            publisher = SyncCastLaneRouter(
+                publisher,
+                urgent=urgent,
+                background=background,
+                metrics=self.metrics,
+            )
+        if self._delta is not None:
+            from synccast.core.delta import SyncCastDeltaEncoder
+            options = {"metrics": self.metrics, **self._delta}
+            publisher = SyncCastDeltaEncoder(publisher, **options)
+            self._stages.append(publisher)
+        if self._coalescing is not None:
+            from synccast.core.coalescing import SyncCastCoalescer
+            options = {"metrics": self.metrics, **self._coalescing}
+            publisher = SyncCastCoalescer(publisher, **options)
+            self._stages.append(publisher)
+        if self._typing_throttle is not None:
+            from synccast.core.throttle import SyncCastTypingThrottle
+            options = {"metrics": self.metrics, **self._typing_throttle}
+            publisher = SyncCastTypingThrottle(publisher, **options)
+            self._stages.append(publisher)
+        if self._dedup is not None:
+            from synccast.core.dedup import SyncCastDeduplicator
+            options = {"metrics": self.metrics, **self._dedup}
+            publisher = SyncCastDeduplicator(publisher, **options)
+            self._stages.append(publisher)
+        return publisher
+
+    @cached_property
+    def presence_manager(self):
+        """
+        `SyncCastPresenceManager` over the PresenceService: publishes presence
+        transitions only and writes `last_seen_at` behind in bulk. Options are
+        set with `enable_presence_manager()`.
+        """
+        from synccast.core.presence import SyncCastPresenceManager
+        options = {"metrics": self.metrics, **(self._presence_manager or {})}
+        manager = SyncCastPresenceManager(self.presence, **options)
+        self._stages.append(manager)
+        return manager
+
     @cached_property
     def stream(self):
         """
         Access the StreamService for broadcasting UI sync events.
         """
         from synccast.api.stream import StreamService
-        return StreamService(dispatcher=self.dispatcher, app_id=config._app_id)
+        return StreamService(dispatcher=self.publisher, app_id=config._app_id)
 
     @cached_property
     def presence(self):
@@ -72,7 +502,7 @@ class SyncCastSDK:
         Access the PresenceService for sending real-time presence updates.
         """
         from synccast.api.presence import PresenceService
-        return PresenceService(dispatcher=self.dispatcher, app_id=config._app_id)
+        return PresenceService(dispatcher=self.publisher, app_id=config._app_id)
 
     @cached_property
     def chat(self):
@@ -80,7 +510,7 @@ class SyncCastSDK:
         Access the MessageService for real-time chat messaging.
         """
         from synccast.api.message import MessageService
-        return MessageService(dispatcher=self.dispatcher, app_id=config._app_id)
+        return MessageService(dispatcher=self.publisher, app_id=config._app_id)
 
     @cached_property
     def notify(self):
@@ -88,7 +518,33 @@ class SyncCastSDK:
         Access the NotificationService for dispatching in-app notifications.
         """
         from synccast.api.notification import NotificationService
-        return NotificationService(dispatcher=self.dispatcher, app_id=config._app_id)
+        return NotificationService(dispatcher=self.publisher, app_id=config._app_id)
+
+    @cached_property
+    def typing(self):
+        """
+        Access the TypingService for real-time typing indicators.
+        """
+        from synccast.api.typing import TypingService
+        return TypingService(dispatcher=self.publisher, app_id=config._app_id)
+
+    @cached_property
+    def aio(self) -> 'AsyncSyncCastSDK':
+        """
+        Async facade exposing awaitable services, e.g. `await synccast.aio.chat.send_message(...)`.
+        """
+        return AsyncSyncCastSDK(
+            api_base=self._api_base,
+            rate_limiter=self.rate_limiter,
+            circuit_breaker=self.circuit_breaker,
+            circuit_fallback=self._circuit_fallback_for_dispatchers(),
+            router=self.endpoint_router,
+            hedge_priorities=self._hedge_priorities,
+            spool=self.spool if self._outbox is None else None,
+            compression=self._compression,
+            connection_pool=self._connection_pool,
+            metrics=self.metrics,
+        )
 
     @cached_property
     def topic_builder(self):
@@ -106,3 +562,124 @@ class SyncCastSDK:
         from synccast.core.payload import SyncCastPayloadBuilder
         return SyncCastPayloadBuilder  # class, not instance
 
+
+class AsyncSyncCastSDK:
+    """
+    Asyncio entry point for SyncCast services.
+
+    Mirrors the service properties of `SyncCastSDK`, backed by a shared
+    `AsyncSyncCastDispatcher` so publishes can be awaited concurrently
+    without blocking ASGI workers. Obtain it through `synccast.aio`, which
+    applies the SDK's rate limiter, circuit breaker, routing, spool,
+    compression and connection-pool settings to it.
+    """
+    def __init__(
+        self,
+        api_base: str,
+        rate_limiter=None,
+        circuit_breaker=None,
+        circuit_fallback=None,
+        router=None,
+        hedge_priorities=(),
+        spool=None,
+        compression=None,
+        connection_pool=None,
+        metrics=None,
+    ):
+        self._api_base = api_base
+        self._rate_limiter = rate_limiter
+        self._circuit_breaker = circuit_breaker
+        self._circuit_fallback = circuit_fallback
+        self._router = router
+        self._hedge_priorities = hedge_priorities
+        self._spool = spool
+        self._compression = compression
+        self._connection_pool = connection_pool or {}
+        self._metrics = metrics
+
+    def _dispatcher_options(self):
+        """
+        `AsyncSyncCastDispatcher` options for the SDK's connection-pool
+        settings. httpx keeps one pool for all hosts, sized to hold
+        `pool_maxsize` plus every `host_pools` size; `pool_block` does not
+        apply (httpx always waits for a free connection).
+        """
+        options = dict(self._connection_pool)
+        host_pools = options.pop("host_pools", None) or {}
+        pool_maxsize = options.pop("pool_maxsize", None)
+        for name in ("pool_block", "pool_connections", "hedge_workers"):
+            options.pop(name, None)
+        if pool_maxsize is not None:
+            options["max_connections"] = pool_maxsize + sum(host_pools.values())
+        if self._metrics is not None:
+            options["metrics"] = self._metrics
+        return options
+
+    @cached_property
+    def dispatcher(self):
+        """
+        Lazy-loaded AsyncSyncCastDispatcher instance using the current credentials.
+        """
+        from synccast.core.async_dispatcher import AsyncSyncCastDispatcher
+        dispatcher = AsyncSyncCastDispatcher(**self._dispatcher_options()).with_base_url(self._api_base)
+        if self._router is not None:
+            dispatcher.with_router(self._router, self._hedge_priorities)
+        if config._app_id and config._app_secret:
+            dispatcher.with_secret(config._app_id, config._app_secret)
+        if self._compression is not None:
+            dispatcher.with_compression(**self._compression)
+        if self._rate_limiter is not None:
+            dispatcher.with_rate_limiter(self._rate_limiter)
+        if self._circuit_breaker is not None:
+            dispatcher.with_circuit_breaker(self._circuit_breaker, self._circuit_fallback)
+        if self._spool is not None:
+            dispatcher.with_spool(self._spool)
+        return dispatcher
+
+    @cached_property
+    def stream(self):
+        """
+        Awaitable StreamService.
+        """
+        from synccast.api.aio import AsyncStreamService
+        return AsyncStreamService(dispatcher=self.dispatcher, app_id=config._app_id)
+
+    @cached_property
+    def presence(self):
+        """
+        Awaitable PresenceService.
+        """
+        from synccast.api.aio import AsyncPresenceService
+        return AsyncPresenceService(dispatcher=self.dispatcher, app_id=config._app_id)
+
+    @cached_property
+    def chat(self):
+        """
+        Awaitable MessageService.
+        """
+        from synccast.api.aio import AsyncMessageService
+        return AsyncMessageService(dispatcher=self.dispatcher, app_id=config._app_id)
+
+    @cached_property
+    def notify(self):
+        """
+        Awaitable NotificationService.
+        """
+        from synccast.api.aio import AsyncNotificationService
+        return AsyncNotificationService(dispatcher=self.dispatcher, app_id=config._app_id)
+
+    @cached_property
+    def typing(self):
+        """
+        Awaitable TypingService.
+        """
+        from synccast.api.aio import AsyncTypingService
+        return AsyncTypingService(dispatcher=self.dispatcher, app_id=config._app_id)
+
+    async def aclose(self) -> None:
+        """
+        Close the async dispatcher's connection pool, if it was created.
+        """
+        dispatcher = self.__dict__.get("dispatcher")
+        if dispatcher is not None:
+            await dispatcher.aclose()
@@ -0,0 +1,8 @@
+# synccast/tests/__init__.py
+
+"""
+Test suite for the SyncCast SDK, run with `pytest` (see `pytest.ini`).
+
+`synccast.tests` is also installed as a Django app by `synccast.tests.settings`,
+providing concrete models for the abstract SyncCast models.
+"""
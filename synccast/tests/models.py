@@ -0,0 +1,26 @@
+# Django imports
+from django.db import models
+
+# SyncCast abstract models
+from synccast.models import (
+    AbstractSyncCastScope,
+    AbstractSyncCastChannel,
+    AbstractSyncCastUserPresence,
+    AbstractSyncCastOutbox,
+)
+
+
+class Scope(AbstractSyncCastScope):
+    pass
+
+
+class Channel(AbstractSyncCastChannel):
+    scope = models.ForeignKey(Scope, on_delete=models.CASCADE, related_name="channels")
+
+
+class Presence(AbstractSyncCastUserPresence):
+    pass
+
+
+class Outbox(AbstractSyncCastOutbox):
+    pass
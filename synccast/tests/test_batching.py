@@ -0,0 +1,88 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast batching
+from synccast.core.batching import SyncCastBatcher, encode_fanout_entries
+from synccast.core.endpoints import PushEndpoints
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastDispatchError
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher
+
+
+class BatcherTests(SimpleTestCase):
+
+    def setUp(self):
+        self.dispatcher = RecordingDispatcher()
+
+    def make_batcher(self, **options):
+        batcher = SyncCastBatcher(self.dispatcher, **{"max_linger_ms": 1000, **options})
+        self.addCleanup(batcher.close)
+        return batcher
+
+    def test_events_are_sent_as_one_batch_in_order(self):
+        batcher = self.make_batcher()
+
+        futures = [batcher.post(f"/api/{n}/", json={"n": n}) for n in range(3)]
+        batcher.flush()
+
+        self.assertEqual([endpoint for endpoint, _ in self.dispatcher.posts], [PushEndpoints.BATCH])
+        self.assertEqual(self.dispatcher.events(), [(f"/api/{n}/", {"n": n}) for n in range(3)])
+        self.assertEqual([future.result() for future in futures], [{"ok": True}] * 3)
+
+    def test_size_and_byte_budgets_split_batches(self):
+        batcher = self.make_batcher(max_batch_size=2)
+        for n in range(5):
+            batcher.post("/api/a/", json={"n": n})
+        batcher.flush()
+        self.assertEqual(len(self.dispatcher.posts), 3)
+
+        self.dispatcher.posts.clear()
+        batcher = self.make_batcher(max_batch_bytes=60)
+        for n in range(3):
+            batcher.post("/api/a/", json={"padding": "x" * 20})
+        batcher.flush()
+        self.assertEqual(len(self.dispatcher.posts), 3)
+
+    def test_linger_flushes_without_a_flush_call(self):
+        batcher = self.make_batcher(max_linger_ms=5)
+
+        future = batcher.post("/api/a/", json={"n": 1})
+
+        self.assertEqual(future.result(timeout=1), {"ok": True})
+
+    def test_per_event_results_and_failures(self):
+        self.dispatcher.post = lambda endpoint, **kwargs: {"results": [{"ok": True}, {"ok": False}]}
+        batcher = self.make_batcher()
+        first, second = batcher.post("/api/a/", json={}), batcher.post("/api/b/", json={})
+        batcher.flush()
+        self.assertEqual((first.result(), second.result()), ({"ok": True}, {"ok": False}))
+
+        self.dispatcher.post = RecordingDispatcher(fail=ConnectionError("down")).post
+        failed = batcher.post("/api/a/", json={})
+        batcher.flush()
+        self.assertIsInstance(failed.exception(), ConnectionError)
+
+    def test_pre_encoded_entries(self):
+        batcher = self.make_batcher()
+
+        futures = batcher.post_encoded(encode_fanout_entries("/api/a/", {"n": 1}, [("u1", "t1"), ("u2", "t2")]))
+        batcher.flush()
+
+        self.assertEqual(len(futures), 2)
+        self.assertEqual(
+            self.dispatcher.events(),
+            [("/api/a/", {"user_id": "u1", "topic": "t1", "n": 1}), ("/api/a/", {"user_id": "u2", "topic": "t2", "n": 1})],
+        )
+
+    def test_close_flushes_and_rejects_new_events(self):
+        batcher = self.make_batcher()
+        future = batcher.post("/api/a/", json={})
+
+        batcher.close()
+
+        self.assertEqual(future.result(), {"ok": True})
+        with self.assertRaises(SyncCastDispatchError):
+            batcher.post("/api/a/", json={})
@@ -0,0 +1,155 @@
+# Default package imports
+import time
+import asyncio
+
+# Third-party imports
+import httpx
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast circuit breaker
+from synccast.core.breaker import SyncCastCircuitBreaker, CLOSED, OPEN, HALF_OPEN
+
+# SyncCast dispatchers
+from synccast.core.dispatcher import SyncCastDispatcher
+from synccast.core.async_dispatcher import AsyncSyncCastDispatcher
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastCircuitOpenError
+
+# Test doubles
+from synccast.tests.utils import StubAdapter
+
+
+ENDPOINT = "/api/chat/messages/"
+
+
+def make_breaker(**options) -> SyncCastCircuitBreaker:
+    options = {"window": 2, "min_calls": 2, "open_seconds": 0.05, "slow_call_seconds": None, **options}
+    return SyncCastCircuitBreaker(**options)
+
+
+def trip(breaker: SyncCastCircuitBreaker) -> None:
+    for _ in range(breaker.min_calls):
+        breaker.allow(ENDPOINT)
+        breaker.record(ENDPOINT, 0.0, failed=True)
+
+
+class CircuitBreakerTests(SimpleTestCase):
+
+    def test_opens_on_failure_rate(self):
+        breaker = make_breaker()
+        states = []
+        breaker.add_listener(lambda endpoint, old, new: states.append(new))
+
+        breaker.allow(ENDPOINT)
+        breaker.record(ENDPOINT, 0.0, failed=True)
+        self.assertEqual(breaker.state(ENDPOINT), CLOSED)  # Below min_calls
+
+        trip(breaker)
+        self.assertEqual(breaker.state(ENDPOINT), OPEN)
+        self.assertFalse(breaker.allow(ENDPOINT))
+        self.assertEqual(states, [OPEN])
+
+    def test_half_open_trial_closes_or_reopens(self):
+        breaker = make_breaker()
+        trip(breaker)
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow(ENDPOINT))
+        self.assertEqual(breaker.state(ENDPOINT), HALF_OPEN)
+        self.assertFalse(breaker.allow(ENDPOINT))  # The single trial slot is taken
+        breaker.record(ENDPOINT, 0.0, failed=True)
+        self.assertEqual(breaker.state(ENDPOINT), OPEN)
+
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow(ENDPOINT))
+        breaker.record(ENDPOINT, 0.0, failed=False)
+        self.assertEqual(breaker.state(ENDPOINT), CLOSED)
+
+    def test_release_gives_back_the_trial_slot(self):
+        breaker = make_breaker()
+        trip(breaker)
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow(ENDPOINT))
+        breaker.release(ENDPOINT)
+        self.assertTrue(breaker.allow(ENDPOINT))
+
+
+class DispatcherBreakerTests(SimpleTestCase):
+
+    def setUp(self):
+        self.breaker = make_breaker()
+        self.adapter = StubAdapter(200)
+        self.dispatcher = SyncCastDispatcher(base_url="http://synccast.test", retries=0)
+        self.dispatcher.with_circuit_breaker(self.breaker)
+        self.dispatcher.session.mount("http://", self.adapter)
+
+    def tearDown(self):
+        self.dispatcher.close()
+
+    def half_open(self) -> None:
+        trip(self.breaker)
+        time.sleep(0.06)
+
+    def test_open_circuit_fails_fast(self):
+        trip(self.breaker)
+
+        with self.assertRaises(SyncCastCircuitOpenError):
+            self.dispatcher.post(ENDPOINT, json={"n": 1})
+        self.assertEqual(self.adapter.requests, [])
+
+    def test_server_errors_open_the_circuit(self):
+        self.adapter.statuses = [500]
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                self.dispatcher.post(ENDPOINT, json={"n": 1})
+
+        self.assertEqual(self.breaker.state(ENDPOINT), OPEN)
+
+    def test_unencodable_payload_releases_the_trial_slot(self):
+        self.half_open()
+
+        with self.assertRaises(TypeError):
+            self.dispatcher.post(ENDPOINT, json={"when": object()})
+
+        self.dispatcher.post(ENDPOINT, json={"n": 1})
+        self.assertEqual(self.breaker.state(ENDPOINT), CLOSED)
+
+    def test_unexpected_error_releases_the_trial_slot(self):
+        self.half_open()
+        self.adapter.statuses = [RuntimeError("bug"), 200]
+
+        with self.assertRaises(RuntimeError):
+            self.dispatcher.post(ENDPOINT, json={"n": 1})
+        self.assertEqual(self.breaker.state(ENDPOINT), HALF_OPEN)
+
+        self.dispatcher.post(ENDPOINT, json={"n": 1})
+        self.assertEqual(self.breaker.state(ENDPOINT), CLOSED)
+
+
+class AsyncDispatcherBreakerTests(SimpleTestCase):
+
+    def post(self, dispatcher: AsyncSyncCastDispatcher, payload):
+        async def run():
+            dispatcher._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True})))
+            try:
+                return await dispatcher.post(ENDPOINT, json=payload)
+            finally:
+                await dispatcher.aclose()
+
+        return asyncio.run(run())
+
+    def test_unencodable_payload_releases_the_trial_slot(self):
+        breaker = make_breaker()
+        dispatcher = AsyncSyncCastDispatcher(base_url="http://synccast.test", retries=0).with_circuit_breaker(breaker)
+        trip(breaker)
+        time.sleep(0.06)
+
+        with self.assertRaises(TypeError):
+            self.post(dispatcher, {"when": object()})
+
+        self.assertEqual(self.post(dispatcher, {"n": 1}), {"ok": True})
+        self.assertEqual(breaker.state(ENDPOINT), CLOSED)
@@ -0,0 +1,90 @@
+# Default package imports
+import asyncio
+
+# Django imports
+from django.test import TestCase
+
+# SyncCast services
+from synccast.api.aio import AsyncNotificationService
+from synccast.api.notification import NotificationService
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher, AsyncRecordingDispatcher, make_scope
+
+
+class AsyncSendBulkTests(TestCase):
+
+    def setUp(self):
+        make_scope("system", "notification")
+
+    def test_awaits_every_chunk(self):
+        dispatcher = AsyncRecordingDispatcher(fail_users={"3"})
+        service = AsyncNotificationService(dispatcher, "app")
+
+        result = asyncio.run(service.send_bulk(range(10), {"text": "hi"}, chunk_size=3, concurrency=2))
+
+        self.assertEqual((result.sent, result.failed_ids, len(result.chunks)), (9, ["3"], 4))
+        self.assertEqual(sorted(int(event["user_id"]) for _, event in dispatcher.events()), [0, 1, 2, 4, 5, 6, 7, 8, 9])
+        self.assertLessEqual(dispatcher.max_active, 2 * 3)
+
+    def test_spooled_recipients_are_not_sent(self):
+        class SpoolingDispatcher(AsyncRecordingDispatcher):
+            async def post(self, endpoint, json=None, **kwargs):
+                return {"spooled": 1}
+
+        service = AsyncNotificationService(SpoolingDispatcher(), "app")
+
+        result = asyncio.run(service.send_bulk(range(3), {}, chunk_size=2))
+
+        self.assertEqual((result.sent, result.spooled, result.failed_ids), (0, 3, []))
+
+    def test_rate_limit_paces_chunks(self):
+        service = AsyncNotificationService(AsyncRecordingDispatcher(), "app")
+
+        result = asyncio.run(service.send_bulk(range(4), {}, chunk_size=2, rate_limit=40))
+
+        self.assertEqual(result.sent, 4)
+        self.assertGreaterEqual(result.elapsed, 0.04)
+
+
+class FailedRecipientsTests(TestCase):
+
+    def setUp(self):
+        make_scope("system", "notification")
+
+    def test_unrecognized_response_fails_the_chunk(self):
+        class NoneDispatcher(RecordingDispatcher):
+            def post_encoded(self, entries):
+                return None
+
+        result = NotificationService(NoneDispatcher(), "app").send_bulk(["a", "b"], {})
+
+        self.assertEqual((result.sent, result.failed_ids), (0, ["a", "b"]))
+        self.assertIn("Unrecognized", result.chunks[0]["error"])
+
+    def test_sync_send_bulk_on_async_dispatcher_reports_failures(self):
+        result = NotificationService(AsyncRecordingDispatcher(), "app").send_bulk(["a", "b"], {})
+
+        self.assertEqual((result.sent, result.failed_ids), (0, ["a", "b"]))
+
+    def test_batch_results(self):
+        response = {"results": [{"ok": True}, {"ok": False}, {"error": "gone"}]}
+        self.assertEqual(NotificationService._recipient_outcomes(["a", "b", "c"], response), (["b", "c"], []))
+        self.assertEqual(NotificationService._recipient_outcomes(["a", "b"], {"ok": False}), (["a", "b"], []))
+        self.assertEqual(NotificationService._recipient_outcomes(["a", "b"], {"accepted": 2}), ([], []))
+
+    def test_spooled_responses_are_not_sent(self):
+        outcomes = NotificationService._recipient_outcomes
+        self.assertEqual(outcomes(["a", "b"], {"spooled": 2}), ([], ["a", "b"]))
+        self.assertEqual(outcomes(["a", "b", "c"], [{"ok": True}, {"spooled": 1}, {"error": "x"}]), (["c"], ["b"]))
+
+    def test_send_bulk_counts_spooled_recipients(self):
+        class SpoolingDispatcher(RecordingDispatcher):
+            def post_encoded(self, entries):
+                return {"spooled": len(list(entries))}
+
+        result = NotificationService(SpoolingDispatcher(), "app").send_bulk(["a", "b", "c"], {}, chunk_size=2)
+
+        self.assertEqual((result.sent, result.spooled, result.failed, result.total), (0, 3, 0, 3))
+        self.assertEqual(sorted(chunk["spooled"] for chunk in result.chunks), [1, 2])
+        self.assertEqual(result.as_dict()["spooled"], 3)
@@ -0,0 +1,79 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast coalescing
+from synccast.core.coalescing import SyncCastCoalescer, deep_merge
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastDispatchError
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher
+
+
+def update(data, topic="app/ui/sync/1"):
+    return {"type": "data", "topic": topic, "data": data}
+
+
+class CoalescerTests(SimpleTestCase):
+
+    def setUp(self):
+        self.dispatcher = RecordingDispatcher()
+
+    def make_coalescer(self, **options):
+        coalescer = SyncCastCoalescer(self.dispatcher, **{"window_ms": 1000, "flush_on_exit": False, **options})
+        self.addCleanup(coalescer.close)
+        return coalescer
+
+    def test_last_update_per_topic_wins(self):
+        coalescer = self.make_coalescer()
+
+        futures = [coalescer.post("/api/ui/", json=update({"n": n})) for n in range(3)]
+        other = coalescer.post("/api/ui/", json=update({"n": 9}, topic="app/ui/sync/2"))
+        coalescer.flush()
+
+        self.assertEqual([payload["data"] for _, payload in self.dispatcher.posts], [{"n": 2}, {"n": 9}])
+        self.assertEqual([future.result() for future in futures + [other]], [{"ok": True}] * 4)
+        self.assertEqual(coalescer.metrics.snapshot()["counters"]["coalesce.collapsed"], 2)
+
+    def test_merge_combines_partial_updates(self):
+        coalescer = self.make_coalescer(merge=True)
+
+        coalescer.post("/api/ui/", json=update({"a": 1, "nested": {"x": 1}}))
+        coalescer.post("/api/ui/", json=update({"b": 2, "nested": {"y": 2}}))
+        coalescer.flush()
+
+        self.assertEqual(self.dispatcher.posts[0][1]["data"], {"a": 1, "b": 2, "nested": {"x": 1, "y": 2}})
+        self.assertEqual(deep_merge({"l": [1]}, {"l": [2]}), {"l": [2]})
+
+    def test_window_expiry_sends_without_flush(self):
+        coalescer = self.make_coalescer(window_ms=5)
+
+        future = coalescer.post("/api/ui/", json=update({"n": 1}))
+
+        self.assertEqual(future.result(timeout=1), {"ok": True})
+
+    def test_other_events_pass_through(self):
+        coalescer = self.make_coalescer()
+
+        self.assertEqual(coalescer.post("/api/chat/", json={"type": "message", "topic": "t"}), {"ok": True})
+        self.assertEqual(len(self.dispatcher.posts), 1)
+
+    def test_failed_send_fails_every_collapsed_future(self):
+        self.dispatcher.fail = ConnectionError("down")
+        coalescer = self.make_coalescer()
+
+        futures = [coalescer.post("/api/ui/", json=update({"n": n})) for n in range(2)]
+        coalescer.flush()
+
+        self.assertTrue(all(isinstance(future.exception(), ConnectionError) for future in futures))
+
+    def test_close_sends_pending_and_rejects_new_updates(self):
+        coalescer = self.make_coalescer()
+        future = coalescer.post("/api/ui/", json=update({"n": 1}))
+
+        coalescer.close()
+
+        self.assertEqual(future.result(), {"ok": True})
+        with self.assertRaises(SyncCastDispatchError):
+            coalescer.post("/api/ui/", json=update({"n": 2}))
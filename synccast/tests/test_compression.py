@@ -0,0 +1,65 @@
+# Default package imports
+import gzip
+from unittest import mock, skipUnless
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast compression
+from synccast.core import compression
+from synccast.core.compression import (
+    SyncCastCompressor,
+    GzipCompressor,
+    ZstdCompressor,
+    BrotliCompressor,
+    get_compressor,
+)
+
+
+BODY = b'{"topic":"app/chat/message/user/1","data":{"text":"hello"}}' * 20
+
+
+class CompressorTests(SimpleTestCase):
+
+    def test_base_class_is_abstract(self):
+        with self.assertRaises(TypeError):
+            SyncCastCompressor()
+
+    def test_gzip_round_trips_and_is_deterministic(self):
+        compressor = GzipCompressor()
+
+        body = compressor.compress(BODY)
+        self.assertEqual(gzip.decompress(body), BODY)
+        self.assertLess(len(body), len(BODY))
+        self.assertEqual(compressor.compress(BODY), body)  # mtime=0
+
+    def test_missing_optional_codecs_raise_import_error(self):
+        with mock.patch.object(compression, "zstandard", None), self.assertRaises(ImportError):
+            ZstdCompressor()
+        with mock.patch.object(compression, "brotli", None), self.assertRaises(ImportError):
+            BrotliCompressor()
+
+    @skipUnless(compression.zstandard, "zstandard is not installed")
+    def test_zstd_round_trips(self):
+        body = ZstdCompressor().compress(BODY)
+        self.assertEqual(compression.zstandard.ZstdDecompressor().decompress(body), BODY)
+
+    @skipUnless(compression.brotli, "brotli is not installed")
+    def test_brotli_round_trips(self):
+        body = BrotliCompressor().compress(BODY)
+        self.assertEqual(compression.brotli.decompress(body), BODY)
+
+
+class GetCompressorTests(SimpleTestCase):
+
+    def test_by_encoding_name(self):
+        self.assertIsInstance(get_compressor(), GzipCompressor)
+        self.assertEqual(get_compressor("gzip").encoding, "gzip")
+
+    def test_auto_falls_back_to_gzip(self):
+        with mock.patch.object(compression, "zstandard", None):
+            self.assertIsInstance(get_compressor("auto"), GzipCompressor)
+
+    def test_unknown_encoding(self):
+        with self.assertRaises(KeyError):
+            get_compressor("lz4")
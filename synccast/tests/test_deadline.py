@@ -0,0 +1,89 @@
+# Default package imports
+import time
+
+# Third-party imports
+import requests
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast deadline budgets and dispatcher
+from synccast.core.deadline import SyncCastDeadline
+from synccast.core.dispatcher import SyncCastDispatcher
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastDeadlineError, SyncCastDispatchError
+
+# Test doubles
+from synccast.tests.utils import StubAdapter
+
+
+ENDPOINT = "/api/chat/messages/"
+
+
+class DeadlineTests(SimpleTestCase):
+
+    def test_coerce(self):
+        deadline = SyncCastDeadline(50)
+
+        self.assertIs(SyncCastDeadline.coerce(deadline), deadline)
+        self.assertIsNone(SyncCastDeadline.coerce(None))
+        self.assertEqual(SyncCastDeadline.coerce(250).budget, 0.25)
+
+    def test_sleep_is_capped_at_the_remaining_budget(self):
+        deadline = SyncCastDeadline(20)
+
+        deadline.sleep(1.0, "backoff")
+
+        self.assertTrue(deadline.expired)
+        self.assertLessEqual(deadline.phases[0]["ms"], 20)
+
+    def test_error_reports_where_the_time_went(self):
+        deadline = SyncCastDeadline(100)
+        deadline.record("attempt", 0.03, status=503)
+        deadline.record("backoff", 0.01)
+        deadline.record("attempt", 0.02, status=503)
+
+        error = deadline.error(ENDPOINT)
+
+        self.assertIn("after 2 attempt(s)", str(error.message))
+        self.assertEqual(error.extra["spent_ms"], {"attempt": 50.0, "backoff": 10.0})
+        self.assertEqual(error.extra["endpoint"], ENDPOINT)
+
+
+class DispatcherDeadlineTests(SimpleTestCase):
+
+    def make_dispatcher(self, *statuses, **options):
+        dispatcher = SyncCastDispatcher(base_url="http://synccast.test", **options)
+        self.adapter = StubAdapter(*statuses)
+        dispatcher.session.mount("http://", self.adapter)
+        self.addCleanup(dispatcher.close)
+        return dispatcher
+
+    def test_retries_within_the_budget(self):
+        dispatcher = self.make_dispatcher(503, 503, 200, retries=3, backoff_factor=0.001)
+        deadline = SyncCastDeadline(1000)
+
+        self.assertEqual(dispatcher.post(ENDPOINT, json={"topic": "t"}, deadline_ms=deadline), {"ok": True})
+        self.assertEqual([phase.get("status") for phase in deadline.phases if phase["phase"] == "attempt"], [503, 503, 200])
+
+    def test_backoff_past_the_budget_fails_early(self):
+        dispatcher = self.make_dispatcher(503, retries=3, backoff_factor=0.2)
+
+        started = time.monotonic()
+        with self.assertRaises(SyncCastDeadlineError) as caught:
+            dispatcher.post(ENDPOINT, json={"topic": "t"}, deadline_ms=100)
+
+        self.assertLess(time.monotonic() - started, 0.2)
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertEqual(caught.exception.extra["last_status"], 503)
+
+    def test_exhausted_retries_fail_as_without_a_deadline(self):
+        dispatcher = self.make_dispatcher(requests.ConnectionError("refused"), retries=1, backoff_factor=0)
+
+        with self.assertRaises(SyncCastDispatchError) as caught:
+            dispatcher.post(ENDPOINT, json={"topic": "t"}, deadline_ms=1000)
+
+        self.assertNotIsInstance(caught.exception, SyncCastDeadlineError)
+        self.assertEqual(len(self.adapter.requests), 2)
+        self.assertEqual(caught.exception.extra["spent_ms"].keys(), {"attempt"})
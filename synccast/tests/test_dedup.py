@@ -0,0 +1,93 @@
+# Default package imports
+import time
+from concurrent.futures import Future
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast deduplication
+from synccast.core.dedup import SyncCastDeduplicator
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher
+
+
+ENDPOINT = "/api/chat/messages/"
+
+
+def event(event_id="e1", topic="app/chat/message/user/1", **fields):
+    return {"event_id": event_id, "topic": topic, "type": "message", "user_id": "1", "data": {"text": "hi"}, **fields}
+
+
+class DeduplicatorTests(SimpleTestCase):
+
+    def setUp(self):
+        self.dispatcher = RecordingDispatcher()
+        self.dedup = SyncCastDeduplicator(self.dispatcher, window_seconds=60)
+
+    def test_repeat_returns_first_result_without_posting(self):
+        first = self.dedup.post(ENDPOINT, json=event())
+        repeat = self.dedup.post(ENDPOINT, json=event())
+
+        self.assertEqual(len(self.dispatcher.posts), 1)
+        self.assertIs(repeat, first)
+        self.assertEqual(self.dedup.metrics.snapshot()["counters"]["dedup.suppressed"], 1)
+
+    def test_recipients_of_one_broadcast_stay_distinct(self):
+        self.dedup.post(ENDPOINT, json=event(topic="app/chat/message/user/1"))
+        self.dedup.post(ENDPOINT, json=event(topic="app/chat/message/user/2"))
+
+        self.assertEqual(len(self.dispatcher.posts), 2)
+
+    def test_events_without_id_pass_through(self):
+        self.dedup.post(ENDPOINT, json=event(event_id=None))
+        self.dedup.post(ENDPOINT, json=event(event_id=None))
+
+        self.assertEqual(len(self.dispatcher.posts), 2)
+
+    def test_by_content_ignores_event_id(self):
+        dedup = SyncCastDeduplicator(self.dispatcher, by_content=True)
+
+        dedup.post(ENDPOINT, json=event(event_id="a"))
+        dedup.post(ENDPOINT, json=event(event_id="b"))
+        dedup.post(ENDPOINT, json=event(event_id="c", data={"text": "bye"}))
+
+        self.assertEqual(len(self.dispatcher.posts), 2)
+
+    def test_failed_post_can_be_retried(self):
+        self.dispatcher.fail = ConnectionError("down")
+        with self.assertRaises(ConnectionError):
+            self.dedup.post(ENDPOINT, json=event())
+        self.dispatcher.fail = None
+
+        self.dedup.post(ENDPOINT, json=event())
+
+        self.assertEqual(len(self.dispatcher.posts), 2)
+
+    def test_failed_future_can_be_retried(self):
+        futures = [Future(), Future()]
+        self.dispatcher.post = lambda endpoint, json=None, **kwargs: futures.pop(0)
+        first = self.dedup.post(ENDPOINT, json=event())
+
+        self.assertIs(self.dedup.post(ENDPOINT, json=event()), first)  # Still in flight
+        first.set_exception(ConnectionError("down"))
+
+        self.assertIsNot(self.dedup.post(ENDPOINT, json=event()), first)
+        self.assertEqual(futures, [])
+
+    def test_keys_expire_after_the_window(self):
+        dedup = SyncCastDeduplicator(self.dispatcher, window_seconds=0.01)
+
+        dedup.post(ENDPOINT, json=event())
+        time.sleep(0.02)
+        dedup.post(ENDPOINT, json=event())
+
+        self.assertEqual(len(self.dispatcher.posts), 2)
+
+    def test_oldest_keys_are_evicted_past_max_keys(self):
+        dedup = SyncCastDeduplicator(self.dispatcher, max_keys=2)
+
+        for event_id in ("a", "b", "c", "a"):
+            dedup.post(ENDPOINT, json=event(event_id=event_id))
+
+        self.assertEqual(len(self.dispatcher.posts), 4)
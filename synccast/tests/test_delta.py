@@ -0,0 +1,156 @@
+# Default package imports
+import copy
+from concurrent.futures import Future
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast enums
+from synccast.core.enums import SyncCastEventType
+
+# SyncCast batch encoding
+from synccast.core.batching import encode_fanout_entries
+
+# SyncCast delta encoding and delivery lanes
+from synccast.core.delta import SyncCastDeltaEncoder, json_diff, apply_patch
+from synccast.core.lanes import SyncCastLaneRouter
+
+# SyncCast SDK
+from synccast.sdk import SyncCastSDK
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastValidationError
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher
+
+
+SYNC = SyncCastEventType.DATA_SYNC.value
+
+
+def update(data, topic="app/ui/sync/1", **fields):
+    return {"type": SYNC, "topic": topic, "data": data, **fields}
+
+
+class JsonPatchTests(SimpleTestCase):
+
+    def test_diff_round_trips(self):
+        cases = [
+            ({"a": 1, "b": {"c": [1, 2]}}, {"a": 2, "b": {"c": [1, 3]}, "d": "x"}),
+            ({"a/b": 1, "t~": 2}, {"a/b": 3}),
+            ({"items": [1, 2]}, {"items": [1, 2, 3]}),
+            ({"a": 1}, [1, 2]),
+            ({"a": 1}, {"a": 1.0}),
+        ]
+        for old, new in cases:
+            with self.subTest(old=old, new=new):
+                self.assertEqual(apply_patch(copy.deepcopy(old), json_diff(old, new)), new)
+
+    def test_equal_documents_need_no_ops(self):
+        self.assertEqual(json_diff({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}), [])
+
+
+class DeltaEncoderTests(SimpleTestCase):
+
+    def setUp(self):
+        self.dispatcher = RecordingDispatcher()
+        self.encoder = SyncCastDeltaEncoder(self.dispatcher, keyframe_interval=3)
+        self.document = {"title": "Board", "columns": [{"name": "todo", "cards": list(range(20))}], "rev": 0}
+
+    def sent(self):
+        return [payload for _, payload in self.dispatcher.posts]
+
+    def test_first_update_is_a_snapshot_then_patches(self):
+        self.encoder.post("/api/ui/", json=update(self.document))
+        self.encoder.post("/api/ui/", json=update({**self.document, "rev": 1}))
+
+        first, second = self.sent()
+        self.assertEqual(first["sync"], {"mode": "snapshot", "version": 1})
+        self.assertEqual(first["data"], self.document)
+        self.assertEqual(second["sync"], {"mode": "patch", "version": 2, "base_version": 1})
+        self.assertEqual(apply_patch(copy.deepcopy(self.document), second["data"]), {**self.document, "rev": 1})
+
+    def test_keyframes_and_large_patches_are_snapshots(self):
+        for rev in range(4):
+            self.encoder.post("/api/ui/", json=update({**self.document, "rev": rev}))
+        self.encoder.post("/api/ui/", json=update({"other": True}))
+
+        self.assertEqual([payload["sync"]["mode"] for payload in self.sent()], ["snapshot", "patch", "snapshot", "patch", "snapshot"])
+
+    def test_failed_delivery_sends_a_snapshot_next(self):
+        self.encoder.post("/api/ui/", json=update(self.document))
+        self.dispatcher.fail = ConnectionError("down")
+        with self.assertRaises(ConnectionError):
+            self.encoder.post("/api/ui/", json=update({**self.document, "rev": 1}))
+        self.dispatcher.fail = None
+
+        self.encoder.post("/api/ui/", json=update({**self.document, "rev": 2}))
+        self.assertEqual(self.sent()[-1]["sync"], {"mode": "snapshot", "version": 1})
+
+    def test_failed_future_sends_a_snapshot_next(self):
+        future = Future()
+        self.dispatcher.post = lambda endpoint, json=None, **kwargs: future
+        self.encoder.post("/api/ui/", json=update(self.document))
+        future.set_exception(ConnectionError("down"))
+
+        sync, _ = self.encoder.encode("app/ui/sync/1", self.document)
+        self.assertEqual(sync["mode"], "snapshot")
+
+    def test_other_events_pass_through(self):
+        payload = {"type": "chat.message", "topic": "t", "data": {"text": "hi"}}
+
+        self.encoder.post("/api/chat/", json=payload)
+
+        self.assertEqual(self.sent(), [payload])
+
+    def test_pre_encoded_updates_pass_through_and_reset_their_topics(self):
+        self.encoder.post("/api/ui/", json=update(self.document))
+        self.encoder.post("/api/ui/", json=update(self.document, topic="app/ui/sync/2"))
+        self.dispatcher.post_encoded = lambda entries: self.dispatcher.posts.append(("batch", list(entries)))
+        entries = encode_fanout_entries("/api/ui/", {"type": SYNC, "data": {"rev": 1}}, [("u1", "app/ui/sync/1")])
+
+        self.encoder.post_encoded(entries)
+
+        self.assertEqual(self.sent()[-1], entries)
+        self.assertEqual(self.encoder.encode("app/ui/sync/1", self.document)[0]["mode"], "snapshot")
+        self.assertEqual(self.encoder.encode("app/ui/sync/2", self.document)[0]["mode"], "patch")
+
+    def test_no_post_encoded_without_one_on_the_dispatcher(self):
+        self.assertIsNone(self.encoder.post_encoded)
+
+    def test_caller_mutations_do_not_leak_into_the_base(self):
+        self.encoder.post("/api/ui/", json=update(self.document))
+        self.document["columns"][0]["cards"].append(99)
+
+        self.encoder.post("/api/ui/", json=update(self.document))
+        patch = self.sent()[-1]
+        self.assertEqual(patch["sync"]["mode"], "patch")
+        self.assertTrue(patch["data"])
+
+
+class DeltaWithQueueingStagesTests(SimpleTestCase):
+
+    def test_sdk_refuses_delta_with_background_dispatch(self):
+        with self.assertRaises(SyncCastValidationError):
+            SyncCastSDK().enable_background_dispatch().enable_delta()
+        with self.assertRaises(SyncCastValidationError):
+            SyncCastSDK().enable_delta().enable_background_dispatch()
+
+    def test_delta_updates_keep_to_the_standard_lane(self):
+        standard, urgent, background = RecordingDispatcher(), RecordingDispatcher(), RecordingDispatcher()
+        encoder = SyncCastDeltaEncoder(SyncCastLaneRouter(standard, urgent=urgent, background=background))
+
+        encoder.post("/api/ui/", json=update({"n": 1}, priority="low"))
+        encoder.post("/api/ui/", json=update({"n": 2}, priority="high"))
+        encoder.post("/api/ui/", json=update({"n": 3}, qos=0))
+        encoder.post("/api/chat/", json={"type": "chat.message", "topic": "t", "priority": "low"})
+
+        self.assertEqual([payload["sync"]["version"] for _, payload in standard.posts], [1, 2, 3])
+        self.assertEqual((urgent.posts, len(background.posts)), ([], 1))
+
+    def test_sdk_stacks_delta_over_lanes(self):
+        sdk = SyncCastSDK().enable_lanes().enable_delta()
+        self.addCleanup(sdk._reset)
+
+        self.assertIsInstance(sdk.publisher, SyncCastDeltaEncoder)
+        self.assertIsInstance(sdk.publisher.dispatcher, SyncCastLaneRouter)
@@ -0,0 +1,52 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast delivery lanes
+from synccast.core.lanes import SyncCastLaneRouter
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher
+
+
+class LaneRouterTests(SimpleTestCase):
+
+    def setUp(self):
+        self.standard, self.urgent, self.background = RecordingDispatcher(), RecordingDispatcher(), RecordingDispatcher()
+        self.router = SyncCastLaneRouter(self.standard, urgent=self.urgent, background=self.background)
+
+    def test_lane_follows_priority_and_qos(self):
+        cases = [
+            ({"priority": "high"}, "urgent"),
+            ({"priority": "high", "qos": 0}, "urgent"),
+            ({"priority": "low"}, "background"),
+            ({"priority": "normal", "qos": 0}, "background"),
+            ({"priority": "normal", "qos": 1}, "standard"),
+            ({}, "standard"),
+        ]
+        for payload, lane in cases:
+            with self.subTest(payload=payload):
+                self.assertEqual(self.router.lane_for(payload), lane)
+
+    def test_missing_lanes_fall_back_to_standard(self):
+        router = SyncCastLaneRouter(self.standard)
+
+        self.assertEqual(router.lane_for({"priority": "high"}), "standard")
+        self.assertEqual(router.lane_for({"priority": "low"}), "standard")
+
+    def test_post_uses_the_lane_dispatcher_and_counts_it(self):
+        self.router.post("/api/chat/messages/", json={"priority": "high", "n": 1})
+        self.router.post("/api/chat/typing/", json={"priority": "low", "n": 2})
+        self.router.post("/api/chat/messages/", json={"n": 3})
+
+        self.assertEqual(self.urgent.posts, [("/api/chat/messages/", {"priority": "high", "n": 1})])
+        self.assertEqual(self.background.posts, [("/api/chat/typing/", {"priority": "low", "n": 2})])
+        self.assertEqual(self.standard.posts, [("/api/chat/messages/", {"n": 3})])
+        counters = self.router.metrics.snapshot()["counters"]
+        self.assertEqual((counters["lanes.urgent"], counters["lanes.background"], counters["lanes.standard"]), (1, 1, 1))
+
+    def test_batches_take_the_standard_lane(self):
+        self.assertIsNone(self.router.post_encoded)
+
+        self.standard.post_encoded = lambda entries: "sent"
+        self.assertEqual(self.router.post_encoded([b"{}"]), "sent")
+        self.assertIs(self.router.serializer, self.standard.serializer)
@@ -0,0 +1,75 @@
+# Django imports
+from django.db import transaction
+from django.test import TransactionTestCase
+
+# SyncCast outbox
+from synccast.core.outbox import SyncCastOutboxDispatcher
+
+# Test models and doubles
+from synccast.tests.models import Outbox
+from synccast.tests.utils import RecordingDispatcher
+
+
+class OutboxFlushTests(TransactionTestCase):
+
+    def setUp(self):
+        self.dispatcher = RecordingDispatcher()
+        self.outbox = SyncCastOutboxDispatcher(self.dispatcher, model=Outbox, flush_in_background=False)
+
+    def test_autocommit_post_is_sent_immediately(self):
+        row = self.outbox.post("/api/chat/messages/", json={"topic": "a"})
+
+        self.assertEqual(self.dispatcher.events(), [("/api/chat/messages/", {"topic": "a"})])
+        row.refresh_from_db()
+        self.assertEqual(row.status, Outbox.OutboxStatus.SENT)
+
+    def test_posts_in_atomic_are_sent_once_after_commit(self):
+        with transaction.atomic():
+            self.outbox.post("/api/a/", json={"n": 1})
+            self.outbox.post("/api/b/", json={"n": 2})
+            self.assertEqual(self.dispatcher.posts, [])
+
+        self.assertEqual(len(self.dispatcher.posts), 1)  # One batch request
+        self.assertEqual(self.dispatcher.events(), [("/api/a/", {"n": 1}), ("/api/b/", {"n": 2})])
+        self.assertFalse(Outbox.objects.filter(status=Outbox.OutboxStatus.PENDING).exists())
+
+    def test_rollback_discards_intents(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.outbox.post("/api/a/", json={"n": 1})
+                raise RuntimeError
+
+        self.assertEqual(self.dispatcher.posts, [])
+        self.assertFalse(Outbox.objects.exists())
+
+        with transaction.atomic():
+            self.outbox.post("/api/b/", json={"n": 2})
+        self.assertEqual(self.dispatcher.events(), [("/api/b/", {"n": 2})])
+
+    def test_rolled_back_savepoint_keeps_outer_flush(self):
+        with transaction.atomic():
+            self.outbox.post("/api/a/", json={"n": 1})
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.outbox.post("/api/b/", json={"n": 2})
+                    raise RuntimeError
+
+        self.assertEqual(self.dispatcher.events(), [("/api/a/", {"n": 1})])
+
+    def test_background_flush_outside_atomic(self):
+        outbox = SyncCastOutboxDispatcher(self.dispatcher, model=Outbox)
+        outbox.post("/api/a/", json={"n": 1})
+        outbox.close()
+
+        self.assertEqual(self.dispatcher.events(), [("/api/a/", {"n": 1})])
+
+    def test_failed_delivery_stays_pending_for_drain(self):
+        self.dispatcher.fail = RuntimeError("down")
+        row = self.outbox.post("/api/a/", json={"n": 1})
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), (Outbox.OutboxStatus.PENDING, 1))
+
+        self.dispatcher.fail = None
+        self.assertEqual(self.outbox.drain(), 1)
+        row.refresh_from_db()
+        self.assertEqual(row.status, Outbox.OutboxStatus.SENT)
@@ -0,0 +1,122 @@
+# Default package imports
+import threading
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast dispatch pool
+from synccast.core.enums import SyncCastOverflowPolicy
+from synccast.core.pool import SyncCastDispatchPool
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastBackpressureError
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher
+
+
+class GatedDispatcher(RecordingDispatcher):
+    """
+    `RecordingDispatcher` whose posts wait for `gate`, so events stay queued.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.busy = threading.Event()
+
+    def post(self, endpoint, json=None, **kwargs):
+        self.busy.set()
+        self.gate.wait(5)
+        return super().post(endpoint, json=json, **kwargs)
+
+
+def event(event_type, topic="t", **fields):
+    return {"type": event_type, "topic": topic, **fields}
+
+
+class DispatchPoolTests(SimpleTestCase):
+
+    def setUp(self):
+        self.dispatcher = GatedDispatcher()
+
+    def make_pool(self, **options):
+        pool = SyncCastDispatchPool(self.dispatcher, **{"workers": 1, "drain_on_exit": False, **options})
+        self.addCleanup(pool.shutdown, drain=False)
+        self.addCleanup(self.dispatcher.gate.set)
+        return pool
+
+    def occupy(self, pool):
+        """
+        Keep the only worker busy so later events stay queued.
+        """
+        future = pool.post("/api/a/", json=event("message", topic="busy"))
+        self.dispatcher.busy.wait(1)
+        return future
+
+    def test_post_returns_a_future_for_the_result(self):
+        pool = self.make_pool()
+        self.dispatcher.gate.set()
+
+        self.assertEqual(pool.post("/api/a/", json=event("message")).result(timeout=1), {"ok": True})
+        pool.shutdown()
+        self.assertEqual(pool.metrics.snapshot()["counters"]["pool.sent"], 1)
+
+    def test_queued_updates_coalesce_per_topic(self):
+        pool = self.make_pool()
+        self.occupy(pool)
+
+        first = pool.post("/api/ui/", json=event("data", n=1))
+        second = pool.post("/api/ui/", json=event("data", n=2))
+        self.dispatcher.gate.set()
+        pool.shutdown()
+
+        self.assertEqual([payload.get("n") for _, payload in self.dispatcher.posts], [None, 2])
+        self.assertEqual(first.result(), second.result())
+
+    def test_full_queue_evicts_oldest_of_the_same_type(self):
+        pool = self.make_pool(maxsize=2)
+        self.occupy(pool)
+
+        oldest = pool.post("/api/typing/", json=event("typing", topic="a"))
+        pool.post("/api/typing/", json=event("typing", topic="b"))
+        pool.post("/api/typing/", json=event("typing", topic="c"))
+
+        self.assertIsInstance(oldest.exception(timeout=1), SyncCastBackpressureError)
+        self.assertEqual(pool.depth, 2)
+
+    def test_full_queue_blocks_then_rejects(self):
+        pool = self.make_pool(maxsize=1, block_timeout=0.05)
+        self.occupy(pool)
+        pool.post("/api/a/", json=event("message"))
+
+        with self.assertRaises(SyncCastBackpressureError):
+            pool.post("/api/a/", json=event("message"))
+
+    def test_batches_go_through_post_encoded_and_never_coalesce(self):
+        self.assertIsNone(self.make_pool().post_encoded)
+
+        sent = []
+        self.dispatcher.post_encoded = lambda entries: sent.append(entries) or {"ok": True}
+        pool = self.make_pool(default_policy=SyncCastOverflowPolicy.COALESCE)
+        self.occupy(pool)
+
+        pool.post_encoded([b"1"])
+        future = pool.post_encoded(iter([b"2", b"3"]))
+        self.dispatcher.gate.set()
+
+        self.assertEqual(future.result(timeout=1), {"ok": True})
+        pool.shutdown()
+        self.assertEqual(sent, [[b"1"], [b"2", b"3"]])
+
+    def test_shutdown_without_drain_fails_queued_events(self):
+        pool = self.make_pool()
+        self.occupy(pool)
+        queued = pool.post("/api/a/", json=event("message"))
+
+        pool.shutdown(drain=False, timeout=0.01)  # The worker is still busy
+        self.dispatcher.gate.set()
+
+        self.assertIsInstance(queued.exception(timeout=1), SyncCastBackpressureError)
+        with self.assertRaises(SyncCastBackpressureError):
+            pool.post("/api/a/", json=event("message"))
@@ -0,0 +1,126 @@
+# Default package imports
+import time
+from datetime import timedelta
+
+# Django imports
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+# SyncCast presence tracking
+from synccast.core.presence import SyncCastPresenceManager, InMemoryPresenceStore, CachePresenceStore
+
+# SyncCast services
+from synccast.api.presence import PresenceService
+
+# Test models and doubles
+from synccast.tests.models import Presence
+from synccast.tests.utils import RecordingDispatcher, make_scope
+
+
+class PresenceTestCase(TestCase):
+
+    def setUp(self):
+        make_scope("chat", "presence")
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+
+    def manager(self, **options) -> SyncCastPresenceManager:
+        options = {"flush_interval": 60.0, "flush_on_exit": False, "model": Presence, **options}
+        manager = SyncCastPresenceManager(PresenceService(RecordingDispatcher(), "app"), **options)
+        self.managers.append(manager)
+        return manager
+
+    def user(self, name: str = "a") -> str:
+        return str(get_user_model().objects.create(username=name).pk)
+
+    def statuses(self, manager: SyncCastPresenceManager):
+        return [event["data"]["status"] for _, event in manager.service.dispatcher.events()]
+
+
+class PresenceWriteTests(PresenceTestCase):
+
+    def test_last_seen_is_written_per_user(self):
+        users = [get_user_model().objects.create(username=name) for name in ("a", "b", "c")]
+        for user in users:
+            Presence.objects.create(user=user)
+        now = timezone.now()
+        seen = {str(user.pk): now - timedelta(minutes=index) for index, user in enumerate(users)}
+
+        written = self.manager(chunk_size=2)._write(seen, {})
+
+        self.assertEqual(written, 3)
+        for user in users:
+            self.assertEqual(Presence.objects.get(user=user).last_seen_at, seen[str(user.pk)])
+
+    def test_write_behind_creates_missing_rows(self):
+        user = get_user_model().objects.create(username="a")
+        manager = self.manager()
+
+        manager.heartbeat(user.pk, topic="app/chat/presence/user/a")
+        manager.write_behind()
+
+        row = Presence.objects.get(user=user)
+        self.assertEqual(row.status, "online")
+        self.assertIsNotNone(row.last_seen_at)
+
+
+class PresenceExpiryTests(PresenceTestCase):
+
+    def test_silent_users_go_offline_once(self):
+        manager = self.manager(offline_after=0.05)
+        user = self.user()
+
+        self.assertTrue(manager.heartbeat(user, topic="t/1"))
+        self.assertFalse(manager.heartbeat(user, topic="t/1"))
+        time.sleep(0.1)
+        manager.flush(write=False)
+        manager.flush(write=False)
+
+        self.assertEqual(self.statuses(manager), ["online", "offline"])
+
+    def test_user_seen_by_another_process_stays_online(self):
+        store = CachePresenceStore(prefix="synccast:test:")
+        first = self.manager(store=store, offline_after=0.2)
+        second = self.manager(store=store, offline_after=0.2)
+        user = self.user()
+
+        first.heartbeat(user, topic="t/1")
+        time.sleep(0.25)
+        second.heartbeat(user, topic="t/1")
+        second.flush(write=False)
+        first.flush(write=False)  # Also pushes its older last-seen time
+
+        self.assertEqual(store.get_status(user), "online")
+        self.assertEqual(self.statuses(first), ["online"])
+
+        time.sleep(0.25)
+        first.flush(write=False)
+        second.flush(write=False)
+        self.assertEqual(store.get_status(user), "offline")
+        self.assertEqual(self.statuses(first) + self.statuses(second), ["online", "offline"])
+
+    def test_store_is_not_called_under_the_lock(self):
+        test = self
+
+        class CheckingStore(InMemoryPresenceStore):
+            def get_status(self, user_id):
+                test.assertFalse(manager._cond._is_owned())
+                return super().get_status(user_id)
+
+            def set_status(self, user_id, status):
+                test.assertFalse(manager._cond._is_owned())
+                super().set_status(user_id, status)
+
+        manager = self.manager(store=CheckingStore(), offline_after=0.05)
+        first, second = self.user("a"), self.user("b")
+        manager.heartbeat(first, topic="t/1")
+        manager.disconnect(first)
+        manager.heartbeat(second, topic="t/2")
+        time.sleep(0.1)
+        manager.flush(write=False)
+
+        self.assertEqual(self.statuses(manager), ["online", "offline", "online", "offline"])
@@ -0,0 +1,94 @@
+# Default package imports
+import time
+from email.utils import formatdate
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast rate limiter and dispatcher
+from synccast.core.ratelimit import SyncCastRateLimiter, parse_retry_after
+from synccast.core.dispatcher import SyncCastDispatcher
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastRateLimitError
+
+# Test doubles
+from synccast.tests.utils import StubAdapter
+
+
+ENDPOINT = "/api/chat/messages/"
+KEY = ("app", ENDPOINT)
+
+
+class RetryAfterTests(SimpleTestCase):
+
+    def test_parses_seconds_and_dates(self):
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertEqual(parse_retry_after("-1"), 0.0)
+        self.assertAlmostEqual(parse_retry_after(formatdate(time.time() + 30, usegmt=True)), 30, delta=2)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class RateLimiterTests(SimpleTestCase):
+
+    def test_tokens_are_spaced_at_the_rate(self):
+        limiter = SyncCastRateLimiter(rate=10)
+
+        self.assertEqual(limiter.reserve(KEY), 0)
+        self.assertAlmostEqual(limiter.reserve(KEY), 0.1, delta=0.01)
+        self.assertAlmostEqual(limiter.reserve(KEY), 0.2, delta=0.01)
+
+    def test_buckets_are_per_key(self):
+        limiter = SyncCastRateLimiter(rate=10)
+        limiter.reserve(KEY)
+
+        self.assertEqual(limiter.reserve(("app", "/api/chat/typing/")), 0)
+
+    def test_low_priority_is_shed_instead_of_waiting(self):
+        limiter = SyncCastRateLimiter(rate=10)
+        limiter.reserve(KEY)
+
+        with self.assertRaises(SyncCastRateLimitError):
+            limiter.reserve(KEY, "low")
+        self.assertGreater(limiter.reserve(KEY, "normal"), 0)
+        self.assertEqual(limiter.metrics.snapshot()["counters"]["ratelimit.shed"], 1)
+
+    def test_waits_past_max_wait_are_rejected(self):
+        limiter = SyncCastRateLimiter(rate=1, max_wait=0.5)
+        limiter.reserve(KEY)
+
+        with self.assertRaises(SyncCastRateLimitError):
+            limiter.reserve(KEY)
+
+    def test_aimd_rate(self):
+        limiter = SyncCastRateLimiter(rate=10, max_rate=10.5, increase=5, cooldown=60)
+
+        limiter.on_success(KEY)
+        limiter.on_success(KEY)
+        self.assertEqual(limiter.rate(KEY), 10.5)
+
+        limiter.on_throttled(KEY)
+        limiter.on_throttled(KEY)  # Within the cooldown: counts once
+        self.assertEqual(limiter.rate(KEY), 5.25)
+
+    def test_retry_after_pauses_the_bucket(self):
+        limiter = SyncCastRateLimiter(rate=100)
+
+        limiter.on_throttled(KEY, retry_after=0.5)
+
+        self.assertGreaterEqual(limiter.reserve(KEY), 0.5)
+
+
+class DispatcherRateLimitTests(SimpleTestCase):
+
+    def test_429_is_retried_once_the_limiter_allows(self):
+        limiter = SyncCastRateLimiter(rate=50)
+        dispatcher = SyncCastDispatcher(base_url="http://synccast.test", retries=2).with_rate_limiter(limiter)
+        adapter = StubAdapter(429, 200)
+        dispatcher.session.mount("http://", adapter)
+        self.addCleanup(dispatcher.close)
+
+        self.assertEqual(dispatcher.post(ENDPOINT, json={"topic": "t"}), {"ok": True})
+        self.assertEqual(len(adapter.requests), 2)
+        self.assertLess(limiter.rate(dispatcher._limit_key(ENDPOINT)), 50)
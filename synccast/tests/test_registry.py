@@ -0,0 +1,74 @@
+# Django imports
+from django.test import TestCase
+
+# SyncCast scope registry and topic builder
+from synccast.core.registry import SyncCastScopeRegistry, scope_registry
+from synccast.core.topic import SyncCastTopicBuilder
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastTopicError
+
+# Test models and helpers
+from synccast.tests.models import Scope, Channel
+from synccast.tests.utils import make_scope
+
+
+class ScopeRegistryTests(TestCase):
+
+    def setUp(self):
+        self.scope = make_scope("chat", "message", "typing")
+        self.registry = SyncCastScopeRegistry(ttl=300).load()
+
+    def test_warm_lookups_make_no_queries(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.registry.scope("chat").pk, self.scope.pk)
+            self.assertEqual(self.registry.channels("chat"), {"message", "typing"})
+            self.assertEqual(self.registry.channels(self.scope, "message"), {"message", "typing"})
+
+    def test_scope_created_without_signals_is_found(self):
+        Scope.objects.bulk_create([Scope(name="ui")])
+
+        self.assertEqual(self.registry.scope("ui").name, "ui")
+
+    def test_channel_created_without_signals_is_found(self):
+        Channel.objects.bulk_create([Channel(scope=self.scope, name="presence")])
+
+        self.assertEqual(self.registry.channels("chat"), {"message", "typing"})  # Still cached
+        self.assertIn("presence", self.registry.channels("chat", "presence"))
+        with self.assertNumQueries(0):
+            self.assertIn("presence", self.registry.channels("chat", "presence"))
+
+    def test_misses_raise(self):
+        with self.assertRaises(LookupError):
+            self.registry.scope("missing")
+        self.assertEqual(self.registry.channels("chat", "missing"), {"message", "typing"})
+
+    def test_expired_cache_is_reloaded(self):
+        registry = SyncCastScopeRegistry(ttl=0).load()
+        Channel.objects.bulk_create([Channel(scope=self.scope, name="presence")])
+
+        self.assertIn("presence", registry.channels("chat"))
+
+
+class ScopeRegistryInvalidationTests(TestCase):
+
+    def setUp(self):
+        self.scope = make_scope("chat", "message")
+
+    def test_saves_and_deletes_invalidate(self):
+        channel = Channel.objects.create(scope=self.scope, name="typing")
+        self.assertIn("typing", scope_registry.channels("chat"))
+
+        channel.delete()
+        self.assertEqual(scope_registry.channels("chat"), {"message"})
+
+    def test_topic_builder_validates_channels(self):
+        Channel.objects.bulk_create([Channel(scope=self.scope, name="typing")])
+
+        topic = SyncCastTopicBuilder("app", "chat").channel("typing").build()
+        self.assertTrue(topic.startswith("app/chat/typing"))
+
+        with self.assertRaises(SyncCastTopicError):
+            SyncCastTopicBuilder("app", "chat").channel("missing")
+        with self.assertRaises(SyncCastTopicError):
+            SyncCastTopicBuilder("app", "missing")
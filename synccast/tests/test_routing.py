@@ -0,0 +1,142 @@
+# Default package imports
+import time
+from urllib.parse import urlsplit
+
+# Third-party imports
+import requests
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast routing and dispatcher
+from synccast.core.routing import SyncCastEndpointRouter
+from synccast.core.dispatcher import SyncCastDispatcher
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastValidationError
+
+# Test doubles
+from synccast.tests.utils import StubAdapter
+
+
+PRIMARY, SECONDARY = "http://a.test", "http://b.test"
+ENDPOINT = "/api/chat/messages/"
+
+
+class HostAdapter(requests.adapters.BaseAdapter):
+    """
+    `requests` adapter answering per host: `hosts` maps a netloc to a
+    `(status, delay)` pair, or to an exception to raise.
+    """
+
+    def __init__(self, **hosts):
+        super().__init__()
+        self.hosts = {host.replace("_", "."): outcome for host, outcome in hosts.items()}
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).netloc
+        self.requests.append(host)
+        outcome = self.hosts[host]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        status, delay = outcome
+        time.sleep(delay)
+        return StubAdapter(status).send(request)
+
+    def close(self):
+        pass
+
+
+class EndpointRouterTests(SimpleTestCase):
+
+    def make_router(self, **options):
+        return SyncCastEndpointRouter([PRIMARY, SECONDARY], **{"probe_interval": None, **options})
+
+    def test_needs_a_base_url(self):
+        with self.assertRaises(SyncCastValidationError):
+            SyncCastEndpointRouter([])
+
+    def test_unmeasured_urls_rank_first(self):
+        router = self.make_router()
+        router.record(PRIMARY, 0.01, failed=False)
+
+        self.assertEqual(router.ranked(), [SECONDARY, PRIMARY])
+
+    def test_ranks_by_latency_and_error_rate(self):
+        router = self.make_router()
+        router.record(PRIMARY, 0.01, failed=False)
+        router.record(SECONDARY, 0.05, failed=False)
+        self.assertEqual(router.best(), PRIMARY)
+
+        for _ in range(3):  # Error rate 0.49: 0.01 s now costs as much as 0.059 s
+            router.record(PRIMARY, 0.01, failed=True)
+        self.assertEqual(router.best(), SECONDARY)
+
+    def test_stale_url_is_probed(self):
+        router = self.make_router(probe_interval=0.01)
+        router.record(PRIMARY, 0.01, failed=False)
+        router.record(SECONDARY, 0.05, failed=False)
+        router.ranked()
+        time.sleep(0.02)
+        router.record(PRIMARY, 0.01, failed=False)
+
+        self.assertEqual(router.best(), SECONDARY)
+
+    def test_hedge_delay_is_the_p95_after_min_samples(self):
+        router = self.make_router(min_samples=20, min_hedge_delay=0.001)
+        for index in range(19):
+            router.record(PRIMARY, (index + 1) / 1000, failed=False)
+        self.assertIsNone(router.hedge_delay(PRIMARY))
+
+        router.record(PRIMARY, 0.5, failed=False)
+        router.record(PRIMARY, 0.05, failed=True)  # Failures are not samples
+
+        self.assertEqual(router.hedge_delay(PRIMARY), 0.5)
+
+
+class RoutedDispatcherTests(SimpleTestCase):
+
+    def make_dispatcher(self, adapter, **options):
+        dispatcher = SyncCastDispatcher(retries=0).with_base_urls(
+            [PRIMARY, SECONDARY], **{"probe_interval": None, **options}
+        )
+        dispatcher.session.mount("http://", adapter)
+        self.addCleanup(dispatcher.close)
+        dispatcher.router.record(PRIMARY, 0.01, failed=False)
+        dispatcher.router.record(SECONDARY, 0.05, failed=False)
+        return dispatcher
+
+    def test_fails_over_on_5xx(self):
+        adapter = HostAdapter(a_test=(503, 0), b_test=(200, 0))
+        dispatcher = self.make_dispatcher(adapter)
+
+        self.assertEqual(dispatcher.post(ENDPOINT, json={"topic": "t"}), {"ok": True})
+        self.assertEqual(adapter.requests, ["a.test", "b.test"])
+        self.assertGreater(dispatcher.router.stats()[PRIMARY]["error_rate"], 0)
+
+    def test_fails_over_on_connection_errors(self):
+        adapter = HostAdapter(a_test=requests.ConnectionError("refused"), b_test=(200, 0))
+        dispatcher = self.make_dispatcher(adapter)
+
+        self.assertEqual(dispatcher.post(ENDPOINT, json={"topic": "t"}), {"ok": True})
+        self.assertEqual(adapter.requests, ["a.test", "b.test"])
+
+    def test_slow_urgent_post_is_hedged(self):
+        adapter = HostAdapter(a_test=(200, 0.3), b_test=(200, 0))
+        dispatcher = self.make_dispatcher(adapter, min_samples=1, min_hedge_delay=0.01)
+
+        started = time.monotonic()
+        dispatcher.post(ENDPOINT, json={"topic": "t", "priority": "high"})
+
+        self.assertLess(time.monotonic() - started, 0.25)
+        counters = dispatcher.metrics.snapshot()["counters"]
+        self.assertEqual((counters["routing.hedged"], counters["routing.hedge_won"]), (1, 1))
+
+    def test_other_priorities_are_not_hedged(self):
+        adapter = HostAdapter(a_test=(200, 0.05), b_test=(200, 0))
+        dispatcher = self.make_dispatcher(adapter, min_samples=1, min_hedge_delay=0.01)
+
+        dispatcher.post(ENDPOINT, json={"topic": "t", "priority": "normal"})
+
+        self.assertEqual(adapter.requests, ["a.test"])
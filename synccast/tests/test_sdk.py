@@ -0,0 +1,118 @@
+# Default package imports
+import shutil
+import tempfile
+
+# Django imports
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+# SyncCast service endpoints
+from synccast.core.endpoints import PushEndpoints
+
+# SyncCast SDK
+from synccast.sdk import SyncCastSDK
+
+# Test models and doubles
+from synccast.tests.models import Outbox
+from synccast.tests.utils import StubAdapter, make_scope
+
+
+class LaneDispatcherTests(SimpleTestCase):
+
+    def test_reset_closes_lane_dispatchers(self):
+        sdk = SyncCastSDK().enable_lanes()
+        router = sdk.publisher
+        urgent, background = router.lanes["urgent"], router.lanes["background"].dispatcher
+        closed = []
+        urgent.close = lambda: closed.append("urgent")
+        background.close = lambda: closed.append("background")
+
+        sdk._reset()
+
+        self.assertEqual(sorted(closed), ["background", "urgent"])
+
+
+class StackedPublisherTests(TestCase):
+
+    def setUp(self):
+        make_scope("chat", "message")
+        self.sdk = SyncCastSDK()
+        self.addCleanup(self.sdk._reset)
+        self.adapter = StubAdapter(200)
+
+    def broadcast(self) -> None:
+        for prefix in ("http://", "https://"):
+            self.sdk.dispatcher.session.mount(prefix, self.adapter)
+        self.sdk.chat.broadcast("r1", {"text": "hi"}, recipients=["u1", "u2", "u3"])
+        self.sdk._reset()  # Drains the queueing stages
+
+    def assert_one_batch_request(self) -> None:
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertTrue(self.adapter.requests[0].url.endswith(PushEndpoints.BATCH))
+        self.assertEqual(self.adapter.requests[0].body.count(b'"user_id"'), 3)
+
+    def test_broadcast_through_every_stage_is_one_request(self):
+        self.sdk.enable_background_dispatch().enable_lanes().enable_coalescing().enable_typing_throttle().enable_dedup()
+
+        self.broadcast()
+
+        self.assert_one_batch_request()
+
+    def test_broadcast_through_delta_is_one_request(self):
+        self.sdk.enable_lanes().enable_delta().enable_coalescing().enable_typing_throttle().enable_dedup()
+
+        self.broadcast()
+
+        self.assert_one_batch_request()
+
+
+class OutboxPublisherTests(TransactionTestCase):
+
+    def test_broadcast_is_recorded_per_recipient_and_sent_as_one_request(self):
+        make_scope("chat", "message")
+        sdk = SyncCastSDK().enable_outbox(model=Outbox, flush_in_background=False)
+        self.addCleanup(sdk._reset)
+        adapter = StubAdapter(200)
+        for prefix in ("http://", "https://"):
+            sdk.dispatcher.session.mount(prefix, adapter)
+
+        sdk.chat.broadcast("r1", {"text": "hi"}, recipients=["u1", "u2"])
+
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(sorted(Outbox.objects.values_list("payload__user_id", flat=True)), ["u1", "u2"])
+        self.assertFalse(Outbox.objects.filter(status=Outbox.OutboxStatus.PENDING).exists())
+
+
+class AsyncSDKTests(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="synccast-spool-")
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.sdk = SyncCastSDK()
+        self.addCleanup(self.sdk._reset)
+
+    def test_async_dispatcher_gets_spool_compression_and_pool(self):
+        self.sdk.enable_spool(self.directory).enable_compression(threshold=1024).enable_connection_pool(
+            pool_maxsize=20, host_pools={"https://eu.example": 5}, timeout=3
+        )
+
+        dispatcher = self.sdk.aio.dispatcher
+
+        self.assertIs(dispatcher.spool, self.sdk.spool)
+        self.assertIsNotNone(dispatcher.compressor)
+        self.assertEqual((dispatcher.max_connections, dispatcher.timeout), (25, 3))
+        self.assertIs(dispatcher.metrics, self.sdk.metrics)
+
+    def test_reset_closes_stages_before_the_spool(self):
+        self.sdk.enable_spool(self.directory)
+        closed = []
+
+        class Stage:
+            def close(self):
+                closed.append("stage")
+
+        spool = self.sdk.spool
+        spool.close = lambda timeout=None: closed.append("spool")
+        self.sdk._stages.append(Stage())
+        self.sdk._reset()
+
+        self.assertEqual(closed, ["stage", "spool"])
@@ -0,0 +1,54 @@
+# Default package imports
+from unittest import mock, skipUnless
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast payload serializers
+from synccast.core import serializers
+from synccast.core.serializers import SyncCastSerializer, JSONSerializer, OrjsonSerializer, get_serializer
+
+
+PAYLOAD = {"topic": "app/chat/message/user/1", "data": {"text": "héllo", "count": 2, "tags": ["a", "b"]}}
+
+
+class SerializerTests(SimpleTestCase):
+
+    def test_base_class_is_abstract(self):
+        with self.assertRaises(TypeError):
+            SyncCastSerializer()
+
+    def test_json_is_compact_utf8(self):
+        body = JSONSerializer().dumps(PAYLOAD)
+
+        self.assertIsInstance(body, bytes)
+        self.assertNotIn(b", ", body)
+        self.assertIn("héllo".encode("utf-8"), body)
+        self.assertEqual(JSONSerializer().loads(body), PAYLOAD)
+
+    @skipUnless(serializers.orjson, "orjson is not installed")
+    def test_orjson_round_trips_and_matches_json(self):
+        body = OrjsonSerializer().dumps(PAYLOAD)
+
+        self.assertEqual(OrjsonSerializer().loads(body), PAYLOAD)
+        self.assertEqual(JSONSerializer().loads(body), PAYLOAD)
+
+    def test_orjson_requires_the_package(self):
+        with mock.patch.object(serializers, "orjson", None), self.assertRaises(ImportError):
+            OrjsonSerializer()
+
+
+class GetSerializerTests(SimpleTestCase):
+
+    def test_by_name(self):
+        self.assertIsInstance(get_serializer("json"), JSONSerializer)
+
+    def test_default_is_shared_and_prefers_orjson(self):
+        expected = OrjsonSerializer if serializers.orjson is not None else JSONSerializer
+
+        self.assertIsInstance(get_serializer(), expected)
+        self.assertIs(get_serializer(), get_serializer())
+
+    def test_default_falls_back_to_json(self):
+        with mock.patch.object(serializers, "orjson", None), mock.patch.object(serializers, "_default", None):
+            self.assertIsInstance(get_serializer(), JSONSerializer)
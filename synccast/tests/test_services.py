@@ -0,0 +1,21 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast services
+from synccast.api.message import MessageService
+from synccast.api.notification import NotificationService
+
+
+class SenderInfoTests(SimpleTestCase):
+
+    def build(self, service_class, user_id):
+        service = service_class(dispatcher=None, app_id="app")
+        return service.build_payload(user_id=user_id, data={}, topic="app/t", sender_name="Support")
+
+    def test_sender_name_alone_is_attached(self):
+        self.assertEqual(self.build(MessageService, None)["sender"], {"id": None, "name": "Support", "role": "system"})
+        self.assertEqual(self.build(MessageService, "42")["sender"]["id"], "42")
+
+    def test_notifications_need_a_sender_id(self):
+        self.assertFalse(self.build(NotificationService, None)["sender"])
+        self.assertEqual(self.build(NotificationService, "42")["sender"]["name"], "Support")
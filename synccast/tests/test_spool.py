@@ -0,0 +1,122 @@
+# Default package imports
+import os
+import json
+import time
+import shutil
+import tempfile
+from typing import List, Optional
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast service endpoints
+from synccast.core.endpoints import PushEndpoints
+
+# SyncCast spool
+from synccast.core.spool import SyncCastSpool, INDEX_FILE, OPEN_SUFFIX, SEALED_SUFFIX
+
+
+class ReplayDispatcher:
+    """
+    `post_encoded` double recording entries; fails once `fail_after` batches were sent.
+    """
+
+    def __init__(self, fail_after: Optional[int] = None):
+        self.batches: List[List[bytes]] = []
+        self.fail_after = fail_after
+
+    def post_encoded(self, entries: List[bytes]) -> dict:
+        if self.fail_after is not None and len(self.batches) >= self.fail_after:
+            raise ConnectionError("down")
+        self.batches.append(list(entries))
+        return {"ok": True}
+
+    def payloads(self) -> List[dict]:
+        return [json.loads(entry)["payload"] for batch in self.batches for entry in batch]
+
+
+class SpoolTests(SimpleTestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="synccast-spool-")
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def spool(self, **options) -> SyncCastSpool:
+        spool = SyncCastSpool(self.directory, **{"fsync": "never", **options})
+        self.addCleanup(spool.close)
+        return spool
+
+    def files(self, suffix: str) -> List[str]:
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(suffix))
+
+    def test_write_seal_and_replay(self):
+        spool = self.spool()
+        for n in range(5):
+            spool.spool("/api/chat/messages/", {"n": n})
+
+        self.assertEqual(spool.replay(ReplayDispatcher()), 0)  # Still open in this process
+        spool.seal()
+        dispatcher = ReplayDispatcher()
+
+        self.assertEqual(spool.replay(dispatcher, batch_size=2), 5)
+        self.assertEqual([payload["n"] for payload in dispatcher.payloads()], [0, 1, 2, 3, 4])
+        self.assertEqual([len(batch) for batch in dispatcher.batches], [2, 2, 1])
+        self.assertEqual(self.files(SEALED_SUFFIX), [])  # Compacted
+
+    def test_batch_payloads_are_spooled_per_event(self):
+        spool = self.spool()
+        spool.spool(PushEndpoints.BATCH, {"events": [
+            {"endpoint": "/api/a/", "payload": {"n": 1}},
+            {"endpoint": "/api/b/", "payload": {"n": 2}},
+        ]})
+        spool.seal()
+        dispatcher = ReplayDispatcher()
+
+        spool.replay(dispatcher)
+
+        self.assertEqual([json.loads(entry)["endpoint"] for entry in dispatcher.batches[0]], ["/api/a/", "/api/b/"])
+
+    def test_replay_resumes_from_the_index(self):
+        spool = self.spool()
+        for n in range(6):
+            spool.spool("/api/a/", {"n": n})
+        spool.seal()
+
+        self.assertEqual(spool.replay(ReplayDispatcher(fail_after=1), batch_size=2), 2)
+        with open(os.path.join(self.directory, INDEX_FILE)) as handle:
+            self.assertEqual(list(json.load(handle)), [self.files(SEALED_SUFFIX)[0][: -len(SEALED_SUFFIX)]])
+
+        dispatcher = ReplayDispatcher()
+        self.assertEqual(spool.replay(dispatcher, batch_size=2), 4)
+        self.assertEqual([payload["n"] for payload in dispatcher.payloads()], [2, 3, 4, 5])
+        self.assertEqual(self.files(SEALED_SUFFIX), [])
+
+    def test_full_segments_are_sealed(self):
+        spool = self.spool(segment_bytes=64)
+        for n in range(4):
+            spool.spool("/api/a/", {"n": n, "pad": "x" * 20})
+
+        self.assertEqual(len(self.files(SEALED_SUFFIX)), 3)
+        self.assertEqual(len(self.files(OPEN_SUFFIX)), 1)
+
+    def test_idle_segments_are_sealed_by_timer(self):
+        spool = self.spool(segment_seconds=0.05)
+        spool.spool("/api/a/", {"n": 1})
+        time.sleep(0.2)
+
+        self.assertEqual(self.files(OPEN_SUFFIX), [])
+        self.assertEqual(spool.replay(ReplayDispatcher()), 1)
+
+    def test_open_segment_position_survives_sealing(self):
+        writer = self.spool()
+        writer.spool("/api/a/", {"n": 1})
+        reader = self.spool()
+        dispatcher = ReplayDispatcher()
+
+        self.assertEqual(reader.replay(dispatcher, include_open=True), 1)
+        writer.spool("/api/a/", {"n": 2})
+        writer.seal()
+
+        self.assertEqual(reader.replay(dispatcher), 1)
+        self.assertEqual([payload["n"] for payload in dispatcher.payloads()], [1, 2])
+        self.assertEqual(self.files(SEALED_SUFFIX), [])
@@ -0,0 +1,78 @@
+# Default package imports
+import time
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast typing throttle
+from synccast.core.throttle import SyncCastTypingThrottle
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher
+
+
+def typing(data=None, user_id="1", topic="app/chat/typing/room/7"):
+    return {"type": "typing", "user_id": user_id, "topic": topic, "event_id": "e", "data": data or {"typing": True}}
+
+
+class TypingThrottleTests(SimpleTestCase):
+
+    def setUp(self):
+        self.dispatcher = RecordingDispatcher()
+
+    def make_throttle(self, **options):
+        throttle = SyncCastTypingThrottle(self.dispatcher, **{"stop_on_exit": False, **options})
+        self.addCleanup(throttle.close)
+        return throttle
+
+    def sent(self):
+        return [(payload["user_id"], payload["data"]) for _, payload in self.dispatcher.posts]
+
+    def test_repeats_are_suppressed_until_the_state_changes(self):
+        throttle = self.make_throttle()
+
+        throttle.post("/api/typing/", json=typing())
+        self.assertIsNone(throttle.post("/api/typing/", json=typing()))
+        throttle.post("/api/typing/", json=typing(user_id="2"))
+        throttle.post("/api/typing/", json=typing({"typing": False}))
+        self.assertIsNone(throttle.post("/api/typing/", json=typing({"typing": False})))
+
+        self.assertEqual(self.sent(), [("1", {"typing": True}), ("2", {"typing": True}), ("1", {"typing": False})])
+        self.assertEqual(throttle.active, 1)
+
+    def test_resend_after(self):
+        throttle = self.make_throttle(resend_after=0.01)
+
+        throttle.post("/api/typing/", json=typing())
+        time.sleep(0.02)
+        throttle.post("/api/typing/", json=typing())
+
+        self.assertEqual(len(self.dispatcher.posts), 2)
+
+    def test_idle_states_are_stopped_automatically(self):
+        throttle = self.make_throttle(idle_timeout=0.01)
+
+        throttle.post("/api/typing/", json=typing(), deadline_ms=5)
+        deadline = time.monotonic() + 1
+        while len(self.dispatcher.posts) < 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        self.assertEqual(self.sent(), [("1", {"typing": True}), ("1", {"typing": False})])
+        self.assertNotEqual(self.dispatcher.posts[1][1]["event_id"], "e")
+        self.assertEqual(throttle.active, 0)
+
+    def test_close_stops_active_states(self):
+        throttle = self.make_throttle()
+        throttle.post("/api/typing/", json=typing())
+
+        throttle.close()
+
+        self.assertEqual(self.sent()[-1], ("1", {"typing": False}))
+
+    def test_other_events_pass_through(self):
+        throttle = self.make_throttle()
+
+        for _ in range(2):
+            throttle.post("/api/chat/", json={"type": "message", "topic": "t", "data": {}})
+
+        self.assertEqual(len(self.dispatcher.posts), 2)
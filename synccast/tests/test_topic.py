@@ -0,0 +1,55 @@
+# Django imports
+from django.test import TestCase
+
+# SyncCast topic builder and templates
+from synccast.core.topic import SyncCastTopicBuilder, SyncCastTopicTemplate
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastTopicError
+
+# Test helpers
+from synccast.tests.utils import make_scope
+
+
+class TopicTemplateTests(TestCase):
+
+    def setUp(self):
+        self.scope = make_scope("chat", "message")
+        self.template = SyncCastTopicTemplate("app", "chat", "message", ["room", 7])
+
+    def test_renders_like_the_builder(self):
+        builder = SyncCastTopicBuilder("app", "chat").channel("message").extra("room", 7)
+
+        self.assertEqual(self.template.render(), builder.build())
+        self.assertEqual(self.template.render(42), builder.clone().for_user(42).build())
+
+    def test_render_many_keeps_order(self):
+        self.assertEqual(
+            self.template.render_many([3, "a", 1]),
+            ["app/chat/message/room/7/user/3", "app/chat/message/room/7/user/a", "app/chat/message/room/7/user/1"]
+        )
+
+    def test_wildcard_matches_every_user(self):
+        self.assertEqual(self.template.wildcard(), "app/chat/message/room/7/user/+")
+
+    def test_renders_without_queries(self):
+        with self.assertNumQueries(0):
+            self.template.render_many(range(100))
+
+    def test_frozen_fields(self):
+        self.assertEqual((self.template.scope, self.template.channel), ("chat", "message"))
+        self.assertEqual(self.template.extras, ("room", "7"))
+        self.assertEqual(str(self.template), "app/chat/message/room/7")
+
+    def test_validates_scope_and_channel_up_front(self):
+        with self.assertRaises(SyncCastTopicError):
+            SyncCastTopicTemplate("app", "chat", "missing")
+        with self.assertRaises(SyncCastTopicError):
+            SyncCastTopicTemplate("app", "missing", "message")
+
+    def test_builder_compiles_its_current_state(self):
+        builder = SyncCastTopicBuilder("app", self.scope).channel("message").extra("room", 7)
+        template = builder.compile()
+
+        builder.extra("ignored")
+        self.assertEqual(template.render(5), "app/chat/message/room/7/user/5")
@@ -0,0 +1,95 @@
+# Default package imports
+from concurrent.futures import Future
+
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast transports
+from synccast.core.transport import SyncCastMQTTTransport, SyncCastHTTPTransport, LoopbackMQTTClient, mqtt
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastDispatchError
+
+# Test doubles
+from synccast.tests.utils import RecordingDispatcher
+
+
+class MQTTTransportTests(SimpleTestCase):
+
+    def transport(self, **options) -> SyncCastMQTTTransport:
+        transport = SyncCastMQTTTransport(client=options.pop("client", None) or LoopbackMQTTClient(), **options)
+        self.addCleanup(transport.close)
+        return transport
+
+    def test_publishes_to_the_payload_topic(self):
+        transport = self.transport()
+
+        future = transport.post("/api/chat/messages/", json={"topic": "app/chat/message/1", "qos": 1, "data": {"n": 1}})
+
+        topic, body, qos = transport.client.published[0]
+        self.assertEqual((topic, qos), ("app/chat/message/1", 1))
+        self.assertEqual(transport.serializer.loads(body)["data"], {"n": 1})
+        self.assertEqual(future.result(timeout=1), 1)
+        self.assertTrue(transport.client.connected)
+
+    def test_payload_without_topic_is_rejected(self):
+        with self.assertRaises(SyncCastDispatchError):
+            self.transport().post("/api/chat/messages/", json={"data": {}})
+
+    def test_unacked_publishes_fill_the_window(self):
+        client = LoopbackMQTTClient(auto_ack=False)
+        transport = self.transport(client=client, max_inflight=2, window_timeout=0.05)
+        first = transport.post("/", json={"topic": "t", "qos": 1})
+        transport.post("/", json={"topic": "t", "qos": 1})
+
+        with self.assertRaises(SyncCastDispatchError):
+            transport.post("/", json={"topic": "t", "qos": 1})
+
+        client.ack(1)
+        self.assertTrue(first.done())
+        self.assertIsInstance(transport.post("/", json={"topic": "t", "qos": 1}), Future)
+
+    def test_unserializable_payload_keeps_the_window(self):
+        transport = self.transport(client=LoopbackMQTTClient(auto_ack=False), max_inflight=1, window_timeout=0.05)
+
+        with self.assertRaises(TypeError):
+            transport.post("/", json={"topic": "t", "qos": 1, "data": object()})
+        transport.post("/", json={"topic": "t", "qos": 1})
+
+    def test_close_fails_pending_publishes(self):
+        transport = self.transport(client=LoopbackMQTTClient(auto_ack=False))
+        future = transport.post("/", json={"topic": "t", "qos": 1})
+
+        transport.close()
+
+        self.assertIsInstance(future.exception(timeout=1), SyncCastDispatchError)
+        self.assertFalse(transport.client.connected)
+
+    def test_publish_is_not_called_under_the_lock(self):
+        test = self
+
+        class CheckingClient(LoopbackMQTTClient):
+            def publish(self, topic, payload, qos=0):
+                # paho takes its own mutex here and in the network thread's
+                # `on_publish`; holding the transport lock as well would deadlock
+                test.assertFalse(transport._lock._is_owned())
+                return super().publish(topic, payload, qos)
+
+        transport = self.transport(client=CheckingClient())
+        self.assertEqual(transport.post("/", json={"topic": "t", "qos": 2}).result(timeout=1), 1)
+
+    def test_requires_paho_without_an_injected_client(self):
+        if mqtt is not None:
+            self.skipTest("paho-mqtt is installed")
+        with self.assertRaises(SyncCastDispatchError):
+            SyncCastMQTTTransport()
+
+
+class HTTPTransportTests(SimpleTestCase):
+
+    def test_forwards_to_the_dispatcher(self):
+        dispatcher = RecordingDispatcher()
+
+        SyncCastHTTPTransport(dispatcher).post("/api/a/", json={"n": 1})
+
+        self.assertEqual(dispatcher.posts, [("/api/a/", {"n": 1})])
@@ -0,0 +1,91 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# SyncCast topic-filter trie
+from synccast.core.trie import SyncCastTopicTrie
+
+# SyncCast custom exceptions
+from synccast.exceptions.types import SyncCastTopicError
+
+
+class TopicTrieValidationTests(SimpleTestCase):
+
+    def test_splits_filter_into_levels(self):
+        self.assertEqual(SyncCastTopicTrie.validate("app/+/message/#"), ["app", "+", "message", "#"])
+
+    def test_rejects_malformed_filters(self):
+        for topic_filter in ("", "app/chat+", "app/#/message", "app/ch#"):
+            with self.subTest(topic_filter=topic_filter), self.assertRaises(SyncCastTopicError):
+                SyncCastTopicTrie.validate(topic_filter)
+
+
+class TopicTrieMatchingTests(SimpleTestCase):
+
+    def setUp(self):
+        self.trie = SyncCastTopicTrie([
+            "app/chat/message",
+            "app/+/message",
+            "app/chat/#",
+            ("#", "everything"),
+        ])
+
+    def test_returns_every_matching_filter(self):
+        self.assertCountEqual(
+            self.trie.match("app/chat/message"),
+            ["app/chat/message", "app/+/message", "app/chat/#", "everything"]
+        )
+
+    def test_single_level_wildcard_matches_exactly_one_level(self):
+        self.assertIn("app/+/message", self.trie.match("app/orders/message"))
+        self.assertNotIn("app/+/message", self.trie.match("app/orders/eu/message"))
+
+    def test_multi_level_wildcard_matches_parent_and_descendants(self):
+        self.assertIn("app/chat/#", self.trie.match("app/chat"))
+        self.assertIn("app/chat/#", self.trie.match("app/chat/a/b"))
+        self.assertNotIn("app/chat/#", self.trie.match("app/orders"))
+
+    def test_leading_wildcards_skip_system_topics(self):
+        self.assertEqual(self.trie.match("$SYS/broker/load"), [])
+        self.trie.insert("$SYS/#")
+        self.assertEqual(self.trie.match("$SYS/broker/load"), ["$SYS/#"])
+
+    def test_matches_reports_any_hit(self):
+        self.assertTrue(self.trie.matches("other/topic"))
+        self.trie.remove("#")
+        self.assertFalse(self.trie.matches("other/topic"))
+
+
+class TopicTrieMutationTests(SimpleTestCase):
+
+    def test_insert_replaces_value_without_growing(self):
+        trie = SyncCastTopicTrie()
+        trie.insert("app/+/message", "first")
+        trie.insert("app/+/message", "second")
+
+        self.assertEqual(len(trie), 1)
+        self.assertEqual(trie.match("app/chat/message"), ["second"])
+
+    def test_contains_checks_stored_filters_not_matches(self):
+        trie = SyncCastTopicTrie(["app/+/message"])
+
+        self.assertIn("app/+/message", trie)
+        self.assertNotIn("app/chat/message", trie)
+        self.assertNotIn("app/+", trie)
+
+    def test_remove_prunes_without_touching_siblings(self):
+        trie = SyncCastTopicTrie(["app/chat/message", "app/chat"])
+
+        self.assertTrue(trie.remove("app/chat/message"))
+        self.assertFalse(trie.remove("app/chat/message"))
+        self.assertFalse(trie.remove("app/unknown"))
+
+        self.assertEqual(len(trie), 1)
+        self.assertEqual(trie.match("app/chat"), ["app/chat"])
+        self.assertEqual(trie.match("app/chat/message"), [])
+
+    def test_clear_empties_the_index(self):
+        trie = SyncCastTopicTrie(["a/b", "a/+"])
+        trie.clear()
+
+        self.assertEqual(len(trie), 0)
+        self.assertFalse(trie.matches("a/b"))
@@ -0,0 +1,110 @@
+# Default package imports
+import asyncio
+import threading
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+# Third-party imports
+import requests
+
+# SyncCast payload serializers
+from synccast.core.serializers import get_serializer
+
+# SyncCast scope registry
+from synccast.core.registry import scope_registry
+
+
+def make_scope(name: str, *channels: str) -> Any:
+    """
+    Create a test scope with `channels` and reload the registry (so async
+    tests need no query on the event loop).
+    """
+    from synccast.tests.models import Scope, Channel
+
+    scope = Scope.objects.create(name=name)
+    for channel in channels:
+        Channel.objects.create(scope=scope, name=channel)
+    scope_registry.load()
+    return scope
+
+
+class RecordingDispatcher:
+    """
+    Dispatcher double recording every post; `fail` makes posts raise it.
+    """
+
+    def __init__(self, fail: Optional[Exception] = None):
+        self.serializer = get_serializer()
+        self.fail = fail
+        self.posts: List[Tuple[str, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        if json is None and isinstance(kwargs.get("data"), bytes):
+            json = self.serializer.loads(kwargs["data"])
+        with self._lock:
+            self.posts.append((endpoint, json))
+        if self.fail is not None:
+            raise self.fail
+        return {"ok": True}
+
+    def events(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Posted events, with batches expanded into their entries.
+        """
+        events = []
+        for endpoint, payload in self.posts:
+            if isinstance(payload, dict) and "events" in payload:
+                events.extend((event["endpoint"], event["payload"]) for event in payload["events"])
+            else:
+                events.append((endpoint, payload))
+        return events
+
+
+class AsyncRecordingDispatcher(RecordingDispatcher):
+    """
+    Awaitable `RecordingDispatcher`; posts for a user in `fail_users` raise.
+    """
+
+    def __init__(self, fail: Optional[Exception] = None, fail_users: Iterable[str] = ()):
+        super().__init__(fail)
+        self.fail_users = set(fail_users)
+        self.active = 0
+        self.max_active = 0
+
+    async def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0)
+            if (json or {}).get("user_id") in self.fail_users:
+                raise RuntimeError("rejected")
+            return RecordingDispatcher.post(self, endpoint, json=json, **kwargs)
+        finally:
+            self.active -= 1
+
+
+class StubAdapter(requests.adapters.BaseAdapter):
+    """
+    `requests` adapter answering every request with the next of `statuses`
+    (the last one repeats); an exception in `statuses` is raised instead.
+    """
+
+    def __init__(self, *statuses: Any):
+        super().__init__()
+        self.statuses = list(statuses) or [200]
+        self.requests: List[requests.PreparedRequest] = []
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        self.requests.append(request)
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        if isinstance(status, BaseException):
+            raise status
+        response = requests.Response()
+        response.status_code = status
+        response._content = b'{"ok": true}'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass